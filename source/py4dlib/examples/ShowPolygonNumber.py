@@ -27,9 +27,9 @@ Description-US:Create and attach text splines indicating the polygon number to e
 
 import os
 
-__version__ = (0, 2)
+__version__ = (0, 3)
 __date__ = '2013-07-29'
-__updated__ = '2013-08-08'
+__updated__ = '2026-10-19'
 
 
 DEBUG = 0 or ('DebugLevel' in os.environ and os.environ['DebugLevel'] > 0)
@@ -52,7 +52,7 @@ if DEBUG:
 from py4dlib.maths import BuildMatrix3, IsZeroVector, BBox
 from py4dlib.mesh import CalcPolyNormal, CalcPolyCentroid, CalcPolyArea, PolyToListList
 from py4dlib.mesh import GetSelectedPoints, GetSelectedPolys
-from py4dlib.objects import CreateObject, InsertUnderNull
+from py4dlib.objects import BatchCreate, CreateObject, InsertUnderNull
 from py4dlib.utils import ClearConsole, PPLLString
 
 
@@ -61,157 +61,152 @@ GROUP_UNDER = True
 TEXT_SIZE = 1
 
 def main(doc):  # IGNORE:W0621
-    doc.StartUndo()
-    
     sel = doc.GetSelection()
     if sel is None: return False
-        
-    c4d.StopAllThreads()
     
-    # loop through all objects
-    for op in sel:
-        if not isinstance(op, c4d.PolygonObject):
-            if DEBUG:
-                print("%s: not a polygon object. Skipping..." % str(op.GetName()))
-            continue
-        print("object name: %s" % op.GetName())
+    # stops threads and collects undo steps once and inserts the 
+    # new objects with a single EventAdd when the block ends
+    with BatchCreate(doc):
+        # loop through all objects
+        for op in sel:
+            if not isinstance(op, c4d.PolygonObject):
+                if DEBUG:
+                    print("%s: not a polygon object. Skipping..." % str(op.GetName()))
+                continue
+            print("object name: %s" % op.GetName())
         
-        pointsel = op.GetPointS()
-        pointselcnt = pointsel.GetCount()
-        pointcnt = op.GetPointCount()
-        allpoints = op.GetAllPoints()
+            pointsel = op.GetPointS()
+            pointselcnt = pointsel.GetCount()
+            pointcnt = op.GetPointCount()
+            allpoints = op.GetAllPoints()
 
-        print("number of selected points = %s (%s total)" % (pointselcnt, pointcnt))
+            print("number of selected points = %s (%s total)" % (pointselcnt, pointcnt))
 
-        polysel = op.GetPolygonS()
-        polyselcnt = polysel.GetCount()
-        polycnt = op.GetPolygonCount()
-        allpolys = op.GetAllPolygons()
+            polysel = op.GetPolygonS()
+            polyselcnt = polysel.GetCount()
+            polycnt = op.GetPolygonCount()
+            allpolys = op.GetAllPolygons()
 
         
-        print("number of selected polygons = %s (%s total)" % (polyselcnt, polycnt))
+            print("number of selected polygons = %s (%s total)" % (polyselcnt, polycnt))
 
-        pnts = GetSelectedPoints(op)
-        plys = GetSelectedPolys(op)
+            pnts = GetSelectedPoints(op)
+            plys = GetSelectedPolys(op)
 
-        if len(plys) == 0:
-            # nothing selected? use all polys
-            plys = list(xrange(0, polycnt))
+            if len(plys) == 0:
+                # nothing selected? use all polys
+                plys = list(xrange(0, polycnt))
 
-        print("selected points = %s" % pnts)
-        print("selected polys  = %s" % plys)
+            print("selected points = %s" % pnts)
+            print("selected polys  = %s" % plys)
 
-        for pnt in pnts:
-            print("%d: %s" % (pnt, allpoints[pnt]))
+            for pnt in pnts:
+                print("%d: %s" % (pnt, allpoints[pnt]))
 
-        pmarks = []
+            pmarks = []
 
-        op_mg = op.GetMg()
-        op_name = op.GetName()
+            op_mg = op.GetMg()
+            op_name = op.GetName()
 
-        pgrp_name = "%s - Polygon #s" % op_name
-        pgrp = doc.SearchObject(pgrp_name)
-        if pgrp:
-            pgrp.Remove()
+            pgrp_name = "%s - Polygon #s" % op_name
+            pgrp = doc.SearchObject(pgrp_name)
+            if pgrp:
+                pgrp.Remove()
 
-        for ply in plys:
-            poly = allpolys[ply]
+            for ply in plys:
+                poly = allpolys[ply]
             
-            a = allpoints[poly.a]
-            b = allpoints[poly.b]
-            c = allpoints[poly.c]
-            d = allpoints[poly.d]
+                a = allpoints[poly.a]
+                b = allpoints[poly.b]
+                c = allpoints[poly.c]
+                d = allpoints[poly.d]
 
-            pids = [a, b, c]
+                pids = [a, b, c]
 
-            plen = 3
-            if c != d: 
-                pids.append(d)
-                plen = 4
+                plen = 3
+                if c != d: 
+                    pids.append(d)
+                    plen = 4
     
-            cv1 = a - b
-            cv2 = b - c
-            cv3 = c - d
-            cv4 = d - a
-            if plen == 4:
-                cva = (cv3 - cv1)
-                cvb = (cv4 - cv2)
-            else:
-                cva = cv3 - cv1
-                cvb = cv3 - cv2
-
-            if plen == 4:
-                cv = c4d.Vector(cva.x, cvb.y/2, cva.z)
-            else:
-                if cvb.y == 0:
-                    cv = cvb
+                cv1 = a - b
+                cv2 = b - c
+                cv3 = c - d
+                cv4 = d - a
+                if plen == 4:
+                    cva = (cv3 - cv1)
+                    cvb = (cv4 - cv2)
                 else:
-                    cv = cva
-    
-            if IsZeroVector(cv):
-                if cv == cva:
-                    cv = cvb
+                    cva = cv3 - cv1
+                    cvb = cv3 - cv2
+
+                if plen == 4:
+                    cv = c4d.Vector(cva.x, cvb.y/2, cva.z)
                 else:
-                    cv = cva
+                    if cvb.y == 0:
+                        cv = cvb
+                    else:
+                        cv = cva
+    
+                if IsZeroVector(cv):
+                    if cv == cva:
+                        cv = cvb
+                    else:
+                        cv = cva
 
-            AXIS_ZY = 1
+                AXIS_ZY = 1
 
-            base = "x"
-            axis = AXIS_ZY 
+                base = "x"
+                axis = AXIS_ZY 
 
-            if DEBUG: 
-                print("pids = %r" % pids)
-                print("%d: %s, points as list<list>:" % (ply, poly))
-                print("%s" % (PPLLString(PolyToListList(poly, op))))
+                if DEBUG: 
+                    print("pids = %r" % pids)
+                    print("%d: %s, points as list<list>:" % (ply, poly))
+                    print("%s" % (PPLLString(PolyToListList(poly, op))))
             
-            # calculate polygon normals
-            pnormal = CalcPolyNormal(poly, op)
-            if DEBUG: print("normal: %s" % (pnormal))
-
-            # calculate polygon area and bounding box 
-            parea = CalcPolyArea(poly, op)
-            pbb = BBox.FromPolygon(poly, op)
-            pbb_slen = pbb.size.GetLength()
-            parea = (parea / pbb_slen / 2.0) * TEXT_SIZE
+                # calculate polygon normals
+                pnormal = CalcPolyNormal(pids, op)
+                if DEBUG: print("normal: %s" % (pnormal))
+
+                # calculate polygon area and bounding box 
+                parea = CalcPolyArea(pids, op)
+                pbb = BBox.FromPointList(pids)
+                pbb_slen = pbb.size.GetLength()
+                parea = (parea / pbb_slen / 2.0) * TEXT_SIZE
             
-            if DEBUG:
-                print("pbb_slen: %s" % pbb_slen)
-                print("area: %s" % (parea))
+                if DEBUG:
+                    print("pbb_slen: %s" % pbb_slen)
+                    print("area: %s" % (parea))
             
-            # create text spline objects
-            pname = "%d" % ply
+                # create text spline objects
+                pname = "%d" % ply
 
-            pmark = CreateObject(c4d.Osplinetext, pname)
-            pmark[c4d.PRIM_TEXT_TEXT] = pname    # Text
-            pmark[c4d.PRIM_TEXT_HEIGHT] = parea  # Font Height
-            pmark[c4d.PRIM_PLANE] = axis         # Orientation
+                pmark = CreateObject(c4d.Osplinetext, pname)
+                pmark[c4d.PRIM_TEXT_TEXT] = pname    # Text
+                pmark[c4d.PRIM_TEXT_HEIGHT] = parea  # Font Height
+                pmark[c4d.PRIM_PLANE] = axis         # Orientation
             
-            if GROUP_UNDER:
-                ppos = CalcPolyCentroid(poly, op)
-            else:
-                # put in scene globally and don't group under op
-                ppos = CalcPolyCentroid(poly, op) * op_mg
+                if GROUP_UNDER:
+                    ppos = CalcPolyCentroid(pids, op)
+                else:
+                    # put in scene globally and don't group under op
+                    ppos = CalcPolyCentroid(pids, op) * op_mg
             
-            # match position and orientation
-            pmg = BuildMatrix3(pnormal, cv, off=ppos, base=base)
-            pmg.v2 = -pmg.v2
+                # match position and orientation
+                pmg = BuildMatrix3(pnormal, cv, off=ppos, base=base)
+                pmg.v2 = -pmg.v2
 
-            # create translation matrix to center the text letters
-            tm = c4d.utils.MatrixMove(c4d.Vector(0, -parea/3, 0))
-            pmg *= tm
+                # create translation matrix to center the text letters
+                tm = c4d.utils.MatrixMove(c4d.Vector(0, -parea/3, 0))
+                pmg *= tm
 
-            pmark.SetMg(pmg)
-            pmarks.append(pmark)
+                pmark.SetMg(pmg)
+                pmarks.append(pmark)
         
-        # group spline text objects under null for each op
-        pgrp = InsertUnderNull(pmarks, name=pgrp_name)
+            # group spline text objects under null for each op
+            pgrp = InsertUnderNull(pmarks, name=pgrp_name)
 
-        if GROUP_UNDER:
-            pgrp.InsertUnder(op)
-
-    # tell C4D to update internal state  
-    c4d.EventAdd() 
-    doc.EndUndo()
+            if GROUP_UNDER:
+                pgrp.InsertUnder(op)
 
         
 if __name__ == '__main__':
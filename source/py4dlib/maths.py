@@ -15,10 +15,11 @@
 import os
 import sys
 import math
+import itertools
 
 __version__ = (0, 6)
 __date__ = '2013-07-29'
-__updated__ = '2013-08-08'
+__updated__ = '2026-10-19'
 
 
 DEBUG = 0 or ('DebugLevel' in os.environ and os.environ['DebugLevel'] > 0)
@@ -32,6 +33,13 @@ except ImportError:
     if TESTRUN == 1:
         pass
 
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional. Only the array based functions 
+    # need it and will raise ImportError when it's missing.
+    np = None
+
 
 twopi = 2 * math.pi
 eps = 0.0000001
@@ -294,7 +302,7 @@ class Plane(object):
         elif not isinstance(d, c4d.Vector):
             raise TypeError("E: expected c4d.Vector, got %s" % type(d))
         else:
-            d.Normalize()
+            d = d.GetNormalized()
         pos = self.pos
         ddn = d.Dot(n)
         if abs(ddn) < eps:
@@ -303,6 +311,916 @@ class Plane(object):
         p_isect = p + mu * d
         return p_isect
 
+    def LineIntersections(self, p, d=None):
+        """
+        Array version of :py:func:`LineIntersection`. Intersects
+        N lines (rays) with the plane in one call.
+        
+        The inputs are not modified.
+        
+        :param p: start positions as ``list<c4d.Vector>`` or 
+            ``numpy.ndarray`` of shape ``(N, 3)``.
+        :param d: directions of shape ``(N, 3)`` or a single 
+            direction for all lines. If None, the normal of the 
+            plane will be used instead.
+        
+        :return: see :py:func:`RayPlaneIntersections`.
+        """
+        return RayPlaneIntersections(p, d, self.pos, self.n)
+
+    def PointDistances(self, points):
+        """
+        Calculate the signed distances from many points to the plane.
+        
+        Array version of :py:func:`PointDistance`. 
+        
+        :param points: ``list<c4d.Vector>`` or ``numpy.ndarray`` of shape ``(N, 3)``.
+        :return: ``numpy.ndarray`` of shape ``(N,)``.
+        """
+        pnts = VectorsToArray(points)
+        pos = _AsArray3(self.pos)
+        n = _AsArray3(self.n)
+        return (pnts - pos).dot(n)
+
+    def PointResidences(self, points, tolerance=eps):
+        """
+        Array version of :py:func:`PointResidence`.
+        
+        :param float tolerance: points with an absolute distance 
+            below this value are considered to lie on the plane.
+        :return: ``numpy.ndarray`` of ``int8`` with +1 (front), 
+            0 (on plane) or -1 (back) for each point.
+        """
+        d = self.PointDistances(points)
+        res = np.zeros(d.shape, dtype=np.int8)
+        res[d > tolerance] = 1
+        res[d < -tolerance] = -1
+        return res
+
+
+def _RequireNumpy():
+    if np is None:
+        raise ImportError("E: this function requires numpy, which could not be imported")
+
+
+def _AsArray3(v):
+    """ Convert a single ``c4d.Vector`` or a sequence of 3 floats to a ``numpy.ndarray``. """
+    _RequireNumpy()
+    if hasattr(v, 'x'):
+        return np.array((v.x, v.y, v.z), dtype=np.float64)
+    return np.asarray(v, dtype=np.float64).reshape(3)
+
+
+def _AsArrayN3(v):
+    """ Convert one vector or many vectors to a ``numpy.ndarray`` of shape ``(N, 3)``.
+    
+        Returns a ``tuple`` of the array and a ``bool`` which is True if 
+        ``v`` was a single ``c4d.Vector`` or a sequence of 3 floats.
+    """
+    _RequireNumpy()
+    if hasattr(v, 'x'):
+        return (_AsArray3(v)[np.newaxis, :], True)
+    if isinstance(v, (list, tuple)) and len(v) > 0 and hasattr(v[0], 'x'):
+        return (VectorsToArray(v), False)
+    return (VectorsToArray(v), np.ndim(v) == 1)
+
+
+def VectorsToArray(lv):
+    """ Convert a list of ``c4d.Vector`` to a ``numpy.ndarray`` of shape ``(N, 3)``.
+        
+        If ``lv`` already is a ``numpy.ndarray`` (or a ``list<list>``) it is 
+        returned as a ``float64`` array without copying where possible.
+    """
+    _RequireNumpy()
+    if isinstance(lv, np.ndarray):
+        return np.asarray(lv, dtype=np.float64).reshape(-1, 3)
+    if not isinstance(lv, (list, tuple)):
+        raise TypeError("E: expected list of c4d.Vectors or numpy.ndarray, got %s" % type(lv))
+    if len(lv) == 0:
+        return np.zeros((0, 3), dtype=np.float64)
+    if hasattr(lv[0], 'x'):
+        return np.array([(v.x, v.y, v.z) for v in lv], dtype=np.float64)
+    return np.asarray(lv, dtype=np.float64).reshape(-1, 3)
+
+
+def ArrayToVectors(arr):
+    """ Convert a ``numpy.ndarray`` of shape ``(N, 3)`` to a list of ``c4d.Vector``. 
+        
+        The result can be passed straight to ``c4d.PointObject.SetAllPoints``.
+    """
+    _RequireNumpy()
+    arr = np.asarray(arr, dtype=np.float64).reshape(-1, 3)
+    Vector = c4d.Vector
+    return [Vector(x, y, z) for x, y, z in arr.tolist()]
+
+
+def MatrixToArray(m):
+    """ Convert a ``c4d.Matrix`` to a ``numpy.ndarray`` of shape ``(4, 3)``.
+    
+        The rows are laid out like :py:func:`MatrixToListList` with 
+        ``inclOff=True``, i.e. ``off``, ``v1``, ``v2``, ``v3``. Arrays
+        of that shape are passed through.
+    """
+    _RequireNumpy()
+    if isinstance(m, np.ndarray):
+        if m.shape != (4, 3):
+            raise ValueError("E: expected array of shape (4, 3), got %r" % (m.shape,))
+        return np.asarray(m, dtype=np.float64)
+    if not hasattr(m, 'off'):
+        raise TypeError("E: expected c4d.Matrix, got %r" % type(m))
+    return np.array([(m.off.x, m.off.y, m.off.z),
+                     (m.v1.x, m.v1.y, m.v1.z),
+                     (m.v2.x, m.v2.y, m.v2.z),
+                     (m.v3.x, m.v3.y, m.v3.z)], dtype=np.float64)
+
+
+def TransformPoints(points, matrix, direction=False):
+    """ Multiply all points by a matrix in one go. 
+    
+        Equivalent to ``[p * matrix for p in points]``, but the matrix is 
+        converted once and applied to the whole array.
+        
+        :param points: ``list<c4d.Vector>`` or array of shape ``(N, 3)``.
+        :param matrix: ``c4d.Matrix`` or array of shape ``(4, 3)`` as 
+            returned by :py:func:`MatrixToArray`.
+        :param bool direction: if True, ignore the matrix offset, like 
+            ``p ^ matrix`` does. Use this for normals and directions.
+        :return: ``numpy.ndarray`` of shape ``(N, 3)``. Use 
+            :py:func:`ArrayToVectors` to write it back with a single 
+            ``SetAllPoints`` call.
+    """
+    pnts = VectorsToArray(points)
+    m = MatrixToArray(matrix)
+    result = pnts.dot(m[1:])
+    if direction is False:
+        result += m[0]
+    return result
+
+
+def RayPlaneIntersections(p, d, pos, n):
+    """ Intersect N rays with one plane or with K planes.
+    
+        :param p: ray start positions of shape ``(N, 3)``.
+        :param d: ray directions of shape ``(N, 3)`` or ``(3,)``. 
+            Need not be normalized. If None, the plane normals are 
+            used, which projects the points onto the planes.
+        :param pos: plane positions of shape ``(3,)`` or ``(K, 3)``.
+        :param n: plane normals of shape ``(3,)`` or ``(K, 3)``.
+        
+        :return: ``tuple`` of ``(hits, t, valid)``. ``hits`` holds the 
+            intersection points, ``t`` the signed distance along the 
+            normalized direction and ``valid`` is a boolean mask which 
+            is False where a ray runs parallel to a plane. Invalid entries 
+            of ``hits`` and ``t`` are NaN. For a single plane the shapes are 
+            ``(N, 3)``, ``(N,)`` and ``(N,)``, for K planes ``(N, K, 3)``, 
+            ``(N, K)`` and ``(N, K)``.
+    """
+    _RequireNumpy()
+    pnts = VectorsToArray(p)
+    ppos, single = _AsArrayN3(pos)
+    pn = _AsArrayN3(n)[0]
+    if len(ppos) != len(pn):
+        raise ValueError("E: got %d plane positions but %d normals" % (len(ppos), len(pn)))
+    pn = pn / np.sqrt((pn * pn).sum(axis=1))[:, np.newaxis]
+    if d is None:
+        dirs = np.broadcast_to(pn[np.newaxis, :, :], (len(pnts), len(pn), 3))
+    else:
+        dirs = _AsArrayN3(d)[0]
+        dlen = np.sqrt((dirs * dirs).sum(axis=1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dirs = dirs / dlen[:, np.newaxis]
+        dirs = np.broadcast_to(dirs[:, np.newaxis, :], (len(pnts), len(pn), 3))
+    # (N, K) dot products
+    ddn = (dirs * pn[np.newaxis, :, :]).sum(axis=2)
+    num = ((ppos[np.newaxis, :, :] - pnts[:, np.newaxis, :]) * pn[np.newaxis, :, :]).sum(axis=2)
+    valid = np.abs(ddn) >= eps
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(valid, num / np.where(valid, ddn, 1.0), np.nan)
+    hits = pnts[:, np.newaxis, :] + t[:, :, np.newaxis] * dirs
+    if single:
+        return (hits[:, 0, :], t[:, 0], valid[:, 0])
+    return (hits, t, valid)
+
+
+def _ConvexHull2D(pts):
+    """ Convex hull of ``(N, 2)`` points in counter-clockwise order.
+    
+        Discards points inside the octagon of extreme points first 
+        (Akl-Toussaint heuristic) and runs Andrew's monotone chain 
+        on the rest.
+    """
+    if len(pts) > 64:
+        dirs = np.array([[1, 0], [1, 1], [0, 1], [-1, 1], 
+                         [-1, 0], [-1, -1], [0, -1], [1, -1]], dtype=np.float64)
+        ext = pts[np.argmax(pts.dot(dirs.T), axis=0)]
+        # remove consecutive duplicates, the octagon may collapse
+        keep = np.ones(len(ext), dtype=bool)
+        keep[1:] = (ext[1:] != ext[:-1]).any(axis=1)
+        if (ext[-1] == ext[0]).all():
+            keep[-1] = False
+        ext = ext[keep]
+        if len(ext) >= 3:
+            inside = np.ones(len(pts), dtype=bool)
+            for i in xrange(len(ext)):
+                a = ext[i - 1]
+                b = ext[i]
+                cross = (b[0] - a[0]) * (pts[:, 1] - a[1]) - (b[1] - a[1]) * (pts[:, 0] - a[0])
+                inside &= cross > 0
+            pts = pts[~inside]
+    order = np.lexsort((pts[:, 1], pts[:, 0]))
+    pts = pts[order].tolist()
+    if len(pts) < 3:
+        return np.array(pts, dtype=np.float64).reshape(-1, 2)
+    def half(seq):
+        chain = []
+        for p in seq:
+            while len(chain) >= 2:
+                o = chain[-2]
+                a = chain[-1]
+                if (a[0] - o[0]) * (p[1] - o[1]) - (a[1] - o[1]) * (p[0] - o[0]) <= 0:
+                    chain.pop()
+                else:
+                    break
+            chain.append(p)
+        return chain
+    lower = half(pts)
+    upper = half(reversed(pts))
+    return np.array(lower[:-1] + upper[:-1], dtype=np.float64)
+
+
+def _MinAreaRect(hull, chunksize=1024):
+    """ Rotating calipers over a 2D convex hull. 
+    
+        :return: ``tuple`` of ``(area, u)`` where ``u`` is the 
+            unit direction of one side of the minimum area rectangle.
+    """
+    edges = np.roll(hull, -1, axis=0) - hull
+    lens = np.sqrt((edges * edges).sum(axis=1))
+    edges = edges[lens > eps] / lens[lens > eps][:, np.newaxis]
+    best = (np.inf, np.array([1.0, 0.0]))
+    for start in xrange(0, len(edges), chunksize):
+        u = edges[start:start + chunksize]
+        w = np.column_stack((-u[:, 1], u[:, 0]))
+        pu = hull.dot(u.T)
+        pw = hull.dot(w.T)
+        area = (pu.max(axis=0) - pu.min(axis=0)) * (pw.max(axis=0) - pw.min(axis=0))
+        i = int(np.argmin(area))
+        if area[i] < best[0]:
+            best = (area[i], u[i])
+    return best
+
+
+def _FitBox(pnts, axes):
+    """ Fit a box with the given axes (rows) around the points. """
+    proj = pnts.dot(axes.T)
+    pmin = proj.min(axis=0)
+    pmax = proj.max(axis=0)
+    center = ((pmin + pmax) * 0.5).dot(axes)
+    return (center, (pmax - pmin) * 0.5)
+
+
+def OrientedBBoxFromPoints(points, refine=True):
+    """ Calculate an oriented bounding box for a point array.
+    
+        The axes are estimated from the principal components (PCA)
+        of the points. If ``refine`` is True, the box is improved by 
+        running rotating calipers on the 2D convex hull of the points 
+        projected along each principal axis, keeping the smallest box.
+        
+        Compared to :py:class:`BBox` the result stays tight for 
+        rotated parts.
+    
+        :param points: ``list<c4d.Vector>`` or array of shape ``(N, 3)``.
+        :param bool refine: run the rotating calipers refinement.
+        
+        :return: ``tuple`` of ``(frame, extents)`` where ``frame`` is a 
+            ``(4, 3)`` array laid out like :py:func:`MatrixToListList` 
+            with ``inclOff=True`` (center followed by the unit axes v1, 
+            v2 and v3) and ``extents`` holds the half sizes along v1, v2 
+            and v3, like :py:func:`BBox.GetRad`.
+            
+        :raise ValueError: if there are no points.
+    """
+    _RequireNumpy()
+    pnts = VectorsToArray(points)
+    if len(pnts) == 0:
+        raise ValueError("E: list of points is empty")
+    mean = pnts.mean(axis=0)
+    centered = pnts - mean
+    if len(pnts) > 1:
+        evals, evecs = np.linalg.eigh(centered.T.dot(centered))
+        axes = evecs.T[::-1].copy()
+    else:
+        axes = np.eye(3)
+    if np.linalg.det(axes) < 0:
+        axes[2] = -axes[2]
+    center, ext = _FitBox(centered, axes)
+    best = (ext.prod(), axes, center, ext)
+    if refine and len(pnts) > 3:
+        for k in xrange(3):
+            up = axes[k]
+            plane = axes[[i for i in xrange(3) if i != k]]
+            hull = _ConvexHull2D(centered.dot(plane.T))
+            if len(hull) < 3:
+                continue
+            area, u = _MinAreaRect(hull)
+            a1 = u.dot(plane)
+            a2 = np.cross(up, a1)
+            cand = np.array([a1, a2, up])
+            if np.linalg.det(cand) < 0:
+                cand[2] = -cand[2]
+            ccenter, cext = _FitBox(centered, cand)
+            if cext.prod() < best[0] * (1.0 - 1e-9):
+                best = (cext.prod(), cand, ccenter, cext)
+    vol, axes, center, ext = best
+    # sort axes by descending extent for a predictable frame
+    order = np.argsort(-ext, kind='mergesort')
+    axes = axes[order]
+    ext = ext[order]
+    if np.linalg.det(axes) < 0:
+        axes[2] = -axes[2]
+    frame = np.vstack(((center + mean)[np.newaxis, :], axes))
+    return (frame, ext)
+
+
+def _CircumBall(pts):
+    """ Smallest ball with all 1 to 4 points on its boundary, or None if degenerate. """
+    a = pts[0]
+    n = len(pts)
+    if n == 1:
+        return (a, 0.0)
+    if n == 2:
+        c = (a + pts[1]) * 0.5
+        return (c, float(np.sqrt(((pts[1] - c) ** 2).sum())))
+    if n == 3:
+        u = pts[1] - a
+        v = pts[2] - a
+        w = np.cross(u, v)
+        ww = w.dot(w)
+        if ww < eps * eps:
+            return None
+        c = a + np.cross(u.dot(u) * v - v.dot(v) * u, w) / (2.0 * ww)
+        return (c, float(np.sqrt(((a - c) ** 2).sum())))
+    m = pts[1:] - a
+    if abs(np.linalg.det(m)) < eps * eps:
+        return None
+    rel = np.linalg.solve(2.0 * m, (m * m).sum(axis=1))
+    return (a + rel, float(np.sqrt(rel.dot(rel))))
+
+
+def _MinBallOfSmallSet(pts):
+    """ Exact minimal ball of at most 5 points by trying all supports. """
+    best = None
+    n = len(pts)
+    for k in xrange(1, min(n, 4) + 1):
+        for support in itertools.combinations(xrange(n), k):
+            ball = _CircumBall(pts[list(support)])
+            if ball is None:
+                continue
+            c, r = ball
+            if best is not None and r >= best[1]:
+                continue
+            tol = r * 1e-9 + eps
+            if (np.sqrt(((pts - c) ** 2).sum(axis=1)) <= r + tol).all():
+                best = (c, r, list(support))
+    if best is None:
+        # numerically degenerate, fall back to a ball around the mean
+        c = pts.mean(axis=0)
+        r = float(np.sqrt(((pts - c) ** 2).sum(axis=1)).max())
+        best = (c, r, list(xrange(n)))
+    return best
+
+
+def BoundingSphereFromPoints(points, method="ritter"):
+    """ Calculate a bounding sphere for a point array.
+    
+        :param str method: ``ritter`` for Ritter's fast approximation, 
+            which is usually within a few percent of the optimum, or 
+            ``welzl`` for the exact minimal bounding sphere. The exact
+            sphere is found by Welzl style pivoting: the farthest 
+            outside point is repeatedly added to a support set of at 
+            most 4 points.
+            
+        Unlike :py:func:`BBox.GetRad` the result does not overestimate 
+        the bounds, which makes it well suited for culling.
+        
+        :return: ``tuple`` of ``(center, radius)`` with the center as 
+            array of shape ``(3,)``.
+        :raise ValueError: if there are no points or the method is unknown.
+    """
+    _RequireNumpy()
+    pnts = VectorsToArray(points)
+    if len(pnts) == 0:
+        raise ValueError("E: list of points is empty")
+    if method not in ("ritter", "welzl"):
+        raise ValueError("E: method must be one of ritter, welzl, but is %r" % (method,))
+    # initial guess from an approximately most distant pair of points
+    x = pnts[0]
+    y = pnts[np.argmax(((pnts - x) ** 2).sum(axis=1))]
+    z = pnts[np.argmax(((pnts - y) ** 2).sum(axis=1))]
+    if method == "ritter":
+        c = (y + z) * 0.5
+        r = float(np.sqrt(((z - c) ** 2).sum()))
+        while True:
+            d = np.sqrt(((pnts - c) ** 2).sum(axis=1))
+            i = int(np.argmax(d))
+            if d[i] <= r * (1.0 + 1e-12) + eps:
+                break
+            # grow the sphere just enough to include the farthest point
+            nr = (r + d[i]) * 0.5
+            c = c + (pnts[i] - c) * ((d[i] - nr) / d[i])
+            r = nr
+        return (c, r)
+    support = np.array([y, z])
+    c, r, idx = _MinBallOfSmallSet(support)
+    # the radius grows with every pivot, so no support set comes up twice
+    # and the loop ends, unless rounding stops the growth
+    while True:
+        d = np.sqrt(((pnts - c) ** 2).sum(axis=1))
+        i = int(np.argmax(d))
+        if d[i] <= r * (1.0 + 1e-12) + eps:
+            break
+        cand = np.vstack((support, pnts[i][np.newaxis, :]))
+        nc, nr, idx = _MinBallOfSmallSet(cand)
+        if nr <= r:
+            # stuck within rounding error of the optimum: 
+            # keep the center and enclose the farthest point
+            r = float(d[i])
+            break
+        c, r = nc, nr
+        support = cand[idx]
+    return (c, r)
+
+
+def ConvexHull(points):
+    """ Calculate the 3D convex hull of a point array using Quickhull.
+    
+        Each point is assigned to the outside set of at most one face 
+        at a time, so points inside the hull are dropped early and the 
+        distance tests run as array operations. Only the hull faces 
+        themselves are handled one by one, so the run time depends 
+        mostly on the size of the hull: a million scanned points with 
+        a few thousand hull faces take about a second, while 100000 
+        points that all lie on a sphere take close to 20 seconds.
+        
+        :param points: ``list<c4d.Vector>`` or array of shape ``(N, 3)``.
+        
+        :return: ``tuple`` of ``(vertices, tris)`` where ``vertices`` holds 
+            the hull points with shape ``(H, 3)`` and ``tris`` the triangle 
+            corner indices into ``vertices`` with shape ``(F, 3)``. The 
+            triangles are wound so that their Newell normal (as calculated 
+            by :py:func:`py4dlib.mesh.CalcPolyNormal`) points outwards.
+        
+        :raise ValueError: if there are fewer than 4 points or all points 
+            are coplanar.
+    """
+    _RequireNumpy()
+    pnts = VectorsToArray(points)
+    if len(pnts) < 4:
+        raise ValueError("E: need at least 4 points, got %d" % len(pnts))
+    scale = float(np.abs(pnts).max()) or 1.0
+    tol = scale * 1e-10
+    # initial simplex from extreme points
+    ext = np.concatenate((pnts.argmin(axis=0), pnts.argmax(axis=0)))
+    ep = pnts[ext]
+    dd = ((ep[:, np.newaxis, :] - ep[np.newaxis, :, :]) ** 2).sum(axis=2)
+    i, j = np.unravel_index(np.argmax(dd), dd.shape)
+    i0 = int(ext[i])
+    i1 = int(ext[j])
+    line = pnts[i1] - pnts[i0]
+    if line.dot(line) <= tol * tol:
+        raise ValueError("E: all points are coincident")
+    dl = np.cross(pnts - pnts[i0], line)
+    i2 = int(np.argmax((dl * dl).sum(axis=1)))
+    n = np.cross(pnts[i1] - pnts[i0], pnts[i2] - pnts[i0])
+    nlen = np.sqrt(n.dot(n))
+    if nlen <= tol * tol:
+        raise ValueError("E: all points are colinear")
+    dp = (pnts - pnts[i0]).dot(n / nlen)
+    i3 = int(np.argmax(np.abs(dp)))
+    if abs(dp[i3]) <= tol:
+        raise ValueError("E: all points are coplanar")
+    if dp[i3] > 0:
+        i1, i2 = i2, i1
+    fverts = []
+    fnormals = []
+    foffsets = []
+    foutside = []
+    falive = []
+    edges = {}
+    def add_faces(corners):
+        # normals of all new faces in one go, np.cross is slow for single vectors
+        tri = np.array(corners, dtype=np.int64).reshape(-1, 3)
+        pa = pnts[tri[:, 0]]
+        u = pnts[tri[:, 1]] - pa
+        v = pnts[tri[:, 2]] - pa
+        fn = np.column_stack((u[:, 1] * v[:, 2] - u[:, 2] * v[:, 1],
+                              u[:, 2] * v[:, 0] - u[:, 0] * v[:, 2],
+                              u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]))
+        fn /= np.sqrt((fn * fn).sum(axis=1))[:, np.newaxis]
+        off = (fn * pa).sum(axis=1)
+        fids = []
+        for (a, b, c), n, o in zip(corners, fn.tolist(), off.tolist()):
+            fid = len(fverts)
+            fverts.append((a, b, c))
+            fnormals.append(n)
+            foffsets.append(o)
+            foutside.append(None)
+            falive.append(True)
+            edges[(a, b)] = fid
+            edges[(b, c)] = fid
+            edges[(c, a)] = fid
+            fids.append(fid)
+        return fids
+    def assign(cand, fids):
+        if len(cand) == 0:
+            return
+        nrm = np.array([fnormals[f] for f in fids])
+        off = np.array([foffsets[f] for f in fids])
+        d = pnts[cand].dot(nrm.T) - off
+        best = np.argmax(d, axis=1)
+        outside = d[np.arange(len(cand)), best] > tol
+        cand = cand[outside]
+        best = best[outside]
+        order = np.argsort(best, kind='mergesort')
+        cand = cand[order]
+        best = best[order]
+        bounds = np.searchsorted(best, np.arange(len(fids) + 1))
+        for k, f in enumerate(fids):
+            if bounds[k + 1] > bounds[k]:
+                foutside[f] = cand[bounds[k]:bounds[k + 1]]
+                stack.append(f)
+    # the fourth point lies at the back of the first face
+    simplex = add_faces([(i0, i1, i2), (i0, i3, i1), (i1, i3, i2), (i2, i3, i0)])
+    stack = []
+    assign(np.setdiff1d(np.arange(len(pnts)), [i0, i1, i2, i3]), simplex)
+    while stack:
+        f = stack.pop()
+        if not falive[f] or foutside[f] is None:
+            continue
+        cand = foutside[f]
+        d = pnts[cand].dot(fnormals[f]) - foffsets[f]
+        eye = int(cand[np.argmax(d)])
+        ex, ey, ez = pnts[eye].tolist()
+        # collect the faces visible from the eye point
+        visible = [f]
+        seen = set([f])
+        horizon = []
+        k = 0
+        while k < len(visible):
+            vf = visible[k]
+            k += 1
+            a, b, c = fverts[vf]
+            for e0, e1 in ((a, b), (b, c), (c, a)):
+                nf = edges[(e1, e0)]
+                if nf in seen:
+                    continue
+                n = fnormals[nf]
+                if n[0] * ex + n[1] * ey + n[2] * ez - foffsets[nf] > tol:
+                    seen.add(nf)
+                    visible.append(nf)
+                else:
+                    horizon.append((e0, e1))
+        orphans = []
+        for vf in visible:
+            falive[vf] = False
+            if foutside[vf] is not None:
+                orphans.append(foutside[vf])
+                foutside[vf] = None
+            a, b, c = fverts[vf]
+            for e0, e1 in ((a, b), (b, c), (c, a)):
+                if edges.get((e0, e1)) == vf:
+                    del edges[(e0, e1)]
+        newfaces = add_faces([(e0, e1, eye) for e0, e1 in horizon])
+        cand = np.concatenate(orphans)
+        assign(cand[cand != eye], newfaces)
+    tris = np.array([fverts[f] for f in xrange(len(fverts)) if falive[f]], dtype=np.int64)
+    used, remap = np.unique(tris.ravel(), return_inverse=True)
+    return (pnts[used], remap.reshape(-1, 3).astype(np.int32))
+
+
+class Quaternion(object):
+    """
+    Represents a rotation as unit quaternion ``w + xi + yj + zk``.
+    
+    Composition follows ``c4d.Matrix``: ``q1 * q2`` rotates by
+    ``q2`` first and then by ``q1``. Conversions to and from HPB 
+    use CINEMA 4D's rotation order without going through 
+    ``c4d.utils.HPBToMatrix``.
+    """
+    
+    __slots__ = ('w', 'x', 'y', 'z')
+    
+    def __init__(self, w=1.0, x=0.0, y=0.0, z=0.0):
+        super(Quaternion, self).__init__()
+        self.w = float(w)
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+    
+    def __str__(self):
+        return "%r, w = %s, x = %s, y = %s, z = %s" % (self, self.w, self.x, self.y, self.z)
+    
+    def __eq__(self, other):
+        if not isinstance(other, Quaternion):
+            return NotImplemented
+        return (FloatEqual(self.w, other.w) and FloatEqual(self.x, other.x) and 
+                FloatEqual(self.y, other.y) and FloatEqual(self.z, other.z))
+    
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+    
+    def __mul__(self, other):
+        w1, x1, y1, z1 = self.w, self.x, self.y, self.z
+        w2, x2, y2, z2 = other.w, other.x, other.y, other.z
+        return Quaternion(w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                          w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                          w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                          w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2)
+    
+    def __neg__(self):
+        return Quaternion(-self.w, -self.x, -self.y, -self.z)
+    
+    @classmethod
+    def FromAxisAngle(cls, axis, angle):
+        """ Rotation of ``angle`` radians around ``axis``. """
+        l = math.sqrt(axis.x * axis.x + axis.y * axis.y + axis.z * axis.z)
+        if l == 0.0:
+            return cls()
+        s = math.sin(angle * 0.5) / l
+        return cls(math.cos(angle * 0.5), axis.x * s, axis.y * s, axis.z * s)
+    
+    @classmethod
+    def FromHPB(cls, hpb):
+        """ Rotation given as ``c4d.Vector`` of heading, pitch and bank in radians. """
+        h, p, b = -hpb.x * 0.5, -hpb.y * 0.5, -hpb.z * 0.5
+        ch, sh = math.cos(h), math.sin(h)
+        cp, sp = math.cos(p), math.sin(p)
+        cb, sb = math.cos(b), math.sin(b)
+        # heading around Y, then pitch around X, then bank around Z
+        return cls(ch * cp * cb + sh * sp * sb,
+                   ch * sp * cb + sh * cp * sb,
+                   sh * cp * cb - ch * sp * sb,
+                   ch * cp * sb - sh * sp * cb)
+    
+    @classmethod
+    def FromMatrix(cls, m):
+        """ Rotation part of a ``c4d.Matrix``. Scaling is removed first. """
+        v1 = m.v1.GetNormalized()
+        v2 = m.v2.GetNormalized()
+        v3 = m.v3.GetNormalized()
+        return cls(*_QuatFromAxes(v1.x, v1.y, v1.z, v2.x, v2.y, v2.z, v3.x, v3.y, v3.z))
+    
+    def ToAxes(self):
+        """ Return the rotated unit axes as ``tuple`` of 3 ``tuple`` of floats. """
+        w, x, y, z = self.w, self.x, self.y, self.z
+        return ((1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y + w * z), 2.0 * (x * z - w * y)),
+                (2.0 * (x * y - w * z), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z + w * x)),
+                (2.0 * (x * z + w * y), 2.0 * (y * z - w * x), 1.0 - 2.0 * (x * x + y * y)))
+    
+    def ToMatrix(self, off=None):
+        """ Convert to ``c4d.Matrix``, optionally with offset ``off``. """
+        if off is None:
+            off = c4d.Vector(0)
+        v1, v2, v3 = self.ToAxes()
+        return c4d.Matrix(off, c4d.Vector(*v1), c4d.Vector(*v2), c4d.Vector(*v3))
+    
+    def ToHPB(self):
+        """ Convert to a ``c4d.Vector`` of heading, pitch and bank in radians. """
+        return c4d.Vector(*_HPBFromAxes(*self.ToAxes()))
+    
+    def Dot(self, other):
+        return self.w * other.w + self.x * other.x + self.y * other.y + self.z * other.z
+    
+    def GetLength(self):
+        return math.sqrt(self.Dot(self))
+    
+    def GetNormalized(self):
+        l = self.GetLength()
+        if l == 0.0:
+            return Quaternion()
+        return Quaternion(self.w / l, self.x / l, self.y / l, self.z / l)
+    
+    def GetConjugate(self):
+        """ The inverse rotation of a unit quaternion. """
+        return Quaternion(self.w, -self.x, -self.y, -self.z)
+    
+    def Rotate(self, v):
+        """ Rotate vector v. The result has the same type as v. """
+        v1, v2, v3 = self.ToAxes()
+        v_type = type(v)  # make testable
+        return v_type(v.x * v1[0] + v.y * v2[0] + v.z * v3[0],
+                      v.x * v1[1] + v.y * v2[1] + v.z * v3[1],
+                      v.x * v1[2] + v.y * v2[2] + v.z * v3[2])
+    
+    def NLerp(self, other, t=0.5):
+        """ Normalized linear interpolation along the shorter path. """
+        if self.Dot(other) < 0.0:
+            other = -other
+        s = 1.0 - t
+        return Quaternion(s * self.w + t * other.w, s * self.x + t * other.x,
+                          s * self.y + t * other.y, s * self.z + t * other.z).GetNormalized()
+    
+    def SLerp(self, other, t=0.5):
+        """ Spherical linear interpolation along the shorter path. """
+        cos = self.Dot(other)
+        if cos < 0.0:
+            other = -other
+            cos = -cos
+        if cos > 1.0 - 1e-7:
+            return self.NLerp(other, t)
+        omega = math.acos(cos)
+        sin = math.sin(omega)
+        a = math.sin((1.0 - t) * omega) / sin
+        b = math.sin(t * omega) / sin
+        return Quaternion(a * self.w + b * other.w, a * self.x + b * other.x,
+                          a * self.y + b * other.y, a * self.z + b * other.z)
+
+
+def _QuatFromAxes(m00, m10, m20, m01, m11, m21, m02, m12, m22):
+    """ Shepperd's method on the rotation matrix with columns (v1, v2, v3). """
+    tr = m00 + m11 + m22
+    if tr > 0.0:
+        s = math.sqrt(tr + 1.0) * 2.0
+        return (0.25 * s, (m21 - m12) / s, (m02 - m20) / s, (m10 - m01) / s)
+    elif m00 > m11 and m00 > m22:
+        s = math.sqrt(1.0 + m00 - m11 - m22) * 2.0
+        return ((m21 - m12) / s, 0.25 * s, (m01 + m10) / s, (m02 + m20) / s)
+    elif m11 > m22:
+        s = math.sqrt(1.0 + m11 - m00 - m22) * 2.0
+        return ((m02 - m20) / s, (m01 + m10) / s, 0.25 * s, (m12 + m21) / s)
+    else:
+        s = math.sqrt(1.0 + m22 - m00 - m11) * 2.0
+        return ((m10 - m01) / s, (m02 + m20) / s, (m12 + m21) / s, 0.25 * s)
+
+
+def _HPBFromAxes(v1, v2, v3):
+    """ Heading, pitch and bank from the unit axes of a rotation. """
+    p = math.asin(max(-1.0, min(1.0, v3[1])))
+    if abs(v3[1]) > 1.0 - 1e-9:
+        # gimbal lock: heading and bank share one axis, put it all into heading
+        return (math.atan2(v1[2], v1[0]), p, 0.0)
+    return (math.atan2(-v3[0], v3[2]), p, math.atan2(-v1[1], v2[1]))
+
+
+def _AsQuats(q):
+    """ Convert a ``Quaternion``, a list of them or an array to an array of shape ``(N, 4)``. """
+    _RequireNumpy()
+    if isinstance(q, Quaternion):
+        q = [q]
+    if isinstance(q, (list, tuple)) and len(q) > 0 and isinstance(q[0], Quaternion):
+        return np.array([(e.w, e.x, e.y, e.z) for e in q], dtype=np.float64)
+    return np.asarray(q, dtype=np.float64).reshape(-1, 4)
+
+
+def QuatsToList(q):
+    """ Convert an array of shape ``(N, 4)`` to a list of :py:class:`Quaternion`. """
+    return [Quaternion(w, x, y, z) for w, x, y, z in _AsQuats(q).tolist()]
+
+
+def QuatsFromHPB(hpb):
+    """ Convert HPB rotations in radians of shape ``(N, 3)`` to 
+        quaternions of shape ``(N, 4)`` in ``w, x, y, z`` order. 
+    """
+    hpb = VectorsToArray(hpb) * -0.5
+    ch, cp, cb = np.cos(hpb).T
+    sh, sp, sb = np.sin(hpb).T
+    return np.column_stack((ch * cp * cb + sh * sp * sb,
+                            ch * sp * cb + sh * cp * sb,
+                            sh * cp * cb - ch * sp * sb,
+                            ch * cp * sb - sh * sp * cb))
+
+
+def QuatsToMatrices(q, off=None):
+    """ Convert quaternions of shape ``(N, 4)`` to matrices of shape 
+        ``(N, 4, 3)`` laid out like :py:func:`MatricesToArray`. 
+    
+        :param off: optional offsets of shape ``(N, 3)`` or ``(3,)``.
+    """
+    q = _AsQuats(q)
+    w, x, y, z = q.T
+    result = np.empty((len(q), 4, 3), dtype=np.float64)
+    result[:, 0] = 0.0 if off is None else VectorsToArray(off)
+    result[:, 1, 0] = 1.0 - 2.0 * (y * y + z * z)
+    result[:, 1, 1] = 2.0 * (x * y + w * z)
+    result[:, 1, 2] = 2.0 * (x * z - w * y)
+    result[:, 2, 0] = 2.0 * (x * y - w * z)
+    result[:, 2, 1] = 1.0 - 2.0 * (x * x + z * z)
+    result[:, 2, 2] = 2.0 * (y * z + w * x)
+    result[:, 3, 0] = 2.0 * (x * z + w * y)
+    result[:, 3, 1] = 2.0 * (y * z - w * x)
+    result[:, 3, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return result
+
+
+def QuatsFromMatrices(m):
+    """ Convert the rotation part of matrices to quaternions of shape ``(N, 4)``.
+    
+        :param m: ``list<c4d.Matrix>`` or array of shape ``(N, 4, 3)``. 
+            Scaling is removed first.
+    """
+    m = MatricesToArray(m)
+    axes = m[:, 1:] / np.sqrt((m[:, 1:] ** 2).sum(axis=2))[:, :, np.newaxis]
+    # r[i][j] is component i of axis j
+    r = np.swapaxes(axes, 1, 2)
+    m00, m11, m22 = r[:, 0, 0], r[:, 1, 1], r[:, 2, 2]
+    tr = m00 + m11 + m22
+    candidates = np.empty((4, len(m), 4), dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.sqrt(np.maximum(tr + 1.0, 0.0)) * 2.0
+        candidates[0] = np.column_stack((0.25 * s, (r[:, 2, 1] - r[:, 1, 2]) / s, 
+                                         (r[:, 0, 2] - r[:, 2, 0]) / s, (r[:, 1, 0] - r[:, 0, 1]) / s))
+        s = np.sqrt(np.maximum(1.0 + m00 - m11 - m22, 0.0)) * 2.0
+        candidates[1] = np.column_stack(((r[:, 2, 1] - r[:, 1, 2]) / s, 0.25 * s, 
+                                         (r[:, 0, 1] + r[:, 1, 0]) / s, (r[:, 0, 2] + r[:, 2, 0]) / s))
+        s = np.sqrt(np.maximum(1.0 + m11 - m00 - m22, 0.0)) * 2.0
+        candidates[2] = np.column_stack(((r[:, 0, 2] - r[:, 2, 0]) / s, (r[:, 0, 1] + r[:, 1, 0]) / s, 
+                                         0.25 * s, (r[:, 1, 2] + r[:, 2, 1]) / s))
+        s = np.sqrt(np.maximum(1.0 + m22 - m00 - m11, 0.0)) * 2.0
+        candidates[3] = np.column_stack(((r[:, 1, 0] - r[:, 0, 1]) / s, (r[:, 0, 2] + r[:, 2, 0]) / s, 
+                                         (r[:, 1, 2] + r[:, 2, 1]) / s, 0.25 * s))
+    pick = np.where(tr > 0.0, 0, np.where((m00 > m11) & (m00 > m22), 1, np.where(m11 > m22, 2, 3)))
+    return candidates[pick, np.arange(len(m))]
+
+
+def QuatsToHPB(q):
+    """ Convert quaternions of shape ``(N, 4)`` to HPB rotations in 
+        radians of shape ``(N, 3)``. At gimbal lock the bank is zero.
+    """
+    m = QuatsToMatrices(q)
+    v1, v2, v3 = m[:, 1], m[:, 2], m[:, 3]
+    p = np.arcsin(np.clip(v3[:, 1], -1.0, 1.0))
+    lock = np.abs(v3[:, 1]) > 1.0 - 1e-9
+    h = np.where(lock, np.arctan2(v1[:, 2], v1[:, 0]), np.arctan2(-v3[:, 0], v3[:, 2]))
+    b = np.where(lock, 0.0, np.arctan2(-v1[:, 1], v2[:, 1]))
+    return np.column_stack((h, p, b))
+
+
+def QuatMulArray(a, b):
+    """ Compose quaternions of shape ``(N, 4)`` or ``(4,)`` like ``a * b``
+        does for :py:class:`Quaternion`, i.e. rotate by ``b`` first. 
+    """
+    a = _AsQuats(a)
+    b = _AsQuats(b)
+    w1, x1, y1, z1 = a.T
+    w2, x2, y2, z2 = b.T
+    return np.column_stack((w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2))
+
+
+def QuatRotateArray(q, v):
+    """ Rotate vectors of shape ``(N, 3)`` by quaternions of shape 
+        ``(N, 4)``, or all vectors by a single quaternion. 
+    """
+    q = _AsQuats(q)
+    v = VectorsToArray(v)
+    u = q[:, 1:]
+    w = q[:, :1]
+    t = 2.0 * np.cross(u, v)
+    return v + w * t + np.cross(u, t)
+
+
+def _QuatLerpArgs(a, b, t):
+    a = _AsQuats(a)
+    b = _AsQuats(b)
+    t = np.asarray(t, dtype=np.float64).reshape(-1, 1)
+    cos = (a * b).sum(axis=1)[:, np.newaxis]
+    # take the shorter path
+    b = np.where(cos < 0.0, -b, b)
+    return (a, b, t, np.abs(cos))
+
+
+def QuatNLerpArray(a, b, t=0.5):
+    """ Normalized linear interpolation between quaternions of shape 
+        ``(N, 4)`` along the shorter path. ``t`` may be a ``float`` or 
+        an array of shape ``(N,)`` and either side may be a single 
+        quaternion.
+    """
+    a, b, t, _ = _QuatLerpArgs(a, b, t)
+    result = a + t * (b - a)
+    return result / np.sqrt((result * result).sum(axis=1))[:, np.newaxis]
+
+
+def QuatSLerpArray(a, b, t=0.5):
+    """ Spherical linear interpolation between quaternions of shape 
+        ``(N, 4)`` along the shorter path. Arguments as for 
+        :py:func:`QuatNLerpArray`. Nearly equal rotations fall back 
+        to normalized linear interpolation.
+    """
+    a, b, t, cos = _QuatLerpArgs(a, b, t)
+    small = cos > 1.0 - 1e-7
+    omega = np.arccos(np.minimum(cos, 1.0))
+    sin = np.where(small, 1.0, np.sin(omega))
+    wa = np.where(small, 1.0 - t, np.sin((1.0 - t) * omega) / sin)
+    wb = np.where(small, t, np.sin(t * omega) / sin)
+    result = wa * a + wb * b
+    return result / np.sqrt((result * result).sum(axis=1))[:, np.newaxis]
+
 
 def VDeg(v, isHPB=False):
     """ Convert each component of vector v to degrees. """
@@ -328,14 +1246,48 @@ def VRad(v, isHPB=False):
     """ Convert each component of vector v to radians. """
     if not isinstance(v, c4d.Vector): 
         raise TypeError("E: expected c4d.Vector, got %s" % type(v))
+    x, y, z = v.x, v.y, v.z
+    if isHPB:
+        if x >= 180:
+            x -= 360
+        if y >= 180:
+            y -= 360
+        if z >= 180:
+            z -= 360
+    return c4d.Vector(Rad(x), Rad(y), Rad(z))
+
+
+def VDegArray(arr, isHPB=False):
+    """ Convert each component of an array of angles to degrees.
+    
+        The batch counterpart of :py:func:`VDeg`. Works on arrays of 
+        any shape, e.g. ``(frames, objects, 3)`` for baked rotations.
+        
+        :param bool isHPB: if True, angles of 180 degrees and above 
+            are shifted down by 360 degrees, like :py:func:`VDeg` does.
+        :return: a new ``numpy.ndarray``.
+    """
+    _RequireNumpy()
+    result = np.degrees(np.asarray(arr, dtype=np.float64))
     if isHPB:
-        if v.x >= 180:
-            v.x -= 360
-        if v.y >= 180:
-            v.y -= 360
-        if v.z >= 180:
-            v.z -= 360
-    return c4d.Vector(Rad(v.x), Rad(v.y), Rad(v.z))
+        result[result >= 180] -= 360
+    return result
+
+
+def VRadArray(arr, isHPB=False):
+    """ Convert each component of an array of angles in degrees to radians.
+    
+        The batch counterpart of :py:func:`VRad`. The input is left unchanged.
+    
+        :param bool isHPB: if True, angles of 180 degrees and above are 
+            shifted down by 360 degrees before converting.
+        :return: a new ``numpy.ndarray``.
+    """
+    _RequireNumpy()
+    result = np.array(arr, dtype=np.float64)
+    if isHPB:
+        result[result >= 180] -= 360
+    return np.radians(result, out=result)
 
 
 def VAvg(lv):
@@ -427,22 +1379,22 @@ def VBoundaryLerp(lv, t=0.5):
 
 def VLerp(startv, endv, t=0.5):
     """ Linear interpolation between 2 vectors. """
-    if t <= 0.0 or t > 1.0:
-        raise ValueError("E: t must satisfy 0<t<1, but is %f" % t)
+    if t < 0.0 or t > 1.0:
+        raise ValueError("E: t must satisfy 0<=t<=1, but is %f" % t)
     return (startv + (t * (endv - startv)))
 
 
 def VNLerp(startv, endv, t=0.5):
     """ Normalized linear interpolation between 2 vectors. """
-    if t <= 0.0 or t > 1.0:
-        raise ValueError("E: t must satisfy 0<t<1, but is %f" % t)
+    if t < 0.0 or t > 1.0:
+        raise ValueError("E: t must satisfy 0<=t<=1, but is %f" % t)
     return VLerp(startv, endv, t).GetNormalized()
 
 
 def VSLerp(startv, endv, t=0.5):
     """ Spherical linear interpolation between 2 vectors. """
-    if t <= 0.0 or t > 1.0:
-        raise ValueError("E: t must satisfy 0<t<1, but is %f" % t)
+    if t < 0.0 or t > 1.0:
+        raise ValueError("E: t must satisfy 0<=t<=1, but is %f" % t)
     dot = endv.Dot(startv)
     #if dot <= -1.0:
     #    dot = -1.0
@@ -457,6 +1409,78 @@ def VSLerp(startv, endv, t=0.5):
     return result
 
 
+def _AsArrayND(v):
+    """ Like :py:func:`_AsArrayN3` but keeps the shape of anything but ``c4d.Vectors``. """
+    if hasattr(v, 'x'):
+        return _AsArray3(v)
+    if isinstance(v, (list, tuple)) and len(v) > 0 and hasattr(v[0], 'x'):
+        return VectorsToArray(v)
+    return np.asarray(v, dtype=np.float64)
+
+
+def _LerpArgs(startv, endv, t):
+    """ Convert and check the arguments of the interpolation array functions. """
+    _RequireNumpy()
+    a = _AsArrayND(startv)
+    b = _AsArrayND(endv)
+    t = np.asarray(t, dtype=np.float64)
+    if t.size > 0 and (t.min() < 0.0 or t.max() > 1.0):
+        raise ValueError("E: t must satisfy 0<=t<=1, but ranges from %f to %f" % (t.min(), t.max()))
+    return (a, b, t[..., np.newaxis])
+
+
+def VLerpArray(startv, endv, t=0.5):
+    """ Linear interpolation between arrays of vectors.
+    
+        The batch counterpart of :py:func:`VLerp`. All arguments are 
+        broadcast against each other, where ``t`` gets an extra trailing 
+        axis first. E.g. points of shape ``(N, 3)`` with ``t`` of shape 
+        ``(N,)`` interpolate each point by its own ``t``, while ``t`` of 
+        shape ``(T, 1)`` gives all points for each ``t`` with shape ``(T, N, 3)``.
+        
+        :param startv: vectors of shape ``(..., 3)``.
+        :param endv: vectors of shape ``(..., 3)``.
+        :param t: ``float`` or array with values in ``[0, 1]``.
+    """
+    a, b, t = _LerpArgs(startv, endv, t)
+    return a + t * (b - a)
+
+
+def VNLerpArray(startv, endv, t=0.5):
+    """ Normalized linear interpolation between arrays of vectors. 
+        See :py:func:`VLerpArray` for how the arguments are broadcast. 
+        Results of zero length stay zero.
+    """
+    a, b, t = _LerpArgs(startv, endv, t)
+    result = a + t * (b - a)
+    mag = np.sqrt((result * result).sum(axis=-1))[..., np.newaxis]
+    return np.where(mag > 0.0, result / np.where(mag > 0.0, mag, 1.0), 0.0)
+
+
+def VSLerpArray(startv, endv, t=0.5):
+    """ Spherical linear interpolation between arrays of unit vectors.
+        See :py:func:`VLerpArray` for how the arguments are broadcast.
+        
+        The angle between the vectors is calculated with ``atan2`` which 
+        stays accurate for nearly parallel vectors, where the result falls 
+        back to a normalized linear interpolation. For opposite vectors
+        the interpolation path is undefined.
+    """
+    a, b, t = _LerpArgs(startv, endv, t)
+    cross = np.cross(a, b)
+    sin = np.sqrt((cross * cross).sum(axis=-1))[..., np.newaxis]
+    cos = (a * b).sum(axis=-1)[..., np.newaxis]
+    omega = np.arctan2(sin, cos)
+    small = sin < 1e-7
+    safe = np.where(small, 1.0, sin)
+    wa = np.where(small, 1.0 - t, np.sin((1.0 - t) * omega) / safe)
+    wb = np.where(small, t, np.sin(t * omega) / safe)
+    result = wa * a + wb * b
+    mag = np.sqrt((result * result).sum(axis=-1))[..., np.newaxis]
+    scale = np.where(small & (mag > 0.0), 1.0 / np.where(mag > 0.0, mag, 1.0), 1.0)
+    return result * scale
+
+
 def MAbs(m):
     """ ``abs()`` each component vector of matrix m. """
     return c4d.Matrix(abs(m.off), abs(m.v1), abs(m.v2), abs(m.v3))
@@ -472,10 +1496,11 @@ def BuildMatrix(v, off=None, order="zyx"):
     if off is None:
         off = c4d.Vector(0)
     r = v.GetNormalized()
-    mincomp = c4d.utils.VectorMin(v)
-    if r.x == mincomp:
+    # build the perpendicular from the smallest absolute component
+    ax, ay, az = abs(r.x), abs(r.y), abs(r.z)
+    if ax <= ay and ax <= az:
         s = c4d.Vector(0, -r.z, r.y)
-    elif r.y == mincomp:
+    elif ay <= az:
         s = c4d.Vector(-r.z, 0, r.x)
     else:
         s = c4d.Vector(-r.y, r.x, 0)
@@ -550,7 +1575,7 @@ def BuildMatrix3(v, v2, off=None, base="z"):
         raise ValueError("E: expected c4d.Vector, got %r" % v)
     if off is None:
         off = c4d.Vector(0)
-    v2.Normalize()
+    v2 = v2.GetNormalized()
     if base == "z":
         z = v.GetNormalized()
         x = z.Cross(v2).GetNormalized()
@@ -580,6 +1605,115 @@ def BuildMatrix3(v, v2, off=None, base="z"):
     return c4d.Matrix(off, x, y, z)
 
 
+def _NormalizeRows(a):
+    """ Normalize the rows of a ``(N, 3)`` array in place. Zero rows stay zero. """
+    mag = np.sqrt((a * a).sum(axis=1))
+    nz = mag > 0.0
+    a[nz] /= mag[nz, np.newaxis]
+    return a
+
+
+def _Frames(off, v1, v2, v3):
+    """ Stack offsets and axes of shape ``(N, 3)`` into frames of shape ``(N, 4, 3)``. """
+    n = len(v1)
+    result = np.empty((n, 4, 3), dtype=np.float64)
+    if off is None:
+        result[:, 0] = 0.0
+    elif hasattr(off, 'x'):
+        result[:, 0] = (off.x, off.y, off.z)
+    else:
+        result[:, 0] = VectorsToArray(off)
+    result[:, 1] = v1
+    result[:, 2] = v2
+    result[:, 3] = v3
+    return result
+
+
+def BuildMatrixArray(v, off=None, order="zyx"):
+    """ Build N orthonormal bases from N directions at once.
+    
+        The batch counterpart of :py:func:`BuildMatrix` with the same 
+        axis ``order`` conventions.
+    
+        :param v: directions of shape ``(N, 3)``.
+        :param off: offsets of shape ``(N, 3)`` or ``(3,)``.
+        :return: ``numpy.ndarray`` of shape ``(N, 4, 3)`` laid out 
+            like :py:func:`MatricesToArray`.
+    """
+    _RequireNumpy()
+    r = _NormalizeRows(VectorsToArray(v).copy())
+    minc = np.argmin(np.abs(r), axis=1)
+    zero = np.zeros(len(r))
+    s = np.where((minc == 0)[:, np.newaxis], 
+                 np.column_stack((zero, -r[:, 2], r[:, 1])),
+                 np.where((minc == 1)[:, np.newaxis], 
+                          np.column_stack((-r[:, 2], zero, r[:, 0])), 
+                          np.column_stack((-r[:, 1], r[:, 0], zero))))
+    s = _NormalizeRows(s)
+    t = _NormalizeRows(np.cross(r, s))
+    axes = {"x": r, "y": s, "z": t}
+    if len(order) != 3 or set(order) != set("xyz"):
+        order = "xyz"
+    return _Frames(off, axes[order[0]], axes[order[1]], axes[order[2]])
+
+
+def _BaseFrames(v, ref, off, base):
+    """ Shared implementation of :py:func:`BuildMatrix2Array` and :py:func:`BuildMatrix3Array`. """
+    v = _NormalizeRows(VectorsToArray(v).copy())
+    ref = np.broadcast_to(ref, v.shape)
+    if base.startswith("-"):
+        ref = -ref
+    if base in ("z", "-z"):
+        z = v
+        x = _NormalizeRows(np.cross(z, ref))
+        y = _NormalizeRows(np.cross(x, z))
+    elif base in ("y", "-y"):
+        y = v
+        z = _NormalizeRows(np.cross(y, ref))
+        x = _NormalizeRows(np.cross(z, y))
+    elif base in ("x", "-x"):
+        x = v
+        y = _NormalizeRows(np.cross(x, ref))
+        z = _NormalizeRows(np.cross(y, x))
+    else:
+        raise ValueError("E: base must be one of x, y, z, -x, -y, -z, but is %r" % base)
+    return _Frames(off, x, y, z)
+
+
+def BuildMatrix2Array(v, off=None, base="z"):
+    """ Build N orthonormal bases from N directions at once using base 
+        aligned cross products.
+        
+        The batch counterpart of :py:func:`BuildMatrix2` with the same 
+        ``base`` conventions.
+    
+        :param v: directions of shape ``(N, 3)``.
+        :param off: offsets of shape ``(N, 3)`` or ``(3,)``.
+        :return: ``numpy.ndarray`` of shape ``(N, 4, 3)``.
+    """
+    _RequireNumpy()
+    refs = {"z": (1, 0, 0), "y": (0, 0, 1), "x": (0, 1, 0)}
+    ref = np.array(refs.get(base.lstrip("-"), (0, 0, 0)), dtype=np.float64)
+    return _BaseFrames(v, ref, off, base)
+
+
+def BuildMatrix3Array(v, v2, off=None, base="z"):
+    """ Build N orthonormal bases from N pairs of directions at once.
+        
+        The batch counterpart of :py:func:`BuildMatrix3` with the same 
+        ``base`` conventions.
+    
+        :param v: directions of shape ``(N, 3)``.
+        :param v2: secondary directions of shape ``(N, 3)`` or ``(3,)``.
+        :param off: offsets of shape ``(N, 3)`` or ``(3,)``.
+        :return: ``numpy.ndarray`` of shape ``(N, 4, 3)``.
+    """
+    if hasattr(v2, 'x'):
+        v2 = [v2]
+    v2 = _NormalizeRows(VectorsToArray(v2).copy())
+    return _BaseFrames(v, v2, off, base)
+
+
 # Define these functions to ease conversion of C.O.F.F.E.E. scripts to Python.
 def GetMulP(m, v):
     """ Multiply a matrix with a vector representing a point. 
@@ -657,6 +1791,55 @@ def Det(m):
             m.v1.x * m.v2.z * m.v3.y)
 
 
+def DetArray(m):
+    """ Determinants of a stack of matrices of shape ``(N, 3, 3)`` or ``(N, 4, 4)``.
+    
+        Uses the same closed formulas as :py:func:`Det`, evaluated for 
+        all matrices at once.
+    
+        :return: ``numpy.ndarray`` of shape ``(N,)``.
+    """
+    _RequireNumpy()
+    m = np.asarray(m, dtype=np.float64)
+    if m.ndim != 3 or m.shape[1] != m.shape[2] or m.shape[1] not in (3, 4):
+        raise ValueError("E: expected array of shape (N, 3, 3) or (N, 4, 4), got %r" % (m.shape,))
+    if m.shape[1] == 3:
+        return (m[:, 0, 0] * (m[:, 1, 1] * m[:, 2, 2] - m[:, 1, 2] * m[:, 2, 1]) -
+                m[:, 0, 1] * (m[:, 1, 0] * m[:, 2, 2] - m[:, 1, 2] * m[:, 2, 0]) +
+                m[:, 0, 2] * (m[:, 1, 0] * m[:, 2, 1] - m[:, 1, 1] * m[:, 2, 0]))
+    # Laplace expansion along the first row
+    result = np.zeros(len(m), dtype=np.float64)
+    sign = 1.0
+    for j in xrange(4):
+        minor = np.delete(m[:, 1:, :], j, axis=2)
+        result += sign * m[:, 0, j] * DetArray(minor)
+        sign = -sign
+    return result
+
+
+def UnitNormals(a, b, c):
+    """ Calculate the unit normals of N triangles at once. 
+    
+        The batch counterpart of :py:func:`UnitNormal`. Instead of 
+        raising for degenerate triangles, a mask is returned.
+    
+        :param a: first corners of shape ``(N, 3)``.
+        :param b: second corners of shape ``(N, 3)``.
+        :param c: third corners of shape ``(N, 3)``.
+        
+        :return: ``tuple`` of ``(normals, valid)``. ``normals`` has shape 
+            ``(N, 3)`` and is zero where ``valid`` is False, i.e. where the 
+            triangle has no area.
+    """
+    a = VectorsToArray(a)
+    n = np.cross(VectorsToArray(b) - a, VectorsToArray(c) - a)
+    mag = np.sqrt((n * n).sum(axis=1))
+    valid = mag > 0.0
+    n[valid] /= mag[valid, np.newaxis]
+    n[~valid] = 0.0
+    return (n, valid)
+
+
 def Transpose(e):
     """ Transpose matrix e in row-major format to column-major.
         ``e`` can be of type ``list<list>`` structure or ``c4d.Matrix``.
@@ -700,8 +1883,8 @@ def ListListToMatrix(lli):
         raise TypeError("E: expected list of list, got %r" % type(lli))
     m = len(lli)
     n = len(lli[0])
-    if not isinstance(lli[0], (float, int)):
-        raise TypeError("E: expected list elements of type float or int, got %r" % (type(lli[0])))
+    if not isinstance(lli[0][0], (float, int)):
+        raise TypeError("E: expected list elements of type float or int, got %r" % (type(lli[0][0])))
     # check dimensions.
     # 
     # This part could be handled by a local private function but 
@@ -751,6 +1934,83 @@ def MatrixToListList(m, inclOff=False):
                 [m.v3.x, m.v3.y, m.v3.z]]
 
 
+def MatricesToArray(lm, homogeneous=False):
+    """ Convert a list of ``c4d.Matrix`` to a ``numpy.ndarray``.
+    
+        :param bool homogeneous: if False, the result has shape ``(N, 4, 3)`` 
+            with the rows of each matrix laid out like :py:func:`MatrixToArray`.
+            If True, the result has shape ``(N, 4, 4)`` with a homogeneous 
+            column ``(1, 0, 0, 0)`` in front, so that a row vector 
+            ``(1, x, y, z)`` can be multiplied with it directly.
+    """
+    _RequireNumpy()
+    if isinstance(lm, np.ndarray):
+        arr = np.asarray(lm, dtype=np.float64)
+        if arr.ndim != 3 or arr.shape[1:] not in ((4, 3), (4, 4)):
+            raise ValueError("E: expected array of shape (N, 4, 3) or (N, 4, 4), got %r" % (arr.shape,))
+        if arr.shape[2] == 4:
+            arr = arr[:, :, 1:]
+    elif isinstance(lm, (list, tuple)):
+        arr = np.array([(m.off.x, m.off.y, m.off.z, 
+                         m.v1.x, m.v1.y, m.v1.z, 
+                         m.v2.x, m.v2.y, m.v2.z, 
+                         m.v3.x, m.v3.y, m.v3.z) for m in lm], dtype=np.float64).reshape(-1, 4, 3)
+    else:
+        raise TypeError("E: expected list of c4d.Matrix or numpy.ndarray, got %r" % type(lm))
+    if homogeneous is True:
+        hom = np.zeros((len(arr), 4, 4), dtype=np.float64)
+        hom[:, 0, 0] = 1.0
+        hom[:, :, 1:] = arr
+        return hom
+    return arr
+
+
+def ArrayToMatrices(arr):
+    """ Convert an array of shape ``(N, 4, 3)`` or ``(N, 4, 4)`` as returned 
+        by :py:func:`MatricesToArray` to a list of ``c4d.Matrix``. 
+    """
+    arr = MatricesToArray(arr)
+    Vector = c4d.Vector
+    Matrix = c4d.Matrix
+    return [Matrix(Vector(*off), Vector(*v1), Vector(*v2), Vector(*v3)) 
+            for off, v1, v2, v3 in arr.tolist()]
+
+
+def TransposeArray(arr):
+    """ Transpose a stack of matrices of shape ``(N, m, n)`` 
+        at once, like :py:func:`Transpose` does for one. 
+    """
+    _RequireNumpy()
+    arr = np.asarray(arr, dtype=np.float64)
+    if arr.ndim < 2:
+        raise ValueError("E: expected array with at least 2 dimensions, got %d" % arr.ndim)
+    return np.swapaxes(arr, -1, -2)
+
+
+def MulMatrixArray(a, b):
+    """ Multiply stacks of matrices like ``a * b`` does for two ``c4d.Matrix``,
+        i.e. the result transforms a point by ``b`` first and then by ``a``.
+    
+        :param a: array of shape ``(N, 4, 3)`` or ``(4, 3)``.
+        :param b: array of shape ``(N, 4, 3)`` or ``(4, 3)``. A single 
+            matrix on either side is applied to the whole stack. 
+            Homogeneous arrays of shape ``(N, 4, 4)`` are supported as 
+            well if both sides use them.
+        :return: ``numpy.ndarray`` with the matrix products.
+    """
+    _RequireNumpy()
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if a.shape[-2:] == (4, 4) and b.shape[-2:] == (4, 4):
+        return np.matmul(b, a)
+    if a.shape[-2:] != (4, 3) or b.shape[-2:] != (4, 3):
+        raise ValueError("E: expected arrays of shape (N, 4, 3), got %r and %r" % (a.shape, b.shape))
+    result = np.empty(np.broadcast(a, b).shape, dtype=np.float64)
+    result[..., 1:, :] = np.matmul(b[..., 1:, :], a[..., 1:, :])
+    result[..., 0, :] = np.matmul(b[..., 0:1, :], a[..., 1:, :])[..., 0, :] + a[..., 0, :]
+    return result
+
+
 def UnitNormal(a, b, c):
     """ Calculate unit normal of a planar tri-facet. """
     x = Det([[1, a.y, a.z],
@@ -786,6 +2046,186 @@ def IsPointInTriangle(p, a, b, c):
     return ((b1 > 0) and (b2 > 0) and (b3 > 0))   
 
 
+_PROJECTION_AXES = {'xy': (0, 1), 'xz': (0, 2), 'yz': (1, 2)}
+
+
+def PointsInTriangles(p, a, b, c, plane="xy", tolerance=0.0, weights=False):
+    """ Batch version of :py:func:`IsPointInTriangle`.
+    
+        Tests P points against one triangle or against T triangles. 
+        Points on an edge count as inside.
+        
+        :param p: points of shape ``(P, 3)``.
+        :param a: first triangle corner(s) of shape ``(3,)`` or ``(T, 3)``.
+        :param b: second triangle corner(s).
+        :param c: third triangle corner(s).
+        :param str plane: the projection plane, one of ``xy``, ``xz`` 
+            or ``yz``. If None, a true 3D test is made.
+        :param float tolerance: only used for the 3D test: the maximum
+            distance of a point from the triangle's plane.
+        :param bool weights: if True, also return the barycentric weights.
+            
+        :return: boolean mask of shape ``(P,)`` for one triangle or ``(P, T)``,
+            or if ``weights`` is True a ``tuple`` of the mask and the weights 
+            of ``a``, ``b`` and ``c`` with an additional trailing axis of size 3.
+    """
+    _RequireNumpy()
+    pnts = VectorsToArray(p)
+    ta, single = _AsArrayN3(a)
+    tb = _AsArrayN3(b)[0]
+    tc = _AsArrayN3(c)[0]
+    if plane is not None:
+        try:
+            axes = list(_PROJECTION_AXES[plane])
+        except KeyError:
+            raise ValueError("E: plane must be one of xy, xz, yz or None, but is %r" % (plane,))
+        pnts = pnts[:, axes]
+        ta = ta[:, axes]
+        tb = tb[:, axes]
+        tc = tc[:, axes]
+    v0 = (tb - ta)[np.newaxis, :, :]
+    v1 = (tc - ta)[np.newaxis, :, :]
+    v2 = pnts[:, np.newaxis, :] - ta[np.newaxis, :, :]
+    d00 = (v0 * v0).sum(axis=-1)
+    d01 = (v0 * v1).sum(axis=-1)
+    d11 = (v1 * v1).sum(axis=-1)
+    d20 = (v2 * v0).sum(axis=-1)
+    d21 = (v2 * v1).sum(axis=-1)
+    denom = d00 * d11 - d01 * d01
+    valid = np.abs(denom) > eps * eps
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ood = np.where(valid, 1.0 / np.where(valid, denom, 1.0), np.nan)
+        wb = (d11 * d20 - d01 * d21) * ood
+        wc = (d00 * d21 - d01 * d20) * ood
+    wa = 1.0 - wb - wc
+    with np.errstate(invalid='ignore'):
+        inside = valid & (wa >= 0.0) & (wb >= 0.0) & (wc >= 0.0)
+    if plane is None:
+        n = np.cross(v0, v1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dist = np.abs((v2 * n).sum(axis=-1)) / np.sqrt((n * n).sum(axis=-1))
+            inside &= (dist <= tolerance)
+    if single:
+        inside = inside[:, 0]
+        wa = wa[:, 0]
+        wb = wb[:, 0]
+        wc = wc[:, 0]
+    if weights:
+        return (inside, np.stack((wa, wb, wc), axis=-1))
+    return inside
+
+
+def PointsInPolygon(p, lv, plane="xy"):
+    """ Test P points against a closed polygon, e.g. a lasso stroke,
+        using the even-odd rule in the given projection plane.
+        
+        The loop runs over the polygon's edges while all points are 
+        processed at once, so long point lists are cheap.
+        
+        :param p: points of shape ``(P, 3)``.
+        :param lv: polygon corners as ``list<c4d.Vector>`` or ``(K, 3)`` array.
+        :param str plane: one of ``xy``, ``xz`` or ``yz``.
+        :return: boolean mask of shape ``(P,)``.
+    """
+    _RequireNumpy()
+    try:
+        i, j = _PROJECTION_AXES[plane]
+    except KeyError:
+        raise ValueError("E: plane must be one of xy, xz or yz, but is %r" % (plane,))
+    pnts = VectorsToArray(p)
+    poly = VectorsToArray(lv)
+    inside = np.zeros(len(pnts), dtype=bool)
+    if len(poly) < 3:
+        return inside
+    px = pnts[:, i]
+    py = pnts[:, j]
+    # only test points within the polygon's bounding box
+    cand = np.nonzero((px >= poly[:, i].min()) & (px <= poly[:, i].max()) & 
+                      (py >= poly[:, j].min()) & (py <= poly[:, j].max()))[0]
+    px = px[cand]
+    py = py[cand]
+    odd = np.zeros(len(cand), dtype=bool)
+    xs = poly[:, i].tolist()
+    ys = poly[:, j].tolist()
+    k = len(xs)
+    for e in xrange(k):
+        x1, y1 = xs[e - 1], ys[e - 1]
+        x2, y2 = xs[e], ys[e]
+        if y1 == y2:
+            continue
+        crosses = (y1 > py) != (y2 > py)
+        xcross = x1 + (py - y1) * ((x2 - x1) / (y2 - y1))
+        odd ^= crosses & (px < xcross)
+    inside[cand] = odd
+    return inside
+
+
+def RayTriangleIntersections(p, d, a, b, c, pairs=None, cull=False, tmin=0.0):
+    """ Intersect rays with triangles using the Möller-Trumbore algorithm.
+    
+        Either tests every ray against every triangle, or, if ``pairs`` 
+        is given, only the ray/triangle combinations found by a broad 
+        phase.
+        
+        :param p: ray start positions of shape ``(R, 3)``.
+        :param d: ray directions of shape ``(R, 3)``. Need not be 
+            normalized, ``t`` is measured in units of ``d``.
+        :param a: first triangle corners of shape ``(T, 3)``.
+        :param b: second triangle corners of shape ``(T, 3)``.
+        :param c: third triangle corners of shape ``(T, 3)``.
+        :param pairs: ``tuple`` of two index arrays ``(ray_indices, 
+            tri_indices)`` of equal length M. If None, all ``R x T`` 
+            combinations are tested. Mind the memory for large inputs.
+        :param bool cull: if True, ignore back facing triangles, i.e. 
+            those whose normal ``(b - a) x (c - a)`` points along the ray.
+        :param float tmin: minimum ray parameter for a hit to count.
+        
+        :return: ``tuple`` of ``(t, u, v, hit)`` arrays of shape ``(R, T)``
+            or ``(M,)``. ``t`` is the ray parameter (``inf`` where there 
+            is no hit), ``u`` and ``v`` are the barycentric weights of 
+            ``b`` and ``c`` (the weight of ``a`` is ``1 - u - v``) and 
+            ``hit`` is a boolean mask.
+    """
+    _RequireNumpy()
+    orig = VectorsToArray(p)
+    dirs = VectorsToArray(d)
+    ta = VectorsToArray(a)
+    e1 = VectorsToArray(b) - ta
+    e2 = VectorsToArray(c) - ta
+    if pairs is None:
+        orig = orig[:, np.newaxis, :]
+        dirs = dirs[:, np.newaxis, :]
+        ta = ta[np.newaxis, :, :]
+        e1 = e1[np.newaxis, :, :]
+        e2 = e2[np.newaxis, :, :]
+    else:
+        ri = np.asarray(pairs[0], dtype=np.intp)
+        ti = np.asarray(pairs[1], dtype=np.intp)
+        if ri.shape != ti.shape:
+            raise ValueError("E: pairs must have equal lengths, got %d and %d" % (len(ri), len(ti)))
+        orig = orig[ri]
+        dirs = dirs[ri]
+        ta = ta[ti]
+        e1 = e1[ti]
+        e2 = e2[ti]
+    pvec = np.cross(dirs, e2)
+    det = (e1 * pvec).sum(axis=-1)
+    if cull:
+        valid = det > eps
+    else:
+        valid = np.abs(det) > eps
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv = 1.0 / np.where(valid, det, 1.0)
+        tvec = orig - ta
+        u = (tvec * pvec).sum(axis=-1) * inv
+        qvec = np.cross(tvec, e1)
+        v = (dirs * qvec).sum(axis=-1) * inv
+        t = (e2 * qvec).sum(axis=-1) * inv
+    hit = valid & (u >= 0.0) & (v >= 0.0) & (u + v <= 1.0) & (t >= tmin)
+    t = np.where(hit, t, np.inf)
+    return (t, u, v, hit)
+
+
 def IsColinear(lv):
     """ Given a list of vectors check if they all share the same coordinates 
         in at least 2 dimensions. 
@@ -840,18 +2280,14 @@ def LineLineDistance(p1a, p1b, p2a, p2b):
     p43_y = p2b.y - p2a.y
     p43_z = p2b.z - p2a.z
 
-    if (IsZeroVector(p43_x) and 
-        IsZeroVector(p43_y) and 
-        IsZeroVector(p43_z)):
+    if abs(p43_x) < eps and abs(p43_y) < eps and abs(p43_z) < eps:
         return res
 
     p21_x = p1b.x - p1a.x
     p21_y = p1b.y - p1a.y
     p21_z = p1b.z - p1a.z
 
-    if (IsZeroVector(p21_x) and 
-        IsZeroVector(p21_y) and 
-        IsZeroVector(p21_z)):
+    if abs(p21_x) < eps and abs(p21_y) < eps and abs(p21_z) < eps:
         return res
 
     p13_x = p1a.x - p2a.x
@@ -866,7 +2302,7 @@ def LineLineDistance(p1a, p1b, p2a, p2b):
 
     denom = d2121 * d4343 - d4321 * d4321
 
-    if IsZeroVector(denom):
+    if abs(denom) < eps:
         return res
 
     mua = (d1343 * d4321 - d1321 * d4343) / denom
@@ -880,6 +2316,205 @@ def LineLineDistance(p1a, p1b, p2a, p2b):
                        p2a.z + mub * p43_z))
 
 
+def SegmentsClosestPoints(p1a, p1b, p2a, p2b):
+    """ Computes the closest points between N pairs of segments.
+        
+        Unlike :py:func:`LineLineDistance` the closest points are 
+        clamped to the extents of the segments. Degenerate segments
+        (points) are handled as well.
+        
+        :param p1a: start points of the first segments, shape ``(N, 3)``.
+        :param p1b: end points of the first segments.
+        :param p2a: start points of the second segments.
+        :param p2b: end points of the second segments.
+        
+        :return: ``tuple`` of ``(c1, c2, s, t, dist)`` where ``c1`` and ``c2``
+            are the closest points on each segment, ``s`` and ``t`` their 
+            parameters in range ``0..1`` and ``dist`` the distances.
+    """
+    _RequireNumpy()
+    pa = VectorsToArray(p1a)
+    pb = VectorsToArray(p2a)
+    d1 = VectorsToArray(p1b) - pa
+    d2 = VectorsToArray(p2b) - pb
+    r = pa - pb
+    a = (d1 * d1).sum(axis=1)
+    e = (d2 * d2).sum(axis=1)
+    f = (d2 * r).sum(axis=1)
+    c = (d1 * r).sum(axis=1)
+    b = (d1 * d2).sum(axis=1)
+    # tolerances relative to the segment lengths, so that the 
+    # result doesn't depend on the scale of the scene
+    ref = np.maximum(a, e)
+    adeg = a <= eps * ref
+    edeg = e <= eps * ref
+    sa = np.where(adeg, 1.0, a)
+    se = np.where(edeg, 1.0, e)
+    denom = a * e - b * b
+    # denom is a * e * sin(angle)^2
+    skew = denom > eps * a * e
+    sdenom = np.where(skew, denom, 1.0)
+    # general case, s on the infinite lines then clamped
+    s = np.where(skew, np.clip((b * f - c * e) / sdenom, 0.0, 1.0), 0.0)
+    t = (b * s + f) / se
+    # t out of range: clamp t and recompute s
+    s = np.where(t < 0.0, np.clip(-c / sa, 0.0, 1.0), 
+                 np.where(t > 1.0, np.clip((b - c) / sa, 0.0, 1.0), s))
+    t = np.clip(t, 0.0, 1.0)
+    # degenerate segments
+    s = np.where(edeg, np.clip(-c / sa, 0.0, 1.0), s)
+    t = np.where(edeg, 0.0, t)
+    t = np.where(adeg & ~edeg, np.clip(f / se, 0.0, 1.0), t)
+    s = np.where(adeg, 0.0, s)
+    c1 = pa + d1 * s[:, np.newaxis]
+    c2 = pb + d2 * t[:, np.newaxis]
+    diff = c1 - c2
+    dist = np.sqrt((diff * diff).sum(axis=1))
+    return (c1, c2, s, t, dist)
+
+
+def _SegmentArrays(e):
+    """ Return ``(starts, ends)`` for ``(N, 2, 3)`` segment arrays or a ``tuple`` of ``(starts, ends)``. """
+    if isinstance(e, tuple):
+        return (VectorsToArray(e[0]), VectorsToArray(e[1]))
+    segs = np.asarray(e, dtype=np.float64)
+    if segs.ndim != 3 or segs.shape[1:] != (2, 3):
+        raise ValueError("E: expected segments of shape (N, 2, 3), got %r" % (segs.shape,))
+    return (segs[:, 0, :], segs[:, 1, :])
+
+
+# boxes overlapping more grid cells are tested against all others instead
+_GRID_MAX_CELLS = 64
+
+
+def _GridEntries(lo, hi, cell, origin):
+    """ Enumerate ``(cell key, segment index)`` pairs for all grid cells 
+        overlapped by the boxes ``lo..hi``. 
+        
+        Boxes overlapping more than ``_GRID_MAX_CELLS`` cells are left 
+        out. Their indices are returned as third item.
+    """
+    clo = np.floor((lo - origin) / cell).astype(np.int64)
+    chi = np.floor((hi - origin) / cell).astype(np.int64)
+    span = chi - clo + 1
+    counts = span.prod(axis=1)
+    big = np.nonzero(counts > _GRID_MAX_CELLS)[0]
+    counts[big] = 0
+    total = int(counts.sum())
+    idx = np.repeat(np.arange(len(lo)), counts)
+    local = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    sp = span[idx]
+    ox = local // (sp[:, 1] * sp[:, 2])
+    oy = (local // sp[:, 2]) % sp[:, 1]
+    oz = local % sp[:, 2]
+    cells = clo[idx] + np.column_stack((ox, oy, oz))
+    return (cells, idx, big)
+
+
+def _BoxPairs(lo1, hi1, lo2, hi2):
+    """ Indices of all pairs of overlapping boxes, compared in chunks 
+        of about a million pairs. 
+    """
+    result1 = [np.zeros(0, dtype=np.int64)]
+    result2 = [np.zeros(0, dtype=np.int64)]
+    step = max(1, 1048576 // max(len(lo2), 1))
+    for start in xrange(0, len(lo1), step):
+        clo = lo1[start:start + step, np.newaxis, :]
+        chi = hi1[start:start + step, np.newaxis, :]
+        overlap = ((clo <= hi2[np.newaxis, :, :]) & (lo2[np.newaxis, :, :] <= chi)).all(axis=2)
+        i, j = np.nonzero(overlap)
+        result1.append(i + start)
+        result2.append(j)
+    return (np.concatenate(result1), np.concatenate(result2))
+
+
+def CloseSegmentPairs(sa, sb=None, threshold=1.0):
+    """ Find all pairs of segments that are closer than ``threshold``.
+    
+        A uniform grid is used as broad phase, so only segments sharing
+        a grid cell are handed to :py:func:`SegmentsClosestPoints`.
+        The cell size follows the median segment length. Segments much 
+        longer than that aren't put into the grid but have their 
+        bounding boxes tested against those of all other segments.
+    
+        :param sa: segments as ``(N, 2, 3)`` array or ``tuple`` of ``(starts, ends)``.
+        :param sb: second set of segments. If None, pairs within ``sa`` 
+            are searched instead and each pair is reported once.
+        :param float threshold: the maximum distance.
+        
+        :return: ``tuple`` of ``(ia, ib, dist)`` with the indices of the 
+            segments into ``sa`` and ``sb`` and their distances.
+    """
+    _RequireNumpy()
+    selfmode = sb is None
+    a0, a1 = _SegmentArrays(sa)
+    if selfmode:
+        b0, b1 = a0, a1
+    else:
+        b0, b1 = _SegmentArrays(sb)
+    empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0))
+    if len(a0) == 0 or len(b0) == 0:
+        return empty
+    half = 0.5 * threshold
+    alo = np.minimum(a0, a1) - half
+    ahi = np.maximum(a0, a1) + half
+    blo = np.minimum(b0, b1) - half
+    bhi = np.maximum(b0, b1) + half
+    extents = np.concatenate(((ahi - alo).max(axis=1), (bhi - blo).max(axis=1)))
+    cell = max(float(np.median(extents)), threshold, eps)
+    origin = np.minimum(alo.min(axis=0), blo.min(axis=0))
+    acells, aidx, abig = _GridEntries(alo, ahi, cell, origin)
+    if selfmode:
+        bcells, bidx, bbig = acells, aidx, abig
+    else:
+        bcells, bidx, bbig = _GridEntries(blo, bhi, cell, origin)
+    if len(acells) and len(bcells):
+        dims = np.maximum(acells.max(axis=0), bcells.max(axis=0)) + 1
+        akeys = (acells[:, 0] * dims[1] + acells[:, 1]) * dims[2] + acells[:, 2]
+        bkeys = (bcells[:, 0] * dims[1] + bcells[:, 1]) * dims[2] + bcells[:, 2]
+        order = np.argsort(bkeys, kind='mergesort')
+        bkeys = bkeys[order]
+        bidx = bidx[order]
+        start = np.searchsorted(bkeys, akeys, side='left')
+        counts = np.searchsorted(bkeys, akeys, side='right') - start
+        total = int(counts.sum())
+        ia = np.repeat(aidx, counts)
+        local = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        ib = bidx[np.repeat(start, counts) + local]
+    else:
+        ia, ib = empty[:2]
+    # segments too long for the grid
+    ias = [ia]
+    ibs = [ib]
+    if len(abig):
+        i, j = _BoxPairs(alo[abig], ahi[abig], blo, bhi)
+        ias.append(abig[i])
+        ibs.append(j)
+    if len(bbig) and not selfmode:
+        i, j = _BoxPairs(alo, ahi, blo[bbig], bhi[bbig])
+        ias.append(i)
+        ibs.append(bbig[j])
+    if len(ias) > 1:
+        ia = np.concatenate(ias)
+        ib = np.concatenate(ibs)
+    if selfmode:
+        ia, ib = np.minimum(ia, ib), np.maximum(ia, ib)
+        keep = ia < ib
+        ia = ia[keep]
+        ib = ib[keep]
+    if len(ia) == 0:
+        return empty
+    pairs = np.unique(ia * len(b0) + ib)
+    ia = pairs // len(b0)
+    ib = pairs % len(b0)
+    overlap = ((alo[ia] <= bhi[ib]) & (blo[ib] <= ahi[ia])).all(axis=1)
+    ia = ia[overlap]
+    ib = ib[overlap]
+    dist = SegmentsClosestPoints(a0[ia], a1[ia], b0[ib], b1[ib])[4]
+    close = dist <= threshold
+    return (ia[close], ib[close], dist[close])
+
+
 # These functions are from 3D Math Primer for Graphics And Game Development
 # courtesy of Fletcher Dunn and Ian Parberry.
 
@@ -907,6 +2542,27 @@ def SafeAcos(x):
     return math.acos(x)
 
 
+def WrapPiArray(theta):
+    """ Wrap an array of angles in range -pi...pi, like :py:func:`WrapPi`. 
+        
+        :return: a new ``numpy.ndarray``.
+    """
+    _RequireNumpy()
+    twoPi = 2.0 * math.pi
+    theta = np.asarray(theta, dtype=np.float64) + math.pi
+    theta -= np.floor(theta * (1.0 / twoPi)) * twoPi
+    theta -= math.pi
+    return theta
+
+
+def SafeAcosArray(x):
+    """ Same as ``numpy.arccos(x)`` but with x clamped to the valid 
+        range, like :py:func:`SafeAcos`.
+    """
+    _RequireNumpy()
+    return np.arccos(np.clip(x, -1.0, 1.0))
+
+
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
 #  You may obtain a copy of the License at
@@ -16,7 +16,7 @@ import os
 
 __version__ = (0, 6)
 __date__ = '2013-07-29'
-__updated__ = '2013-08-10'
+__updated__ = '2026-10-19'
 
 
 DEBUG = 0 or ('DebugLevel' in os.environ and os.environ['DebugLevel'] > 0)
@@ -29,7 +29,14 @@ except ImportError:
     if TESTRUN == 1:
         pass
 
-from py4dlib.maths import VAvg, UnitNormal, BBox
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from py4dlib.maths import VAvg, UnitNormal, BBox, Plane, RayTriangleIntersections, CloseSegmentPairs
+from py4dlib.maths import VectorsToArray, ArrayToVectors, TransformPoints, _RequireNumpy, eps
+from py4dlib.maths import OrientedBBoxFromPoints, BoundingSphereFromPoints, ConvexHull
 
 
 def TogglePolySelection(obj):
@@ -447,29 +454,77 @@ def CalcTriangleArea(p, obj):
 
 
 def CalcPolyArea(p, obj, normalized=False):
+    """ Calculate the area of a planar polygon.
+    
+        :param p: can be ``c4d.CPolygon`` or ``list<c4d.Vector>`` 
+            representing the points of the polygon. Passing the points
+            saves fetching all points of ``obj`` for each call.
+    """
     total = c4d.Vector(0, 0, 0)
-    ply = PolyToList(p)
-    lply = len(ply)
+    if isinstance(p, list):
+        pnts = p
+    else:
+        allp = obj.GetAllPoints()
+        pnts = [allp[i] for i in PolyToList(p)]
+    lply = len(pnts)
     if lply < 3:
         return 0
-    allp = obj.GetAllPoints()
     for i in range(0, lply):
-        v1 = allp[ply[i]]
-        if i is lply-1:
-            v2 = allp[ply[0]]
+        v1 = pnts[i]
+        if i == lply-1:
+            v2 = pnts[0]
         else:
-            v2 = allp[ply[i+1]]
+            v2 = pnts[i+1]
         prod = v1.Cross(v2)
         if normalized:
             prod.Normalize()
         total.x += prod.x
         total.y += prod.y
         total.z += prod.z
-    normal = UnitNormal(allp[ply[0]], allp[ply[1]], allp[ply[2]])
+    normal = UnitNormal(pnts[0], pnts[1], pnts[2])
     result = total.Dot(normal)
     return abs(result / 2)
 
 
+def _PolyDiagonals(e):
+    """ Cross product of the diagonals of every polygon in e, 
+        i.e. the Newell vector, with twice the polygon's area as length. """
+    pnts, polys = MeshToArrays(e)
+    a, b, c, d = [pnts[polys[:, i]] for i in xrange(4)]
+    return np.cross(c - a, d - b)
+
+
+def CalcPolyNormals(e):
+    """ Calculate the normals of all polygons at once.
+        
+        For planar polygons this gives the same result as 
+        :py:func:`CalcPolyNormal`.
+    
+        :param e: ``c4d.PolygonObject`` or ``tuple`` of ``(points, polys)``.
+        :return: ``tuple`` of ``(normals, valid)``, where ``normals`` has 
+            shape ``(M, 3)`` and is zero for degenerate polygons, for which 
+            ``valid`` is False.
+    """
+    n = _PolyDiagonals(e)
+    mag = np.sqrt((n * n).sum(axis=1))
+    valid = mag > 0.0
+    n[valid] /= mag[valid, np.newaxis]
+    n[~valid] = 0.0
+    return (n, valid)
+
+
+def CalcPolyAreas(e):
+    """ Calculate the areas of all polygons at once. 
+    
+        For planar polygons this gives the same result as :py:func:`CalcPolyArea`.
+        
+        :param e: ``c4d.PolygonObject`` or ``tuple`` of ``(points, polys)``.
+        :return: ``numpy.ndarray`` of shape ``(M,)``.
+    """
+    n = _PolyDiagonals(e)
+    return np.sqrt((n * n).sum(axis=1)) * 0.5
+
+
 def CalcBBox(e, selOnly=False, obj=None):
     """ Construct a :py:class:`BBox` for a ``c4d.PointObject``, a ``c4d.CPolygon``,
         or a list of polygon indices. If you have a list of point indices you can
@@ -512,6 +567,151 @@ def CalcBBox(e, selOnly=False, obj=None):
         raise TypeError("E: expected c4d.PointObject or c4d.CPolygon, but got %r" % (type(e)))
 
 
+def CalcOrientedBBox(e, selOnly=False, refine=True, obj=None):
+    """ Calculate an oriented bounding box, which is much tighter than
+        :py:func:`CalcBBox` for rotated parts.
+        
+        See :py:func:`py4dlib.maths.OrientedBBoxFromPoints` for the method.
+    
+        :param e: ``c4d.PointObject``, ``list<c4d.Vector>``, array of shape
+            ``(N, 3)`` or a list of point indices, in which case you must 
+            supply the object the indices belong to with ``obj``.
+        :param bool selOnly: if True, use selected points only if e is a 
+            ``c4d.PointObject``. Otherwise use all points of the object.
+        :param bool refine: run the rotating calipers refinement.
+        
+        :return: ``tuple`` of ``(m, rad)`` where ``m`` is a ``c4d.Matrix`` 
+            with the box center as offset and unit length axes and ``rad`` 
+            is a ``c4d.Vector`` with the half sizes along each axis. For
+            objects the box is given in the object's local space.
+    """
+    if isinstance(e, list) and len(e) > 0 and isinstance(e[0], int):
+        if not isinstance(obj, c4d.PointObject):
+            raise TypeError("E: expected c4d.PointObject, got %r" % (type(obj)))
+        pnts = VectorsToArray(obj.GetAllPoints())[e]
+    elif isinstance(e, c4d.PointObject):
+        pnts = VectorsToArray(e.GetAllPoints())
+        if selOnly is True:
+            pnts = pnts[np.nonzero(e.GetPointS().GetAll(len(pnts)))[0]]
+    else:
+        pnts = VectorsToArray(e)
+    frame, ext = OrientedBBoxFromPoints(pnts, refine=refine)
+    Vector = c4d.Vector
+    m = c4d.Matrix(*[Vector(x, y, z) for x, y, z in frame.tolist()])
+    return (m, Vector(*ext.tolist()))
+
+
+def _HierarchyPoints(obj):
+    """ Collect the global points of obj and all its children. 
+        Objects without points contribute the corners of their bounding box. 
+    """
+    result = []
+    stack = [obj]
+    while stack:
+        op = stack.pop()
+        child = op.GetDown()
+        while child:
+            stack.append(child)
+            child = child.GetNext()
+        if isinstance(op, c4d.PointObject):
+            if op.GetPointCount() > 0:
+                result.append(_GlobalPoints(op))
+            continue
+        rad = op.GetRad()
+        if rad.x == 0 and rad.y == 0 and rad.z == 0:
+            continue
+        mp = op.GetMp()
+        mg = op.GetMg()
+        corners = []
+        for sx in (-1, 1):
+            for sy in (-1, 1):
+                for sz in (-1, 1):
+                    corners.append(c4d.Vector(mp.x + sx * rad.x, mp.y + sy * rad.y, mp.z + sz * rad.z) * mg)
+        result.append(VectorsToArray(corners))
+    if len(result) == 0:
+        return np.zeros((0, 3), dtype=np.float64)
+    return np.vstack(result)
+
+
+def CalcBoundingSphere(e, selOnly=False, hierarchy=False, method="ritter", obj=None):
+    """ Calculate a bounding sphere, which is much cheaper to test against
+        than a box, e.g. for per-frame culling.
+        
+        See :py:func:`py4dlib.maths.BoundingSphereFromPoints` for the methods.
+    
+        :param e: ``c4d.BaseObject``, ``list<c4d.Vector>``, array of shape 
+            ``(N, 3)`` or a list of point indices, in which case you must 
+            supply the object the indices belong to with ``obj``.
+        :param bool selOnly: if True, use selected points only if e is 
+            a ``c4d.PointObject``.
+        :param bool hierarchy: if True, bound e and all its children in 
+            global space. Objects without points, such as primitives, 
+            contribute the corners of their bounding box.
+        :param str method: ``ritter`` (fast) or ``welzl`` (exact).
+        
+        :return: ``tuple`` of ``(center, radius)`` where the center is a 
+            ``c4d.Vector``. For a single object the sphere is given in the 
+            object's local space, for a hierarchy in global space.
+    """
+    if isinstance(e, list) and len(e) > 0 and isinstance(e[0], int):
+        if not isinstance(obj, c4d.PointObject):
+            raise TypeError("E: expected c4d.PointObject, got %r" % (type(obj)))
+        pnts = VectorsToArray(obj.GetAllPoints())[e]
+    elif hierarchy is True:
+        if not isinstance(e, c4d.BaseObject):
+            raise TypeError("E: expected c4d.BaseObject, got %r" % (type(e)))
+        pnts = _HierarchyPoints(e)
+    elif isinstance(e, c4d.PointObject):
+        pnts = VectorsToArray(e.GetAllPoints())
+        if selOnly is True:
+            pnts = pnts[np.nonzero(e.GetPointS().GetAll(len(pnts)))[0]]
+    else:
+        pnts = VectorsToArray(e)
+    center, radius = BoundingSphereFromPoints(pnts, method=method)
+    return (c4d.Vector(*center.tolist()), radius)
+
+
+def CalcConvexHull(e, selOnly=False, obj=None):
+    """ Calculate the convex hull of a point cloud, e.g. to build proxy
+        collision objects.
+        
+        See :py:func:`py4dlib.maths.ConvexHull` for the method.
+    
+        :param e: ``c4d.PointObject``, ``list<c4d.Vector>``, array of shape
+            ``(N, 3)`` or a list of point indices, in which case you must 
+            supply the object the indices belong to with ``obj``.
+        :param bool selOnly: if True, use selected points only if e is a 
+            ``c4d.PointObject``. Otherwise use all points of the object.
+        
+        :return: a new triangulated ``c4d.PolygonObject`` (not inserted 
+            into the document) if e was an object or a list of point 
+            indices, given in the object's local space. Otherwise a 
+            ``tuple`` of ``(points, polys)`` arrays that can be written 
+            with :py:func:`ArraysToMesh`.
+    """
+    _RequireNumpy()
+    asobj = False
+    if isinstance(e, np.ndarray):
+        pnts = VectorsToArray(e)
+    elif isinstance(e, list) and len(e) > 0 and isinstance(e[0], (int, long, np.integer)):
+        if not isinstance(obj, c4d.PointObject):
+            raise TypeError("E: expected c4d.PointObject, got %r" % (type(obj)))
+        pnts = VectorsToArray(obj.GetAllPoints())[e]
+        asobj = True
+    elif isinstance(e, c4d.PointObject):
+        pnts = VectorsToArray(e.GetAllPoints())
+        if selOnly is True:
+            pnts = pnts[np.nonzero(e.GetPointS().GetAll(len(pnts)))[0]]
+        asobj = True
+    else:
+        pnts = VectorsToArray(e)
+    verts, tris = ConvexHull(pnts)
+    polys = np.column_stack((tris, tris[:, 2]))
+    if asobj:
+        return ArraysToMesh(verts, polys)
+    return (verts, polys)
+
+
 def CalcGravityCenter(obj):
     """ Calculate the center of gravity for obj. """
     if not isinstance(obj, c4d.PointObject):
@@ -605,6 +805,346 @@ def ListListToPoly(lli):
                             lli[3][0], lli[3][1], lli[3][2])
 
 
+def PolysToArray(lp):
+    """ Convert a list of ``c4d.CPolygon`` to a ``numpy.ndarray`` 
+        of shape ``(N, 4)`` holding the point indices a, b, c, d.
+        
+        Triangles keep CINEMA 4D's convention of ``c == d``.
+    """
+    _RequireNumpy()
+    if isinstance(lp, np.ndarray):
+        return np.asarray(lp, dtype=np.int32).reshape(-1, 4)
+    if not isinstance(lp, list):
+        raise TypeError("E: expected list of c4d.CPolygons, got %r" % (type(lp)))
+    if len(lp) == 0:
+        return np.zeros((0, 4), dtype=np.int32)
+    return np.array([(p.a, p.b, p.c, p.d) for p in lp], dtype=np.int32)
+
+
+def MeshToArrays(e):
+    """ Take a snapshot of a ``c4d.PolygonObject`` as a pair of arrays.
+    
+        :param e: ``c4d.PolygonObject`` or a ``tuple`` of ``(points, polys)``
+            in which case the arrays are validated and returned.
+        :return: ``tuple`` of ``numpy.ndarray`` with points of shape ``(N, 3)`` 
+            and polygons of shape ``(M, 4)``.
+    """
+    _RequireNumpy()
+    if isinstance(e, tuple):
+        if len(e) != 2:
+            raise ValueError("E: expected tuple of (points, polys), got tuple of length %d" % len(e))
+        return (VectorsToArray(e[0]), PolysToArray(e[1]))
+    if not isinstance(e, c4d.PolygonObject):
+        raise TypeError("E: expected c4d.PolygonObject or tuple of (points, polys), got %r" % (type(e)))
+    return (VectorsToArray(e.GetAllPoints()), PolysToArray(e.GetAllPolygons()))
+
+
+def ArraysToMesh(points, polys, obj=None):
+    """ Write point and polygon arrays into a ``c4d.PolygonObject``. 
+    
+        Points are set with a single ``SetAllPoints`` call.
+        
+        :param obj: the object to write into. It will be resized 
+            to fit. If None, a new ``c4d.PolygonObject`` is created.
+        :return: the ``c4d.PolygonObject``.
+    """
+    _RequireNumpy()
+    pnts = VectorsToArray(points)
+    plys = PolysToArray(polys)
+    pcnt = len(pnts)
+    vcnt = len(plys)
+    if obj is None:
+        obj = c4d.PolygonObject(pcnt, vcnt)
+    elif not isinstance(obj, c4d.PolygonObject):
+        raise TypeError("E: expected c4d.PolygonObject, got %r" % (type(obj)))
+    else:
+        obj.ResizeObject(pcnt, vcnt)
+    obj.SetAllPoints(ArrayToVectors(pnts))
+    CPolygon = c4d.CPolygon
+    SetPolygon = obj.SetPolygon
+    for i, (a, b, c, d) in enumerate(plys.tolist()):
+        SetPolygon(i, CPolygon(a, b, c, d))
+    obj.Message(c4d.MSG_UPDATE)
+    return obj
+
+
+def _CompactMesh(points, polys):
+    """ Drop points not referenced by any polygon and remap the polygon indices. """
+    if len(polys) == 0:
+        return (np.zeros((0, 3), dtype=np.float64), np.zeros((0, 4), dtype=np.int32))
+    used, remap = np.unique(polys.ravel(), return_inverse=True)
+    return (points[used], remap.reshape(-1, 4).astype(np.int32))
+
+
+def _FanToPolys(loop):
+    """ Split a closed loop of point indices into quads and triangles. """
+    result = []
+    k = len(loop)
+    i = 1
+    while i < k - 1:
+        if i + 2 < k:
+            result.append((loop[0], loop[i], loop[i+1], loop[i+2]))
+            i += 2
+        else:
+            result.append((loop[0], loop[i], loop[i+1], loop[i+1]))
+            i += 1
+    return result
+
+
+def SliceMesh(e, plane, split=True, tolerance=eps):
+    """ Slice a mesh with a :py:class:`py4dlib.maths.Plane`.
+    
+        All polygons are classified in one vectorized pass as lying 
+        in front of the plane, at the back of the plane or spanning
+        the plane. Polygons lying on the plane count as front.
+        
+        If ``split`` is True, spanning polygons are cut along the 
+        plane. The new points are shared between neighboring polygons 
+        and between the two halves, so each half stays connected. 
+        Only the spanning polygons are processed one by one.
+        
+        :param e: ``c4d.PolygonObject`` or ``tuple`` of ``(points, polys)``
+            arrays as returned by :py:func:`MeshToArrays`. The plane is 
+            expected in the same (local) coordinate system as the points.
+        :param bool split: if True, return the two halves of the mesh. 
+            Otherwise return the polygon indices of each side.
+        :param float tolerance: points closer to the plane than this 
+            are considered to lie on the plane.
+        
+        :return: if ``split`` is True, a ``tuple`` of ``(front, back)`` 
+            where each half is a new ``c4d.PolygonObject`` (not inserted 
+            into the document) if ``e`` was an object or a ``tuple`` of 
+            ``(points, polys)`` arrays otherwise.
+            If ``split`` is False, a ``tuple`` of ``numpy.ndarray`` with 
+            the polygon indices ``(front, back, spanning)``.
+    """
+    if not isinstance(plane, Plane):
+        raise TypeError("E: expected py4dlib.maths.Plane, got %r" % (type(plane)))
+    points, polys = MeshToArrays(e)
+    dist = plane.PointDistances(points)
+    side = np.zeros(dist.shape, dtype=np.int8)
+    side[dist > tolerance] = 1
+    side[dist < -tolerance] = -1
+    ps = side[polys]
+    smin = ps.min(axis=1)
+    smax = ps.max(axis=1)
+    front = (smin >= 0)
+    back = (smax <= 0) & (smin < 0)
+    span = (smin < 0) & (smax > 0)
+    if split is False:
+        return (np.nonzero(front)[0], np.nonzero(back)[0], np.nonzero(span)[0])
+    spolys = polys[span]
+    ssides = ps[span]
+    # edges of spanning polygons in loop order: ab, bc, cd, da.
+    # for triangles cd is degenerate (c == d) and da equals ca.
+    ei = spolys
+    ej = np.roll(spolys, -1, axis=1)
+    crossing = (ssides * np.roll(ssides, -1, axis=1)) < 0
+    cuts = np.full(spolys.shape, -1, dtype=np.int64)
+    newpnts = np.zeros((0, 3), dtype=np.float64)
+    if crossing.any():
+        lo = np.minimum(ei, ej)[crossing].astype(np.int64)
+        hi = np.maximum(ei, ej)[crossing].astype(np.int64)
+        keys = lo * len(points) + hi
+        ukeys, inverse = np.unique(keys, return_inverse=True)
+        ulo = ukeys // len(points)
+        uhi = ukeys % len(points)
+        t = dist[ulo] / (dist[ulo] - dist[uhi])
+        newpnts = points[ulo] + t[:, np.newaxis] * (points[uhi] - points[ulo])
+        cuts[crossing] = len(points) + inverse
+    fpieces = []
+    bpieces = []
+    istri = spolys[:, 2] == spolys[:, 3]
+    for r, verts in enumerate(spolys.tolist()):
+        sides = ssides[r].tolist()
+        rcuts = cuts[r].tolist()
+        if istri[r]:
+            order = (0, 1, 3)
+        else:
+            order = (0, 1, 2, 3)
+        floop = []
+        bloop = []
+        for k in order:
+            s = sides[k]
+            if s >= 0:
+                floop.append(verts[k])
+            if s <= 0:
+                bloop.append(verts[k])
+            c = rcuts[k]
+            if c >= 0:
+                floop.append(c)
+                bloop.append(c)
+        if len(floop) >= 3:
+            fpieces.extend(_FanToPolys(floop))
+        if len(bloop) >= 3:
+            bpieces.extend(_FanToPolys(bloop))
+    allpnts = np.vstack((points, newpnts))
+    fpolys = np.vstack((polys[front], np.array(fpieces, dtype=np.int32).reshape(-1, 4)))
+    bpolys = np.vstack((polys[back], np.array(bpieces, dtype=np.int32).reshape(-1, 4)))
+    fmesh = _CompactMesh(allpnts, fpolys)
+    bmesh = _CompactMesh(allpnts, bpolys)
+    if isinstance(e, tuple):
+        return (fmesh, bmesh)
+    result = []
+    for suffix, mesh in (("front", fmesh), ("back", bmesh)):
+        obj = ArraysToMesh(mesh[0], mesh[1])
+        obj.SetName("%s %s" % (e.GetName(), suffix))
+        obj.SetMg(e.GetMg())
+        result.append(obj)
+    return tuple(result)
+
+
+def PolysToTriangles(polys):
+    """ Split a ``(M, 4)`` polygon array into triangles. 
+    
+        Quads ``abcd`` become the two triangles ``abc`` and ``acd``.
+        
+        :return: ``tuple`` of ``(tris, owner)`` where ``tris`` has shape 
+            ``(T, 3)`` and ``owner`` holds the index of the polygon each 
+            triangle was made from.
+    """
+    _RequireNumpy()
+    plys = PolysToArray(polys)
+    isquad = plys[:, 2] != plys[:, 3]
+    qidx = np.nonzero(isquad)[0]
+    tris = np.vstack((plys[:, :3], plys[qidx][:, (0, 2, 3)]))
+    owner = np.concatenate((np.arange(len(plys)), qidx))
+    order = np.argsort(owner, kind='mergesort')
+    return (tris[order], owner[order])
+
+
+def RayCastMesh(e, p, d, cull=False, chunksize=65536):
+    """ Find the nearest polygon hit by each ray.
+    
+        Useful for picking and visibility queries. The mesh is split 
+        into triangles with :py:func:`PolysToTriangles` and tested with
+        :py:func:`py4dlib.maths.RayTriangleIntersections`. Rays are 
+        processed in chunks so that no more than ``chunksize`` 
+        ray/triangle pairs are tested at once. Each pair takes about 
+        150 bytes of temporary arrays, so the default stays around 10 MB.
+        
+        :param e: ``c4d.PolygonObject`` or ``tuple`` of ``(points, polys)``.
+            Rays are expected in the object's local coordinates.
+        :param p: ray start positions of shape ``(R, 3)``.
+        :param d: ray directions of shape ``(R, 3)``.
+        
+        :return: ``tuple`` of ``(polys, t, hits)`` where ``polys`` holds 
+            the hit polygon index per ray (-1 for a miss), ``t`` the ray 
+            parameter (``inf`` for a miss) and ``hits`` the hit points.
+    """
+    points, plys = MeshToArrays(e)
+    tris, owner = PolysToTriangles(plys)
+    orig = VectorsToArray(p)
+    dirs = VectorsToArray(d)
+    nrays = len(orig)
+    result = np.full(nrays, -1, dtype=np.int64)
+    tbest = np.full(nrays, np.inf)
+    if len(tris) > 0:
+        a = points[tris[:, 0]]
+        b = points[tris[:, 1]]
+        c = points[tris[:, 2]]
+        step = max(1, chunksize // len(tris))
+        for start in xrange(0, nrays, step):
+            stop = min(start + step, nrays)
+            t = RayTriangleIntersections(orig[start:stop], dirs[start:stop], a, b, c, cull=cull)[0]
+            best = t.argmin(axis=1)
+            bt = t[np.arange(stop - start), best]
+            found = np.isfinite(bt)
+            tbest[start:stop] = bt
+            result[start:stop] = np.where(found, owner[best], -1)
+    with np.errstate(invalid='ignore'):
+        hits = orig + tbest[:, np.newaxis] * dirs
+    return (result, tbest, hits)
+
+
+def GetEdgeArray(e):
+    """ Return the unique edges of a mesh or the segments of a spline
+        as a ``numpy.ndarray`` of point index pairs of shape ``(E, 2)``.
+    
+        :param e: ``c4d.PolygonObject``, ``tuple`` of ``(points, polys)`` 
+            or any other ``c4d.PointObject`` such as a ``c4d.SplineObject``,
+            in which case consecutive points form the edges.
+    """
+    _RequireNumpy()
+    if isinstance(e, tuple) or isinstance(e, c4d.PolygonObject):
+        plys = MeshToArrays(e)[1]
+        edges = np.column_stack((plys.ravel(), np.roll(plys, -1, axis=1).ravel()))
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        if len(edges) == 0:
+            return np.zeros((0, 2), dtype=np.int32)
+        edges.sort(axis=1)
+        base = int(edges.max()) + 1
+        keys = np.unique(edges[:, 0].astype(np.int64) * base + edges[:, 1])
+        return np.column_stack((keys // base, keys % base)).astype(np.int32)
+    if not isinstance(e, c4d.PointObject):
+        raise TypeError("E: expected c4d.PointObject or tuple of (points, polys), got %r" % (type(e)))
+    pcnt = e.GetPointCount()
+    segments = []
+    if isinstance(e, c4d.SplineObject) and e.GetSegmentCount() > 0:
+        for i in xrange(e.GetSegmentCount()):
+            seg = e.GetSegment(i)
+            segments.append((seg['cnt'], seg['closed']))
+    else:
+        closed = isinstance(e, c4d.SplineObject) and e.IsClosed()
+        segments.append((pcnt, closed))
+    result = []
+    first = 0
+    for cnt, closed in segments:
+        idx = np.arange(first, first + cnt, dtype=np.int32)
+        if cnt > 1:
+            result.append(np.column_stack((idx[:-1], idx[1:])))
+            if closed and cnt > 2:
+                result.append(np.array([[idx[-1], idx[0]]], dtype=np.int32))
+        first += cnt
+    if len(result) == 0:
+        return np.zeros((0, 2), dtype=np.int32)
+    return np.vstack(result)
+
+
+def _GlobalPoints(e):
+    """ Points of ``e`` in global space, or the points of a ``(points, polys)`` tuple as is. """
+    if isinstance(e, tuple):
+        return VectorsToArray(e[0])
+    return TransformPoints(e.GetAllPoints(), e.GetMg())
+
+
+def FindCloseEdgePairs(e1, e2=None, threshold=1.0):
+    """ Find all pairs of edges closer than ``threshold``, e.g. for 
+        clearance checks between cables and geometry.
+        
+        Objects are compared in global space. Uses a grid based broad 
+        phase, see :py:func:`py4dlib.maths.CloseSegmentPairs`.
+    
+        :param e1: ``c4d.PointObject`` (polygon object or spline) or 
+            ``tuple`` of ``(points, polys)``. 
+        :param e2: a second object. If None, edges of ``e1`` are tested 
+            against each other, ignoring pairs that share a point.
+        :param float threshold: the maximum distance.
+        
+        :return: ``tuple`` of ``(edges1, edges2, dist)`` where ``edges1``
+            and ``edges2`` hold the point index pairs of each edge pair.
+    """
+    edges1 = GetEdgeArray(e1)
+    pnts1 = _GlobalPoints(e1)
+    segs1 = (pnts1[edges1[:, 0]], pnts1[edges1[:, 1]])
+    if e2 is None:
+        ia, ib, dist = CloseSegmentPairs(segs1, threshold=threshold)
+        edges2 = edges1
+        a = edges1[ia]
+        b = edges1[ib]
+        apart = ((a[:, 0] != b[:, 0]) & (a[:, 0] != b[:, 1]) & 
+                 (a[:, 1] != b[:, 0]) & (a[:, 1] != b[:, 1]))
+        ia = ia[apart]
+        ib = ib[apart]
+        dist = dist[apart]
+    else:
+        edges2 = GetEdgeArray(e2)
+        pnts2 = _GlobalPoints(e2)
+        segs2 = (pnts2[edges2[:, 0]], pnts2[edges2[:, 1]])
+        ia, ib, dist = CloseSegmentPairs(segs1, segs2, threshold=threshold)
+    return (edges1[ia], edges2[ib], dist)
+
+
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
 #  You may obtain a copy of the License at
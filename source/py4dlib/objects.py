@@ -15,9 +15,12 @@
 import os
 import re
 
+from bisect import bisect_left, insort
+from collections import OrderedDict
+
 __version__ = (0, 5)
 __date__ = '2012-09-27'
-__updated__ = '2013-08-10'
+__updated__ = '2026-10-19'
 
 
 DEBUG = 0 or ('DebugLevel' in os.environ and os.environ['DebugLevel'] > 0)
@@ -36,11 +39,122 @@ except ImportError:
     if TESTRUN == 1:
         pass
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from py4dlib.utils import UnescapeUnicode, EscapeUnicode, FuzzyCompareStrings, deprecated
-from py4dlib.maths import BBox
+from py4dlib.maths import BBox, TransformPoints, VectorsToArray, ArrayToVectors
 from py4dlib.mesh import CalcGravityCenter
 
 
+def ObjectKey(op):
+    """ Return a stable, hashable identity for ``op``.
+    
+    Python wrappers of ``c4d.BaseObject`` are recreated on each call to 
+    ``GetDown()``, ``GetNext()`` etc. and comparing them goes through 
+    ``__eq__``. The key can be used in sets and as dictionary key instead.
+    Uses ``GetGUID()`` where available, otherwise the object's hash, 
+    which is only stable as long as the same wrapper is used.
+    
+    :py:class:`ObjectHierarchy` change tracking, :py:class:`SceneIndex`
+    and :py:class:`BatchCreate` need ``GetGUID()``.
+    """
+    try:
+        return op.GetGUID()
+    except AttributeError:
+        return hash(op)
+
+
+def _IsStop(op, stops, others):
+    """ True if ``op`` is a stop object of :py:func:`WalkObjects`. """
+    if stops and ObjectKey(op) in stops:
+        return True
+    for obj in others:
+        if obj == op:
+            return True
+    return False
+
+
+def WalkObjects(start_obj, stop_obj=None, children_only=True, prune=None, startlvl=-1):
+    """
+    Generator for a depth first traversal of the object manager tree.
+    
+    Yields a tuple in the form (op, lvl, parents), where op is the current
+    ``c4d.BaseObject``, lvl is its depth level and parents is a tuple of 
+    its parent objects, starting with the top level object. Siblings share
+    the same parents tuple, so it is cheap to keep around.
+    
+    Reaching a stop object, or leaving the hierarchy of one, ends the 
+    traversal. Stop objects are kept in a set keyed by :py:func:`ObjectKey`,
+    so each step costs the same regardless of how many stop objects there are.
+    Stop objects without ``GetGUID()`` are compared with ``==`` instead.
+    
+    :param start_obj:       the object whose hierarchy should be iterated over
+    :param stop_obj:        an object or a list of objects at which traversal 
+                            should stop (optional)
+    :param children_only:   if True, iterate through the sub-hierarchy under
+                            start_obj only. This excludes start_obj from the 
+                            iteration. Otherwise start_obj is included and the
+                            traversal continues with the objects following it.
+    :param prune:           function taking an object. If it returns True, 
+                            the children of that object are skipped. 
+    :param startlvl:        base indentation level 
+    """
+    if start_obj is None:
+        return
+    if isinstance(stop_obj, (list, tuple, set)):
+        stop_objs = [obj for obj in stop_obj if obj is not None]
+    elif stop_obj is not None:
+        stop_objs = [stop_obj]
+    else:
+        stop_objs = []
+    if children_only:
+        stop_objs.append(start_obj)
+    stops = set(ObjectKey(obj) for obj in stop_objs if hasattr(obj, 'GetGUID'))
+    # wrappers without a GUID can't be hashed reliably
+    others = [obj for obj in stop_objs if not hasattr(obj, 'GetGUID')]
+    check = bool(stops or others)
+    parents = []
+    up = start_obj.GetUp()
+    while up:
+        parents.append(up)
+        up = up.GetUp()
+    parents = tuple(reversed(parents))
+    lvl = startlvl + len(parents) + 1
+    op = start_obj
+    descend = True
+    if not children_only:
+        yield (op, lvl, parents)
+        descend = prune is None or not prune(op)
+    while True:
+        down = op.GetDown() if descend else None
+        if down is not None:
+            if check and _IsStop(down, stops, others):
+                return
+            parents = parents + (op,)
+            lvl += 1
+            op = down
+        else:
+            while True:
+                if check and _IsStop(op, stops, others):
+                    return
+                nxt = op.GetNext()
+                if nxt is not None:
+                    break
+                op = op.GetUp()
+                if op is None:
+                    return
+                parents = parents[:-1]
+                lvl -= 1
+            if check and _IsStop(nxt, stops, others):
+                return
+            op = nxt
+        yield (op, lvl, parents)
+        descend = prune is None or not prune(op)
+
+
 class ObjectIterator(object):
     """
     Iterator over specific objects in the object manager tree.
@@ -48,6 +162,9 @@ class ObjectIterator(object):
     Using a depth first traversal scheme, return a tuple in the form
     (op, lvl), where op is a c4d.BaseObject representing the current 
     object and lvl is an integer indicating the current depth level.
+    
+    See :py:func:`WalkObjects` for a generator that also yields the 
+    parents and can skip subtrees.
         
     :param start_obj:        the object whose hierarchy should be iterated over
     :param stop_obj:         an object or a list of objects at which traversal 
@@ -61,63 +178,24 @@ class ObjectIterator(object):
     def __init__(self, start_obj, stop_obj=None, children_only=True, startlvl=-1):
         super(ObjectIterator, self).__init__()
         self.curobj = start_obj
+        self.children_only = children_only
+        self.walk = WalkObjects(start_obj, stop_obj, children_only, startlvl=startlvl)
         # determine depth level within the hierarchy of start_obj
         op = start_obj
         while op:
             startlvl += 1
             op = op.GetUp()
         self.curlvl = startlvl
-        self.children_only = children_only
-        if children_only:
-            self.stop_objs = [start_obj]
-            self.init = False
-        else:
-            self.stop_objs = []
-            self.init = True
-        if stop_obj and isinstance(stop_obj, list):
-            self.stop_objs.extend(stop_obj)
-        elif stop_obj and isinstance(stop_obj, c4d.BaseObject):
-            self.stop_objs.append(stop_obj)
     
     def __iter__(self):
         return self
     
     # next() becomes __next__() in later Pythons
     def next(self):
-        op = self.curobj
-        if self.init is True:
-            self.init = False
-            return (self.curobj, self.curlvl)
-        if op == None:
-            raise StopIteration
-        if op.GetDown():
-            if op.GetNext() in self.stop_objs or \
-               op.GetDown() in self.stop_objs:
-                raise StopIteration
-            self.curlvl += 1
-            self.curobj = op.GetDown()
-            return (self.curobj, self.curlvl)
-        if op in self.stop_objs:
-            raise StopIteration
-        if self.stop_objs is None:
-            while not op.GetNext() and op.GetUp():
-                self.curlvl -= 1
-                op = op.GetUp()
-        else:
-            while not op.GetNext() and op.GetUp():
-                if (op in self.stop_objs) or \
-                   (op.GetUp() in self.stop_objs):
-                    raise StopIteration
-                self.curlvl -= 1
-                op = op.GetUp()
-        if op.GetNext():
-            if op.GetNext() in self.stop_objs:
-                raise StopIteration
-            self.curobj = op.GetNext()
-            return (self.curobj, self.curlvl)            
-        else:
-            raise StopIteration
-        return (self.curobj, self.curlvl)
+        op, lvl, _ = next(self.walk)
+        self.curobj = op
+        self.curlvl = lvl
+        return (op, lvl)
 
 
 class ObjectEntry(object):
@@ -161,6 +239,199 @@ class ObjectEntry(object):
             return NotImplemented
 
 
+# characters with a special meaning in regular expressions
+_RE_SPECIAL = frozenset('.^$*+?{}[]\\|()')
+
+# compiled path patterns, most recently used last
+_PATTERN_CACHE = OrderedDict()
+_PATTERN_CACHE_SIZE = 256
+
+
+def _CompilePath(path, sep, strict):
+    """ Turn a key path as accepted by :py:meth:`ObjectHierarchy.Get` into
+        a tuple of ``(regex, literal, prefix)``. 
+        
+        ``literal`` is the pattern if it has no special characters, else None. 
+        ``prefix`` is the literal text all matching keys must start with. 
+        Results are kept in a LRU cache.
+    """
+    cachekey = (path, sep, strict)
+    result = _PATTERN_CACHE.pop(cachekey, None)
+    if result is not None:
+        _PATTERN_CACHE[cachekey] = result
+        return result
+    try:
+        path = UnescapeUnicode(path.strip())
+    except UnicodeEncodeError:
+        path = path.strip()
+    if path[-1] == sep:
+        path = path[:-1] 
+    if '..' in path:
+        comps = path.split(sep)
+        resolved_comps = []
+        skip = False
+        for comp in reversed(comps):
+            if comp == '..':
+                skip = True
+                continue
+            if skip:
+                skip = False
+                continue
+            resolved_comps.append(comp)
+        resolved_comps.reverse()
+        path = sep.join(resolved_comps)
+    if path[0] == '!': 
+        # hint to take path as a verbatim re pattern
+        pat = path[1:]
+    else:
+        # wildcard version
+        pat = path.replace(r'\\', '\\')
+        pat = pat.replace('?', '.').replace('*', '.*?')
+    if DEBUG: 
+        print("path = %r" % (path))
+        print("pat = %r" % (pat))     
+    if strict is True:
+        regex = re.compile('^%s$' % pat, re.UNICODE).match
+    else:
+        regex = re.compile(pat, re.UNICODE).search
+    end = 0
+    while end < len(pat) and pat[end] not in _RE_SPECIAL:
+        end += 1
+    literal = pat if end == len(pat) else None
+    prefix = None
+    # alternatives and inline flags can make any prefix invalid
+    if strict is True and '|' not in pat and '(?' not in pat:
+        if end < len(pat) and pat[end] in '*?{':
+            # the quantifier makes the last char optional
+            end -= 1
+        prefix = pat[:end]
+    result = (regex, literal, prefix)
+    _PATTERN_CACHE[cachekey] = result
+    if len(_PATTERN_CACHE) > _PATTERN_CACHE_SIZE:
+        _PATTERN_CACHE.popitem(last=False)
+    return result
+
+
+class _PathIndex(object):
+    """
+    Index over the keys of :py:attr:`ObjectHierarchy.entries`.
+    
+    Keys are normalized with :py:func:`UnescapeUnicode` once and kept in
+    a sorted list, so that keys starting with a literal prefix are found 
+    by bisection. Each key has an ordinal that gives the order results 
+    are returned in.
+    """
+    def __init__(self, entries):
+        super(_PathIndex, self).__init__()
+        self.entries = entries
+        self.count = 0
+        self.ordinals = {}
+        self.normalized = {}
+        self.exact = {}
+        self.sorted = []
+        # keys that can't be compared with unicode strings
+        self.odd = set()
+        self.next = 0
+        for key in entries.keys():
+            self.Add(key)
+
+    def Add(self, key):
+        if key in self.ordinals:
+            return
+        try:
+            norm = UnescapeUnicode(key)
+        except UnicodeEncodeError:
+            norm = key
+        ordinal = self.next
+        self.next += 1
+        self.count += 1
+        self.ordinals[key] = ordinal
+        self.normalized[key] = norm
+        self.exact.setdefault(norm, []).append(key)
+        if isinstance(norm, unicode):
+            insort(self.sorted, (norm, ordinal, key))
+        else:
+            self.odd.add(key)
+
+    def Remove(self, key):
+        ordinal = self.ordinals.pop(key, None)
+        if ordinal is None:
+            return
+        self.count -= 1
+        norm = self.normalized.pop(key)
+        keys = self.exact[norm]
+        keys.remove(key)
+        if not keys:
+            del self.exact[norm]
+        if key in self.odd:
+            self.odd.discard(key)
+        else:
+            i = bisect_left(self.sorted, (norm, ordinal))
+            del self.sorted[i]
+
+    def IsStale(self, entries):
+        return entries is not self.entries or len(entries) != self.count
+
+    def Match(self, regex, literal, prefix):
+        """ Return the keys matching the compiled path, in ordinal order. """
+        if literal is not None and prefix is not None:
+            # strict and literal: '$' also matches before a trailing newline
+            candidates = self.exact.get(literal, []) + self.exact.get(literal + '\n', [])
+        elif prefix:
+            try:
+                prefix = unicode(prefix)
+            except UnicodeDecodeError:
+                prefix = None
+            if prefix is None:
+                candidates = self.ordinals.keys()
+            else:
+                lo = bisect_left(self.sorted, (prefix,))
+                try:
+                    # first string after all strings starting with prefix
+                    end = prefix[:-1] + unichr(ord(prefix[-1]) + 1)
+                    hi = bisect_left(self.sorted, (end,), lo)
+                except ValueError:
+                    hi = len(self.sorted)
+                candidates = [key for _, _, key in self.sorted[lo:hi]]
+                candidates.extend(self.odd)
+        else:
+            candidates = self.ordinals.keys()
+        normalized = self.normalized
+        if literal is not None and prefix is None:
+            result = []
+            for key in candidates:
+                norm = normalized[key]
+                if key in self.odd:
+                    if regex(norm):
+                        result.append(key)
+                elif literal in norm:
+                    result.append(key)
+        else:
+            result = [key for key in candidates if regex(normalized[key])]
+        ordinals = self.ordinals
+        result.sort(key=lambda key: ordinals[key])
+        return result
+
+
+class _HierarchyNode(object):
+    """
+    Tracking state of one object walked by an :py:class:`ObjectHierarchy`.
+    
+    ``prefix`` is the key built from the names of the object's parents
+    (None for top level objects), ``path`` the key its children are 
+    listed under. ``path`` is only built once the object has children.
+    """
+    __slots__ = ('key', 'op', 'parent', 'name', 'prefix', 'path', 
+                 'dirty', 'lvl', 'listed', 'children')
+    
+    @property
+    def entry(self):
+        """ The key the object itself is listed under. """
+        if self.prefix is None:
+            return self.name
+        return self.prefix
+
+
 class ObjectHierarchy(object):
     """
     Represents a hierarchical group structure in the object manager.
@@ -185,40 +456,429 @@ class ObjectHierarchy(object):
     """
     def __init__(self, root_obj=None, filter_type=None, children_only=False):
         super(ObjectHierarchy, self).__init__()
+        doc = None
         if root_obj is None:
             doc = c4d.documents.GetActiveDocument()
             root_obj = doc.GetFirstObject()
             children_only = False
         self.children_only = children_only
         self.root = root_obj
+        self.doc = doc
+        self.filter_type = filter_type
         self.maxlvl = -1
         sep = '/'
         hierarchy = {}
-        for op, lvl in ObjectIterator(root_obj, children_only=children_only):
+        # parent path keys for the current path, keys[i] being 
+        # the key for the first i + 1 parents. Siblings share the
+        # key, so each key is built once from its parent's key.
+        keys = []
+        interned = {}
+        for op, lvl, parents in WalkObjects(root_obj, children_only=children_only):
+            depth = len(parents)
+            if depth < len(keys):
+                del keys[depth:]
+            elif depth > len(keys):
+                # only the first step can be more than one level deeper
+                for parent in parents[len(keys):]:
+                    if keys:
+                        key = keys[-1] + sep + parent.GetName()
+                    else:
+                        key = parent.GetName()
+                    keys.append(interned.setdefault(key, key))
             if ((filter_type is None) or 
                 (filter_type and op.GetType() == filter_type)):
-                plist = []
-                opp = op
-                i = lvl  # IGNORE:W0612
-                while opp:
-                    opp = opp.GetUp()
-                    if opp:
-                        oppname = opp.GetName()
-                        i -= 1
-                        pentry = oppname
-                        plist.append(pentry)
-                if len(plist) == 0:
-                    plist.append(op.GetName())
-                plist.reverse()
-                parent_path = sep.join(plist)
-                if parent_path not in hierarchy:
-                    hierarchy[parent_path] = []
-                hierarchy[parent_path].append(op)
+                if depth == 0:
+                    parent_path = op.GetName()
+                else:
+                    parent_path = keys[-1]
+                entry = hierarchy.get(parent_path)
+                if entry is None:
+                    entry = hierarchy[parent_path] = []
+                entry.append(op)
             if lvl > self.maxlvl:
                 self.maxlvl = lvl
         self.sep = sep
         self.entries = hierarchy
+        # tracking state for Refresh(), created on first use
+        self._nodes = None
+    
+    def _Build(self):
+        self.maxlvl = -1
+        self.entries = {}
+        self._index = None
+        # keyed by ObjectKey
+        self._nodes = {}
+        # node keys by the path their children are listed under
+        self._sources = {}
+        # number of walked objects per depth level
+        self._levels = {}
+        self._tops = []
+        self._flags = c4d.DIRTYFLAGS_CHILDREN | c4d.DIRTYFLAGS_DATA
+        if self.doc is not None:
+            self.root = self.doc.GetFirstObject()
+        root = self.root
+        if root is None:
+            return
+        parents = []
+        up = root.GetUp()
+        while up:
+            parents.append(up)
+            up = up.GetUp()
+        parents.reverse()
+        # prefixes[i] is the key for the first i parents
+        prefixes = [None]
+        for parent in parents:
+            prefixes.append(self._Join(prefixes[-1], parent.GetName()))
+        lvl = len(parents)
+        if self.children_only:
+            self._tops.append(self._Track(root, None, prefixes[lvl], lvl, False))
+            return
+        # the root, the objects following it and those following its parents
+        op = root
+        while True:
+            while op:
+                self._tops.append(self._Track(op, None, prefixes[lvl], lvl, True))
+                op = op.GetNext()
+            if lvl == 0:
+                break
+            lvl -= 1
+            op = parents[lvl].GetNext()
+    
+    def _Join(self, prefix, name):
+        if prefix is None:
+            return name
+        return prefix + self.sep + name
+    
+    def _Track(self, op, parent, prefix, lvl, listed, affected=None):
+        """
+        Walk ``op`` and its children, creating their tracking state.
         
+        While building, listed objects are added to the entries right away. 
+        Otherwise the keys whose entries need to be rebuilt are added to 
+        ``affected``. Returns the key of ``op``.
+        """
+        top = self._AddNode(op, parent, prefix, lvl, listed, affected)
+        sources = self._sources
+        stack = [top]
+        # siblings share their parent's path, so each path is built once
+        for child, childlvl, _ in WalkObjects(op):
+            depth = childlvl - lvl
+            if depth < len(stack):
+                del stack[depth:]
+            pnode = stack[-1]
+            path = pnode.path
+            if path is None:
+                path = pnode.path = self._Join(pnode.prefix, pnode.name)
+                sources.setdefault(path, []).append(pnode.key)
+            node = self._AddNode(child, pnode.key, path, childlvl, True, affected)
+            if pnode.children is None:
+                pnode.children = [node.key]
+            else:
+                pnode.children.append(node.key)
+            stack.append(node)
+        return top.key
+    
+    def _AddNode(self, op, parent, prefix, lvl, listed, affected):
+        key = ObjectKey(op)
+        nodes = self._nodes
+        if affected is not None and key in nodes:
+            # moved here from a part of the tree that hasn't been refreshed yet
+            self._Untrack(key, affected)
+        filter_type = self.filter_type
+        node = _HierarchyNode()
+        node.key = key
+        node.op = op
+        node.parent = parent
+        node.name = op.GetName()
+        node.prefix = prefix
+        node.path = None
+        node.dirty = op.GetDirty(self._flags)
+        node.lvl = lvl
+        node.listed = listed and ((filter_type is None) or 
+                                  (filter_type and op.GetType() == filter_type))
+        node.children = None
+        nodes[key] = node
+        if parent is None:
+            node.path = self._Join(prefix, node.name)
+            self._sources.setdefault(node.path, []).append(key)
+        if listed:
+            levels = self._levels
+            levels[lvl] = levels.get(lvl, 0) + 1
+            if lvl > self.maxlvl:
+                self.maxlvl = lvl
+        if node.listed:
+            if affected is None:
+                entry = self.entries.get(node.entry)
+                if entry is None:
+                    entry = self.entries[node.entry] = []
+                entry.append(op)
+            else:
+                affected.add(node.entry)
+        return node
+    
+    def _Untrack(self, key, affected):
+        """ Drop the tracking state of an object and its children. """
+        nodes = self._nodes
+        sources = self._sources
+        levels = self._levels
+        stack = [key]
+        while stack:
+            key = stack.pop()
+            node = nodes.pop(key)
+            if node.listed:
+                affected.add(node.entry)
+            if not (self.children_only and node.parent is None):
+                levels[node.lvl] -= 1
+                if not levels[node.lvl]:
+                    del levels[node.lvl]
+            if node.path is not None:
+                self._RemoveSource(node)
+                affected.add(node.path)
+            for childkey in node.children or ():
+                child = nodes.get(childkey)
+                if child is not None and child.parent == key:
+                    stack.append(childkey)
+    
+    def _RemoveSource(self, node):
+        keys = self._sources.get(node.path)
+        if keys and node.key in keys:
+            keys.remove(node.key)
+            if not keys:
+                del self._sources[node.path]
+    
+    def _Rename(self, node, name, affected):
+        """ Apply a name change to the paths of ``node`` and its children. """
+        if node.listed and node.prefix is None:
+            affected.add(node.name)
+            affected.add(name)
+        node.name = name
+        nodes = self._nodes
+        sources = self._sources
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.path is None:
+                continue
+            self._RemoveSource(node)
+            affected.add(node.path)
+            node.path = self._Join(node.prefix, node.name)
+            sources.setdefault(node.path, []).append(node.key)
+            affected.add(node.path)
+            for childkey in node.children or ():
+                child = nodes.get(childkey)
+                if child is not None and child.parent == node.key:
+                    child.prefix = node.path
+                    stack.append(child)
+    
+    def _SyncChildren(self, parent, ops, affected):
+        """ 
+        Bring the tracked children of ``parent`` (None for the top level 
+        objects of the document) in line with ``ops``.
+        """
+        nodes = self._nodes
+        if parent is None:
+            pkey = prefix = None
+            lvl = 0
+            old = self._tops
+        else:
+            pkey = parent.key
+            lvl = parent.lvl + 1
+            old = parent.children or []
+            if parent.path is None:
+                parent.path = self._Join(parent.prefix, parent.name)
+                self._sources.setdefault(parent.path, []).append(pkey)
+            prefix = parent.path
+        keys = [ObjectKey(op) for op in ops]
+        current = set(keys)
+        kept = []
+        for key in old:
+            node = nodes.get(key)
+            if node is None or node.parent != pkey:
+                continue
+            if key in current:
+                kept.append(key)
+            else:
+                self._Untrack(key, affected)
+        keptset = set(kept)
+        if kept != [key for key in keys if key in keptset]:
+            # reordered: entries gathered from more than one of these
+            # subtrees have to be sorted again
+            self._Reordered(kept, affected)
+        for op, key in zip(ops, keys):
+            node = nodes.get(key)
+            if node is None or node.parent != pkey:
+                self._Track(op, pkey, prefix, lvl, True, affected)
+        if parent is None:
+            self._tops = keys
+            for key in keys:
+                if nodes[key].listed:
+                    affected.add(nodes[key].entry)
+        else:
+            parent.children = keys or None
+            affected.add(prefix)
+    
+    def _Reordered(self, keys, affected):
+        nodes = self._nodes
+        sources = self._sources
+        stack = list(keys)
+        while stack:
+            key = stack.pop()
+            node = nodes[key]
+            if node.path is None:
+                continue
+            if len(sources.get(node.path, ())) > 1:
+                affected.add(node.path)
+            for childkey in node.children or ():
+                child = nodes.get(childkey)
+                if child is not None and child.parent == key:
+                    stack.append(childkey)
+    
+    def _Order(self, key):
+        """ Position of a tracked object in a depth first traversal, as a list. """
+        nodes = self._nodes
+        order = []
+        node = nodes[key]
+        while node.parent is not None:
+            parent = nodes[node.parent]
+            order.append(parent.children.index(node.key))
+            node = parent
+        order.append(self._tops.index(node.key))
+        order.reverse()
+        return order
+    
+    def _Update(self, keys):
+        """ Rebuild the entries for ``keys`` from the tracking state. """
+        nodes = self._nodes
+        entries = self.entries
+        index = getattr(self, '_index', None)
+        for key in keys:
+            result = []
+            sources = self._sources.get(key)
+            if sources:
+                if len(sources) > 1:
+                    sources.sort(key=self._Order)
+                for sourcekey in sources:
+                    source = nodes[sourcekey]
+                    if source.parent is None and source.prefix is None and source.listed:
+                        result.append(source.op)
+                    for childkey in source.children or ():
+                        child = nodes.get(childkey)
+                        if child is not None and child.parent == sourcekey and child.listed:
+                            result.append(child.op)
+            if result:
+                if index is not None and key not in entries:
+                    index.Add(key)
+                entries[key] = result
+            elif key in entries:
+                del entries[key]
+                if index is not None:
+                    index.Remove(key)
+        self.maxlvl = max(self._levels) if self._levels else -1
+    
+    def _EntryKeys(self):
+        return dict((k, [ObjectKey(op) for op in v]) for k, v in self.entries.items())
+    
+    def _RootUnchanged(self):
+        """ True if the root of a ``children_only`` hierarchy wasn't moved or renamed. """
+        if not self.children_only or not self._tops:
+            return False
+        node = self._nodes.get(self._tops[0])
+        if node is None or node.op.GetName() != node.name:
+            return False
+        names = []
+        up = node.op.GetUp()
+        while up:
+            names.append(up.GetName())
+            up = up.GetUp()
+        prefix = None
+        for name in reversed(names):
+            prefix = self._Join(prefix, name)
+        return prefix == node.prefix and len(names) == node.lvl
+    
+    def Refresh(self):
+        """
+        Bring the hierarchy up to date with the scene.
+        
+        Instead of walking the whole tree again, compares the dirty 
+        checksum (``DIRTYFLAGS_CHILDREN | DIRTYFLAGS_DATA``) of each 
+        object against the one it had when last walked. Only the children 
+        of objects that changed are walked again, and only the entries 
+        that changed are rebuilt. The path index used by :py:meth:`Get` 
+        is patched in place.
+        
+        When the hierarchy was created for the whole document, the list
+        of top level objects is compared as well. Hierarchies created 
+        with a ``root_obj`` and ``children_only=False`` are rebuilt from 
+        scratch, as are those whose root object was moved or renamed.
+        
+        The first call walks the whole tree once more to record the 
+        dirty checksums, so creating a hierarchy that is never refreshed
+        costs nothing extra. If the root object was deleted, the 
+        hierarchy ends up empty.
+        
+        :return: True if any entries changed.
+        """
+        if self.doc is None and self.root is not None:
+            try:
+                self.root.GetName()
+            except ReferenceError:
+                # the root object was deleted
+                self.root = None
+        if self._nodes is None or (self.doc is None and (self.root is None or not self._RootUnchanged())):
+            try:
+                old = self._EntryKeys()
+            except ReferenceError:
+                old = None
+            self._Build()
+            return self._EntryKeys() != old
+        nodes = self._nodes
+        flags = self._flags
+        affected = set()
+        if self.doc is not None:
+            ops = []
+            op = self.doc.GetFirstObject()
+            while op:
+                ops.append(op)
+                op = op.GetNext()
+            self.root = ops[0] if ops else None
+            if [ObjectKey(op) for op in ops] != self._tops:
+                self._SyncChildren(None, ops, affected)
+        changed = []
+        deleted = []
+        for node in nodes.values():
+            try:
+                dirty = node.op.GetDirty(flags)
+            except ReferenceError:
+                deleted.append(node)
+                continue
+            if dirty != node.dirty:
+                changed.append((node.lvl, node, dirty))
+        # parents first, so that moved objects are only walked once
+        changed.sort(key=lambda item: item[0])
+        for _, node, dirty in changed:
+            if nodes.get(node.key) is not node:
+                continue
+            node.dirty = dirty
+            op = node.op
+            name = op.GetName()
+            if name != node.name:
+                self._Rename(node, name, affected)
+            ops = []
+            child = op.GetDown()
+            while child:
+                ops.append(child)
+                child = child.GetNext()
+            if [ObjectKey(child) for child in ops] != (node.children or []):
+                self._SyncChildren(node, ops, affected)
+        # usually dropped with their parent's children already
+        for node in deleted:
+            if nodes.get(node.key) is node:
+                self._Untrack(node.key, affected)
+        if not affected:
+            return False
+        self._Update(affected)
+        return True
+    
     def _strxform(self):
         result = "{"
         for k, v in self.entries.items():
@@ -275,55 +935,21 @@ class ObjectHierarchy(object):
         Returns a list of all objects for which 'path', expanded, matched a 
         concatenated parent path. Returns an empty list if no objects could be
         located for 'path'.
+        
+        Keys are indexed on first use. Literal paths are looked up directly, 
+        strict paths with a literal start (e.g. ``Group1/Cube*``) only test 
+        keys with that prefix. Other patterns test all keys.
         """
-        results = []
-        try:
-            path = UnescapeUnicode(path.strip())
-        except UnicodeEncodeError:
-            path = path.strip()
-        if path[-1] == self.sep:
-            path = path[:-1] 
-        if '..' in path:
-            comps = path.split(self.sep)
-            resolved_comps = []
-            skip = False
-            for comp in reversed(comps):
-                if comp == '..':
-                    skip = True
-                    continue
-                if skip:
-                    skip = False
-                    continue
-                resolved_comps.append(comp)
-            resolved_comps.reverse()
-            path = self.sep.join(resolved_comps)
-        if path[0] == '!': 
-            # hint to take path as a verbatim re pattern
-            pat = path[1:]
-        else:
-            # wildcard version
-            pat = re.escape(path)
-            # go back one escape level
-            pat = path.replace(r'\\', '\\')
-            pat = pat.replace('?', '.').replace('*', '.*?')
-        if strict is True:
-            pat = '^%s$' % pat
-            func = re.match
-        else:
-            pat = '%s' % pat
-            func = re.search
-        keys = [key for key in list(self.entries.keys()) if 
-                func(pat, UnescapeUnicode(key), flags=re.UNICODE)]
+        index = getattr(self, '_index', None)
+        if index is None or index.IsStale(self.entries):
+            index = self._index = _PathIndex(self.entries)
+        regex, literal, prefix = _CompilePath(path, self.sep, strict)
+        keys = index.Match(regex, literal, prefix)
         if DEBUG: 
-            print("path = %r" % (path))
-            print("pat = %r" % (pat))     
             print("keys = %r" % (keys)) 
-        try:
-            for key in keys:
-                result = self.entries.get(key)
-                results.extend(result)
-        except KeyError:
-            pass
+        results = []
+        for key in keys:
+            results.extend(self.entries[key])
         return results
      
           
@@ -474,11 +1100,18 @@ def FindObject(name, start=None, matchfunc=None, *args, **kwargs):
         will be passed a potential candidate object plus any 
         remaining args. It should return True or False.
     :type matchfunc: ``function``
+    :param index: keyword only. A :py:class:`SceneIndex` to search 
+        instead of walking the object tree.
+    :type index: ``SceneIndex``
     """
+    index = kwargs.pop('index', None)
     if name is None: return None
     if not isinstance(name, (str, unicode)):
         raise TypeError("E: expected string or unicode, got %s" % type(name))
-    doc = documents.GetActiveDocument()
+    if index is not None:
+        doc = index.doc
+    else:
+        doc = documents.GetActiveDocument()
     if not doc: return None
     result = None
     if start is None:
@@ -486,7 +1119,10 @@ def FindObject(name, start=None, matchfunc=None, *args, **kwargs):
     else:
         if isinstance(start, str):
             # warning: doesn't distinguish between objects with same name
-            startop = doc.SearchObject(start)
+            if index is not None:
+                startop = index.Find(start)
+            else:
+                startop = doc.SearchObject(start)
         elif isinstance(start, c4d.BaseObject):
             startop = start
         else:
@@ -495,6 +1131,13 @@ def FindObject(name, start=None, matchfunc=None, *args, **kwargs):
     if not startop: return None
     if start:
         print("Finding %s under %r" % (name, startop.GetName()))
+    if index is not None:
+        if matchfunc is None:
+            return index.Find(name, startop)
+        for obj in index.GetSubtree(startop):
+            if matchfunc(obj, *args, **kwargs) or obj.GetName() == name:
+                return obj
+        return result
     curname = startop.GetName()
     if startop:
         if matchfunc and matchfunc(startop, *args, **kwargs):
@@ -512,14 +1155,19 @@ def FindObject(name, start=None, matchfunc=None, *args, **kwargs):
     return result
 
 
-def FindObjects(name=None, uip=None):
+def FindObjects(name=None, uip=None, index=None):
     """ Find all objects in the scene, either with the name ``name`` 
         and/or the unique IP ``uip``.
+        
+        If ``index`` is a :py:class:`SceneIndex`, its tables are
+        used instead of walking the object tree.
     """
     if name is None and uip is None: 
         return None
     if not isinstance(name, (str, unicode)):
         raise TypeError("E: expected string or unicode, got %s" % type(name))
+    if index is not None:
+        return index.FindAll(name, uip)
     doc = documents.GetActiveDocument()
     if not doc: 
         return None
@@ -543,9 +1191,276 @@ def FindObjects(name=None, uip=None):
     return result
 
 
+class SceneIndex(object):
+    """
+    Lookup tables for the objects of a document, built in one traversal.
+    
+    Maps names, types, unique IPs and GUIDs to objects and objects to 
+    their depth level and parent. Pass it as ``index`` to :py:func:`FindObject` 
+    and :py:func:`FindObjects` to resolve many names without walking the 
+    object tree for each one.
+    
+    The tables are a snapshot of the scene. Call :py:meth:`Invalidate` 
+    after changing it, so the next lookup builds them again, or 
+    :py:meth:`Refresh` to have them built again only if the dirty 
+    checksum of an object or the list of top level objects changed.
+    
+    :param doc: the document to index. Defaults to the active document.
+    """
+    def __init__(self, doc=None):
+        super(SceneIndex, self).__init__()
+        if doc is None:
+            doc = documents.GetActiveDocument()
+        self.doc = doc
+        self.Build()
+    
+    def Build(self):
+        """ Walk the document once and fill the tables. """
+        flags = c4d.DIRTYFLAGS_CHILDREN | c4d.DIRTYFLAGS_DATA
+        # all objects in depth first order. The tables below 
+        # refer to objects by their position in this list.
+        objects = self.objects = []
+        names = self._names = {}
+        types = self._types = {}
+        uips = self._uips = {}
+        keys = self._keys = {}
+        lvls = self._lvls = []
+        parents = self._parents = []
+        # position after the last object of each object's subtree
+        ends = self._ends = []
+        dirty = self._dirty = []
+        tops = self._tops = []
+        # positions of the current object and its parents
+        stack = []
+        for op, lvl, _ in WalkObjects(self.doc.GetFirstObject(), children_only=False):
+            i = len(objects)
+            while stack and lvls[stack[-1]] >= lvl:
+                ends[stack.pop()] = i
+            parents.append(stack[-1] if stack else -1)
+            stack.append(i)
+            objects.append(op)
+            lvls.append(lvl)
+            ends.append(None)
+            key = ObjectKey(op)
+            keys[key] = i
+            if lvl == 0:
+                tops.append(key)
+            names.setdefault(op.GetName(), []).append(i)
+            types.setdefault(op.GetType(), []).append(i)
+            uips.setdefault(op.GetUniqueIP(), []).append(i)
+            dirty.append(op.GetDirty(flags))
+        for i in stack:
+            ends[i] = len(objects)
+        self._stale = False
+    
+    def Invalidate(self):
+        """ Mark the tables as outdated. They will be built again on the next lookup. """
+        self._stale = True
+    
+    def IsStale(self):
+        """ 
+        Return True if the index was invalidated, or if an object was 
+        changed, renamed, deleted, moved or inserted since it was built.
+        
+        Compares the dirty checksum (``DIRTYFLAGS_CHILDREN | DIRTYFLAGS_DATA``)
+        of each indexed object, plus the list of top level objects.
+        """
+        if self._stale:
+            return True
+        tops = []
+        op = self.doc.GetFirstObject()
+        while op:
+            tops.append(ObjectKey(op))
+            op = op.GetNext()
+        if tops != self._tops:
+            return True
+        flags = c4d.DIRTYFLAGS_CHILDREN | c4d.DIRTYFLAGS_DATA
+        try:
+            for op, dirty in zip(self.objects, self._dirty):
+                if op.GetDirty(flags) != dirty:
+                    return True
+        except ReferenceError:
+            return True
+        return False
+    
+    def Refresh(self):
+        """ 
+        Build the tables again if :py:meth:`IsStale`. 
+        
+        :return: True if they were built again.
+        """
+        if self.IsStale():
+            self.Build()
+            return True
+        return False
+    
+    def _Check(self):
+        if self._stale:
+            self.Build()
+    
+    def _Position(self, op):
+        self._Check()
+        i = self._keys.get(ObjectKey(op))
+        if i is None:
+            raise ValueError("E: object %r is not indexed" % op.GetName())
+        return i
+    
+    def __len__(self):
+        self._Check()
+        return len(self.objects)
+    
+    def __contains__(self, op):
+        self._Check()
+        return ObjectKey(op) in self._keys
+    
+    def Find(self, name, start=None):
+        """ 
+        Return the first object named ``name`` in depth first order, or None. 
+        
+        :param start: only search ``start`` and its children.
+        """
+        self._Check()
+        found = self._names.get(name)
+        if not found:
+            return None
+        if start is None:
+            return self.objects[found[0]]
+        i = self._Position(start)
+        j = bisect_left(found, i)
+        if j < len(found) and found[j] < self._ends[i]:
+            return self.objects[found[j]]
+        return None
+    
+    def FindAll(self, name=None, uip=None):
+        """ 
+        Return all objects with the name ``name`` and/or the unique IP ``uip``,
+        same as :py:func:`FindObjects`.
+        """
+        self._Check()
+        objects = self.objects
+        if name and uip:
+            found = set(self._uips.get(uip, ()))
+            return [objects[i] for i in self._names.get(name, ()) if i in found]
+        elif uip and name is None:
+            return [objects[i] for i in self._uips.get(uip, ())]
+        elif name and uip is None:
+            return [objects[i] for i in self._names.get(name, ())]
+        return []
+    
+    def GetByType(self, typ):
+        """ Return all objects of type ``typ``, e.g. ``c4d.Onull``. """
+        self._Check()
+        return [self.objects[i] for i in self._types.get(typ, ())]
+    
+    def GetByGUID(self, guid):
+        """ Return the object whose :py:func:`ObjectKey` is ``guid``, or None. """
+        self._Check()
+        i = self._keys.get(guid)
+        if i is None:
+            return None
+        return self.objects[i]
+    
+    def GetDepth(self, op):
+        """ Return the depth level of ``op``, 0 for top level objects. """
+        return self._lvls[self._Position(op)]
+    
+    def GetParent(self, op):
+        """ Return the parent of ``op``, or None for top level objects. """
+        parent = self._parents[self._Position(op)]
+        if parent < 0:
+            return None
+        return self.objects[parent]
+    
+    def GetSubtree(self, op):
+        """ Return ``op`` followed by all of its children, in depth first order. """
+        i = self._Position(op)
+        return self.objects[i:self._ends[i]]
+
+
+# open BatchCreate contexts, innermost last
+_BATCHES = []
+
+
+class BatchCreate(object):
+    """
+    Context manager for creating many objects at once.
+    
+    Inside the ``with`` block :py:func:`CreateObject` and 
+    :py:func:`InsertUnderNull` don't stop threads, insert objects, add 
+    undo steps or send events for each object. Instead threads are stopped
+    once on entering the block. On leaving it, the new objects are inserted 
+    into the document, their undo steps are added within a single 
+    ``StartUndo()``/``EndUndo()`` pair and one ``c4d.EventAdd()`` is sent.
+    
+    Since insertion is deferred, new objects can't be found in the 
+    document until the block ends. Objects that were placed somewhere 
+    in the meantime, e.g. with ``InsertUnderNull`` or ``InsertUnder``, 
+    stay there.
+    
+    Batches can be nested, in which case the outermost one does the work.
+    
+    :param doc:         the document. Defaults to the active document.
+    :param bool undo:   add undo steps for the new objects.
+    """
+    def __init__(self, doc=None, undo=True):
+        super(BatchCreate, self).__init__()
+        self.doc = doc
+        self.undo = undo
+        # (object, undo) tuples in creation order
+        self.objects = []
+        self._target = self
+    
+    def __enter__(self):
+        if _BATCHES:
+            self._target = _BATCHES[0]
+        else:
+            if self.doc is None:
+                self.doc = documents.GetActiveDocument()
+            c4d.StopAllThreads()
+            if self.undo:
+                self.doc.StartUndo()
+        _BATCHES.append(self)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        _BATCHES.remove(self)
+        if self._target is self:
+            self._Finish()
+        return False
+    
+    def Add(self, op, undo=True):
+        """ Insert ``op`` into the document when the batch ends. """
+        self._target.objects.append((op, undo))
+    
+    def _Finish(self):
+        doc = self.doc
+        try:
+            for op, _ in self.objects:
+                if op.GetUp() is None and op.GetDocument() is None:
+                    doc.InsertObject(op)
+            if self.undo:
+                new = [op for op, undo in self.objects 
+                       if undo and op.GetDocument() is not None]
+                keys = set(ObjectKey(op) for op in new)
+                for op in new:
+                    # undoing the creation of a parent removes its children too
+                    up = op.GetUp()
+                    while up is not None and ObjectKey(up) not in keys:
+                        up = up.GetUp()
+                    if up is None:
+                        doc.AddUndo(c4d.UNDOTYPE_NEW, op)
+        finally:
+            if self.undo:
+                doc.EndUndo()
+            c4d.EventAdd()
+
+
 def CreateObject(typ, name, undo=True):
     """ Create a object of type 'typ', with name 'name'.
         This calls c4d.StopAllThreads() internally.
+        
+        Within a :py:class:`BatchCreate` block the object is 
+        inserted when the block ends.
     """
     obj = None
     try:
@@ -553,6 +1468,9 @@ def CreateObject(typ, name, undo=True):
         if doc is None: return None
         obj = c4d.BaseObject(typ)
         obj.SetName(name)
+        if _BATCHES:
+            _BATCHES[-1].Add(obj, undo)
+            return obj
         c4d.StopAllThreads()
         doc.InsertObject(obj)
         if undo is True:
@@ -591,6 +1509,8 @@ def InsertUnderNull(objs, grp=None, name="Group", copy=False):
     copy  bool            copy the objects if True
         
     Returns the modyfied/created group on success, None on failure.
+    
+    Within a :py:class:`BatchCreate` block no event is sent.
     """
     if grp is None:
         grp = CreateObject(c4d.Onull, name)
@@ -604,7 +1524,8 @@ def InsertUnderNull(objs, grp=None, name="Group", copy=False):
     else:
         objs.Remove()
         objs.InsertUnder(grp)
-    c4d.EventAdd()
+    if not _BATCHES:
+        c4d.EventAdd()
     return grp
 
 
@@ -634,7 +1555,93 @@ def RecursiveInsertGroups(entry, parent, root, tree, pmatch='90%'):
         return RecursiveInsertGroups(children, entry, root, tree, pmatch)
 
 
-def UniqueSequentialName(name_base, template=u'%(name)s.%(num)s'):
+class NameAllocator(object):
+    """
+    Hands out sequential names that are unique within a document.
+    
+    Scans the document once and keeps the highest number in use for each
+    base name, so a new name like ``Cube.13`` takes constant time instead 
+    of a walk over the scene. Names that were handed out count as used.
+    
+    Before a name is handed out, it is looked up with ``SearchObject()``. 
+    If an object with that name was added in the meantime, the document 
+    is scanned again. Call :py:meth:`Scan` to pick up other changes, 
+    e.g. deleted objects.
+    
+    :param doc:             the document. Defaults to the active document.
+    :param str template:    naming template, see :py:func:`UniqueSequentialName`.
+                            Must contain ``%(name)s`` and ``%(num)s`` (or 
+                            another integer conversion like ``%(num)03d``).
+    :param bool verify:     if False, skip the ``SearchObject()`` lookup. 
+                            Only use this if nothing else adds objects to 
+                            the document while names are handed out.
+    """
+    def __init__(self, doc=None, template=u'%(name)s.%(num)s', verify=True):
+        super(NameAllocator, self).__init__()
+        if doc is None:
+            doc = c4d.documents.GetActiveDocument()
+        pattern = u''
+        for part in re.split(r'(%\(\w+\)[#0 +-]*\d*[a-z])', template):
+            if part.startswith(u'%(name)'):
+                pattern += ur'(?P<name>.*)'
+            elif part.startswith(u'%(num)'):
+                pattern += ur'(?P<num>\d+)'
+            else:
+                pattern += re.escape(part.replace(u'%%', u'%'))
+        regex = re.compile(pattern + u'$', flags=re.UNICODE)
+        if 'name' not in regex.groupindex or 'num' not in regex.groupindex:
+            raise ValueError("E: template must contain %%(name)s and %%(num)s, got %r" % template)
+        self.doc = doc
+        self.template = template
+        self.verify = verify
+        self._regex = regex
+        self.Scan()
+    
+    def Scan(self):
+        """ Walk the document and collect the names in use. """
+        # all names in use and the highest number per base name
+        self._names = set()
+        self._counters = {}
+        for op, _, _ in WalkObjects(self.doc.GetFirstObject(), children_only=False):
+            self._Add(UnescapeUnicode(op.GetName()))
+    
+    def _Add(self, name):
+        self._names.add(name)
+        mat = self._regex.match(name)
+        if mat:
+            base = mat.group('name')
+            num = int(mat.group('num'), 10)
+            if num > self._counters.get(base, 0):
+                self._counters[base] = num
+    
+    def Next(self, name_base):
+        """ 
+        Return a new name for ``name_base``. 
+        
+        This is ``name_base`` itself if no object has that name yet, 
+        otherwise the template filled in with the next number.
+        """
+        base = UnescapeUnicode(name_base)
+        while True:
+            num = self._counters.get(base, 0)
+            numbered = num > 0 or base in self._names
+            if numbered:
+                num += 1
+                name = EscapeUnicode(self.template % ({'name': name_base, 'num': num}))
+            else:
+                name = name_base
+            if not self.verify or self.doc.SearchObject(name) is None:
+                break
+            # added since the last scan
+            self.Scan()
+            self._Add(UnescapeUnicode(name))
+        if numbered:
+            self._counters[base] = num
+        self._Add(UnescapeUnicode(name))
+        return name
+
+
+def UniqueSequentialName(name_base, template=u'%(name)s.%(num)s', allocator=None):
     """ Return a new sequential name based on a naming template and a 
         base name such that the name uniquely identifies an object in 
         the scene.
@@ -649,29 +1656,19 @@ def UniqueSequentialName(name_base, template=u'%(name)s.%(num)s'):
             Cube.12
             
         the function would return ``Cube.13`` as a new name.
+        
+        Each call scans the active document. When creating many objects 
+        in a loop, pass a :py:class:`NameAllocator` instead, which scans 
+        the document only once.
+        
+        :param allocator: use this :py:class:`NameAllocator` instead.
     """
-    doc = c4d.documents.GetActiveDocument()
-    if doc is None:
-        return False
-    oh = ObjectHierarchy()
-    objs = oh.Get(r"!" + name_base + r".*?\d*")
-    nums = []
-    for obj in objs:
-        name = obj.GetName()
-        mat = re.search(ur'(\d+)$', UnescapeUnicode(name), flags=re.UNICODE)
-        if mat and mat.group(1):
-            try:
-                nums.append(int(mat.group(1), 10))
-            except ValueError:
-                pass
-    new_num = 1
-    if len(nums) == 0:
-        if doc.SearchObject(name_base) is None:
-            return name_base
-    else:
-        new_num = max(nums) + 1
-    new_name = template % ({'name': name_base, 'num': new_num})
-    return EscapeUnicode(new_name)
+    if allocator is None:
+        doc = c4d.documents.GetActiveDocument()
+        if doc is None:
+            return False
+        allocator = NameAllocator(doc, template)
+    return allocator.Next(name_base)
     
 
 def GetGlobalPosition(obj):
@@ -755,9 +1752,10 @@ def SetAxisRotation(obj, rot, local=False):
     else:
         mat = obj.GetMg()
     inv = ~mat  
-    points = obj.GetAllPoints()
-    for i in range(len(points)):
-        points[i] = points[i] * inv
+    if np is not None:
+        points = ArrayToVectors(TransformPoints(obj.GetAllPoints(), inv))
+    else:
+        points = [p * inv for p in obj.GetAllPoints()]
     obj.SetAllPoints(points)
     obj.Message(c4d.MSG_UPDATE)
     c4d.EventAdd()
@@ -803,8 +1801,11 @@ def CenterObjectAxis(obj, center="midpoint"):
     # positions
     obj.SetRelPos(c)
     
-    for p in xrange(0, maxpoints):
-        obj.SetPoint(p, obj.GetPoint(p) - trans)
+    if np is not None:
+        points = ArrayToVectors(VectorsToArray(obj.GetAllPoints()) - (trans.x, trans.y, trans.z))
+    else:
+        points = [p - trans for p in obj.GetAllPoints()]
+    obj.SetAllPoints(points)
     # compensate positions of child objects
     child = obj.GetDown()
     while child:
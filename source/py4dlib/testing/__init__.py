@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# 
+#  __init__.py
+#  py4dlib.testing
+#  
+#  Created by André Berg on 2026-10-19.
+#  Copyright 2026 Berg Media. All rights reserved.
+#
+#  andre.bergmedia@googlemail.com
+# 
+# pylint: disable-msg=F0401
+
+'''py4dlib.testing -- running and measuring py4dlib outside of CINEMA 4D.
+
+The :py:mod:`py4dlib.testing.c4dstub` package is a pure Python stand-in
+for the parts of the ``c4d`` module py4dlib uses. Install it before
+importing any other py4dlib module:
+
+.. code::
+
+    from py4dlib.testing import c4dstub
+    c4dstub.Install()
+
+    from py4dlib.objects import ObjectHierarchy
+'''
+
+__version__ = (0, 1)
+__date__ = '2026-10-19'
+__updated__ = '2026-10-19'
+
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+# 
+#       http://www.apache.org/licenses/LICENSE-2.0
+# 
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
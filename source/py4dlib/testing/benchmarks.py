@@ -0,0 +1,504 @@
+# -*- coding: utf-8 -*-
+# 
+#  benchmarks.py
+#  py4dlib.testing
+#  
+#  Created by André Berg on 2026-10-19.
+#  Copyright 2026 Berg Media. All rights reserved.
+#
+#  andre.bergmedia@googlemail.com
+# 
+# pylint: disable-msg=F0401
+
+'''py4dlib.testing.benchmarks -- timing py4dlib's hot paths across size tiers.
+
+Each benchmark is run for every selected size tier. Results hold
+min/median/p95 run times and the peak memory growth during the runs
+and can be saved as JSON and compared against a stored baseline.
+
+Outside of CINEMA 4D the benchmarks run against the stub from
+:py:mod:`py4dlib.testing.c4dstub`. From the command line::
+
+    python -m py4dlib.testing.benchmarks --tiers small,medium -o run.json
+    python -m py4dlib.testing.benchmarks -b run.json --threshold 0.2
+
+The second call exits with status 1 if any benchmark got slower by
+more than 20% compared to ``run.json``.
+'''
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import platform
+import argparse
+
+from timeit import default_timer
+from collections import OrderedDict
+
+__version__ = (0, 1)
+__date__ = '2026-10-19'
+__updated__ = '2026-10-19'
+
+
+DEBUG = 0 or ('DebugLevel' in os.environ and os.environ['DebugLevel'] > 0)
+TESTRUN = 0 or ('TestRunLevel' in os.environ and os.environ['TestRunLevel'] > 0)
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import py4dlib
+
+from py4dlib.maths import _RequireNumpy, TransformPoints, ConvexHull, BuildMatrixArray
+from py4dlib.maths import QuatsToMatrices, MulMatrixArray, VSLerpArray, Plane
+from py4dlib.mesh import CalcPolyNormals, CalcPolyAreas, GetEdgeArray, SliceMesh
+from py4dlib.mesh import RayCastMesh, MeshToArrays, ArraysToMesh
+from py4dlib.objects import ObjectIterator, ObjectHierarchy, FindObject, FindObjects, SceneIndex
+from py4dlib.testing import c4dstub
+from py4dlib.testing.generators import GenerateMesh, BuildHierarchy
+
+
+# number of elements (points, polygons, matrices or objects) per tier
+TIERS = OrderedDict([
+    ('tiny', 100),
+    ('small', 1000),
+    ('medium', 100000),
+    ('large', 1000000),
+    ('huge', 10000000),
+])
+DEFAULT_TIERS = ('small', 'medium')
+STATS = ('min', 'median', 'p95', 'mean')
+
+NEEDLE = 'Needle'
+
+
+class Benchmark(object):
+    """
+    A timed operation plus the setup creating its input.
+
+    :param str group: one of ``maths``, ``mesh`` or ``objects``.
+    :param str name: name of the benchmark within the group.
+    :param func: the operation. Gets passed what ``setup`` returned.
+    :param setup: function taking the size and returning the input.
+        Inputs are shared between benchmarks with the same setup
+        function and size.
+    :param float scale: factor for the tier size, for operations
+        which are too slow to run at the full size.
+    """
+    def __init__(self, group, name, func, setup, scale=1.0):
+        super(Benchmark, self).__init__()
+        self.group = group
+        self.name = name
+        self.func = func
+        self.setup = setup
+        self.scale = scale
+
+    def __repr__(self):
+        return "<Benchmark %s>" % self.key
+
+    @property
+    def key(self):
+        return "%s.%s" % (self.group, self.name)
+
+    def Size(self, tier):
+        return max(1, int(TIERS[tier] * self.scale))
+
+
+BENCHMARKS = OrderedDict()
+
+
+def Register(group, name, setup, scale=1.0):
+    """ Decorator registering a function as :py:class:`Benchmark`. """
+    def decorator(func):
+        bench = Benchmark(group, name, func, setup, scale)
+        BENCHMARKS[bench.key] = bench
+        return func
+    return decorator
+
+
+def _C4D():
+    # resolved at call time so that an installed stub is picked up
+    import c4d  #@UnresolvedImport
+    return c4d
+
+
+# ---------------------------------------------------------------------------
+# Setups
+
+def _PointsSetup(size):
+    rng = np.random.RandomState(size)
+    return rng.normal(0.0, 100.0, (size, 3))
+
+
+def _MatrixSetup(size):
+    rng = np.random.RandomState(size)
+    quats = rng.normal(0.0, 1.0, (size, 4))
+    quats /= np.sqrt((quats * quats).sum(axis=1))[:, np.newaxis]
+    return QuatsToMatrices(quats, off=rng.normal(0.0, 100.0, (size, 3)))
+
+
+def _MeshSetup(size):
+    return GenerateMesh('mixed', size, seed=size)
+
+
+def _SceneSetup(size):
+    """ Hierarchy of about ``size`` objects under a single root, in its
+        own document, with an object named :py:data:`NEEDLE` placed last.
+    """
+    c4d = _C4D()
+    doc = c4d.documents.BaseDocument()
+    c4d.documents.InsertBaseDocument(doc)
+    c4d.documents.SetActiveDocument(doc)
+    fanout = max(1, int(round(size ** (1.0 / 3.0))))
+    objs = BuildHierarchy(3, fanout, names='repeated', doc=doc, seed=size)
+    objs[-1].SetName(NEEDLE)
+    return doc
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+
+@Register('maths', 'TransformPoints', _PointsSetup)
+def _TransformPoints(points):
+    TransformPoints(points, np.array([[1, 2, 3], [0, 1, 0], [-1, 0, 0], [0, 0, 1]], dtype=np.float64))
+
+
+@Register('maths', 'ConvexHull', _PointsSetup)
+def _ConvexHull(points):
+    ConvexHull(points)
+
+
+@Register('maths', 'BuildMatrixArray', _PointsSetup)
+def _BuildMatrixArray(points):
+    BuildMatrixArray(points, off=points)
+
+
+@Register('maths', 'VSLerpArray', _PointsSetup)
+def _VSLerpArray(points):
+    units = points / np.sqrt((points * points).sum(axis=1))[:, np.newaxis]
+    VSLerpArray(units, units[::-1], 0.25)
+
+
+@Register('maths', 'QuatsToMatrices', _MatrixSetup)
+def _QuatsToMatrices(matrices):
+    QuatsToMatrices(np.tile([1.0, 0.0, 0.0, 0.0], (len(matrices), 1)), off=matrices[:, 0])
+
+
+@Register('maths', 'MulMatrixArray', _MatrixSetup)
+def _MulMatrixArray(matrices):
+    MulMatrixArray(matrices, matrices[::-1])
+
+
+@Register('mesh', 'CalcPolyNormals', _MeshSetup)
+def _CalcPolyNormals(mesh):
+    CalcPolyNormals(mesh)
+
+
+@Register('mesh', 'CalcPolyAreas', _MeshSetup)
+def _CalcPolyAreas(mesh):
+    CalcPolyAreas(mesh)
+
+
+@Register('mesh', 'GetEdgeArray', _MeshSetup)
+def _GetEdgeArray(mesh):
+    GetEdgeArray(mesh)
+
+
+@Register('mesh', 'SliceMesh', _MeshSetup)
+def _SliceMesh(mesh):
+    c4d = _C4D()
+    center = mesh[0].mean(axis=0).tolist()
+    SliceMesh(mesh, Plane(c4d.Vector(*center), c4d.Vector(1, 0, 0)))
+
+
+@Register('mesh', 'RayCastMesh', _MeshSetup)
+def _RayCastMesh(mesh):
+    lo = mesh[0].min(axis=0)
+    hi = mesh[0].max(axis=0)
+    starts = np.linspace(lo, hi, 16) + [0.0, 10.0, 0.0]
+    RayCastMesh(mesh, starts, np.tile([0.0, -1.0, 0.0], (16, 1)))
+
+
+@Register('mesh', 'ArraysToMesh', _MeshSetup, scale=0.1)
+def _ArraysToMesh(mesh):
+    MeshToArrays(ArraysToMesh(mesh[0], mesh[1]))
+
+
+@Register('objects', 'ObjectIterator', _SceneSetup, scale=0.1)
+def _ObjectIterator(doc):
+    for _ in ObjectIterator(doc.GetFirstObject(), children_only=False):
+        pass
+
+
+@Register('objects', 'ObjectHierarchy', _SceneSetup, scale=0.1)
+def _ObjectHierarchy(doc):
+    _C4D().documents.SetActiveDocument(doc)
+    ObjectHierarchy()
+
+
+@Register('objects', 'FindObject', _SceneSetup, scale=0.1)
+def _FindObject(doc):
+    _C4D().documents.SetActiveDocument(doc)
+    FindObject(NEEDLE)
+
+
+@Register('objects', 'FindObjects', _SceneSetup, scale=0.1)
+def _FindObjects(doc):
+    _C4D().documents.SetActiveDocument(doc)
+    FindObjects(NEEDLE)
+
+
+@Register('objects', 'SceneIndex', _SceneSetup, scale=0.1)
+def _SceneIndex(doc):
+    index = SceneIndex(doc)
+    FindObject(NEEDLE, index=index)
+    FindObjects(NEEDLE, index=index)
+
+
+# ---------------------------------------------------------------------------
+# Measuring
+
+def _ReadStatus(field):
+    try:
+        with open('/proc/self/status') as f:
+            match = re.search(r'%s:\s+(\d+)\s+kB' % field, f.read())
+    except IOError:
+        return None
+    return int(match.group(1)) * 1024 if match else None
+
+
+def _ResetPeakMemory():
+    """ Reset the peak resident set size of the process, if possible.
+        Only supported on Linux.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except IOError:
+        return False
+
+
+def _PeakMemory():
+    peak = _ReadStatus('VmHWM')
+    if peak is not None:
+        return peak
+    try:
+        import resource
+        # kilobytes on Linux, bytes on Mac OS X
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        return None
+
+
+def Percentile(values, p):
+    """ Nearest-rank percentile ``p`` (0-100) of ``values``. """
+    if len(values) == 0:
+        raise ValueError("E: expected at least one value")
+    values = sorted(values)
+    rank = int(math.ceil(p / 100.0 * len(values)))
+    return values[min(len(values), max(1, rank)) - 1]
+
+
+def Measure(func, state, repeat=5):
+    """ Time ``func(state)`` ``repeat`` times after one warm-up call.
+
+        :return: ``dict`` with the time statistics in seconds and
+            ``mem_peak``, the growth of the peak resident set size
+            in bytes during the runs (None if it can't be measured).
+    """
+    if repeat < 1:
+        raise ValueError("E: repeat must be at least 1, got %r" % repeat)
+    func(state)
+    _ResetPeakMemory()
+    before = _PeakMemory()
+    times = []
+    for _ in range(repeat):
+        t = default_timer()
+        func(state)
+        times.append(default_timer() - t)
+    after = _PeakMemory()
+    return {
+        'min': min(times),
+        'median': Percentile(times, 50),
+        'p95': Percentile(times, 95),
+        'mean': sum(times) / len(times),
+        'repeat': repeat,
+        'mem_peak': None if before is None else max(0, after - before),
+    }
+
+
+def Select(groups=None, pattern=None):
+    """ Registered benchmarks in ``groups`` whose key contains ``pattern``. """
+    result = []
+    for key, bench in BENCHMARKS.items():
+        if groups and bench.group not in groups:
+            continue
+        if pattern and pattern not in key:
+            continue
+        result.append(bench)
+    return result
+
+
+def Run(benchmarks=None, tiers=DEFAULT_TIERS, repeat=5, headless=True, verbose=False):
+    """ Run ``benchmarks`` for each of ``tiers``.
+
+        :param benchmarks: ``list`` of :py:class:`Benchmark`.
+            If None, runs all registered benchmarks.
+        :param bool headless: install :py:mod:`py4dlib.testing.c4dstub`
+            for the run if the real ``c4d`` module isn't available.
+        :return: ``dict`` with ``meta`` info and ``results`` keyed by
+            ``group.name/tier``.
+    """
+    _RequireNumpy()
+    for tier in tiers:
+        if tier not in TIERS:
+            raise ValueError("E: unknown tier %r, expected one of %s" % (tier, list(TIERS)))
+    if benchmarks is None:
+        benchmarks = list(BENCHMARKS.values())
+    installed = False
+    if headless and 'c4d' not in sys.modules:
+        installed = c4dstub.Install() is c4dstub
+    try:
+        c4d = _C4D()
+        meta = {
+            'py4dlib': '.'.join(str(x) for x in py4dlib.__version__),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'c4d': c4d.GetC4DVersion(),
+            'stub': c4d is c4dstub,
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        results = OrderedDict()
+        for tier in tiers:
+            inputs = {}
+            for bench in benchmarks:
+                size = bench.Size(tier)
+                if (bench.setup, size) not in inputs:
+                    inputs[(bench.setup, size)] = bench.setup(size)
+                stats = Measure(bench.func, inputs[(bench.setup, size)], repeat)
+                stats.update({'group': bench.group, 'name': bench.name,
+                              'tier': tier, 'size': size})
+                results["%s/%s" % (bench.key, tier)] = stats
+                if verbose:
+                    print(FormatResult("%s/%s" % (bench.key, tier), stats))
+    finally:
+        if installed:
+            c4dstub.Uninstall()
+    return {'meta': meta, 'results': results}
+
+
+def Save(run, path):
+    """ Write the result of :py:func:`Run` to ``path`` as JSON. """
+    with open(path, 'w') as f:
+        json.dump(run, f, indent=2, sort_keys=True)
+
+
+def Load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def Compare(run, baseline, threshold=0.1, stat='median', floor=1e-5):
+    """ Find benchmarks that got slower than ``baseline``.
+
+        Only benchmarks present in both runs are compared.
+
+        :param float threshold: allowed slow down as a fraction,
+            e.g. 0.1 for 10%.
+        :param str stat: the statistic to compare. One of
+            ``min``, ``median``, ``p95`` or ``mean``.
+        :param float floor: differences below this many seconds
+            are treated as noise.
+        :return: ``list`` of ``(key, baseline, current, ratio)`` tuples
+            sorted by descending ratio.
+    """
+    if stat not in STATS:
+        raise ValueError("E: stat must be one of %s, got %r" % (list(STATS), stat))
+    result = []
+    base = baseline['results']
+    for key, stats in run['results'].items():
+        if key not in base:
+            continue
+        old = base[key][stat]
+        new = stats[stat]
+        if new - old <= floor or new <= old * (1.0 + threshold):
+            continue
+        result.append((key, old, new, new / old if old > 0 else float('inf')))
+    return sorted(result, key=lambda x: x[3], reverse=True)
+
+
+def FormatTime(t):
+    for unit, mult in (('s', 1.0), ('ms', 1e3), ('us', 1e6)):
+        if t >= 1.0 / mult:
+            return "%.3f %s" % (t * mult, unit)
+    return "%.3f us" % (t * 1e6)
+
+
+def FormatMemory(b):
+    if b is None:
+        return "n/a"
+    return "%.1f MB" % (b / 1048576.0)
+
+
+def FormatResult(key, stats):
+    return "%-36s %10s %10s %10s %10s" % (
+        key, FormatTime(stats['min']), FormatTime(stats['median']),
+        FormatTime(stats['p95']), FormatMemory(stats['mem_peak']))
+
+
+def Main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark py4dlib's hot paths.")
+    parser.add_argument('-g', '--group', action='append',
+                        help="only run this group (maths, mesh, objects). Can be repeated.")
+    parser.add_argument('-k', '--filter', help="only run benchmarks whose name contains this.")
+    parser.add_argument('-t', '--tiers', default=','.join(DEFAULT_TIERS),
+                        help="comma separated size tiers out of %s." % ', '.join(TIERS))
+    parser.add_argument('-r', '--repeat', type=int, default=5, help="timed runs per benchmark.")
+    parser.add_argument('-o', '--output', help="save results as JSON to this file.")
+    parser.add_argument('-b', '--baseline', help="compare against results from this file.")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="allowed slow down against the baseline as a fraction.")
+    parser.add_argument('--stat', default='median', choices=STATS, help="statistic to compare.")
+    parser.add_argument('-l', '--list', action='store_true', help="list benchmarks and exit.")
+    args = parser.parse_args(argv)
+    benchmarks = Select(args.group, args.filter)
+    if args.list:
+        for bench in benchmarks:
+            print(bench.key)
+        return 0
+    print("%-36s %10s %10s %10s %10s" % ('benchmark', 'min', 'median', 'p95', 'memory'))
+    run = Run(benchmarks, args.tiers.split(','), args.repeat, verbose=True)
+    if args.output:
+        Save(run, args.output)
+    if args.baseline:
+        regressions = Compare(run, Load(args.baseline), args.threshold, args.stat)
+        for key, old, new, ratio in regressions:
+            print("REGRESSION %s: %s -> %s (%.2fx)" % (key, FormatTime(old), FormatTime(new), ratio))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(Main())
+
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+# 
+#       http://www.apache.org/licenses/LICENSE-2.0
+# 
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
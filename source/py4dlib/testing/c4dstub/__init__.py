@@ -0,0 +1,988 @@
+# -*- coding: utf-8 -*-
+# 
+#  __init__.py
+#  py4dlib.testing.c4dstub
+#  
+#  Created by André Berg on 2026-10-19.
+#  Copyright 2026 Berg Media. All rights reserved.
+#
+#  andre.bergmedia@googlemail.com
+# 
+# pylint: disable-msg=F0401
+
+'''py4dlib.testing.c4dstub -- pure Python stand-in for the ``c4d`` module.
+
+Covers the types and functions py4dlib, its examples and the benchmark
+suite use: ``Vector``, ``Matrix``, ``CPolygon``, ``BaseObject`` with its
+hierarchy, ``PointObject``, ``PolygonObject``, ``SplineObject``,
+``BaseSelect``, ``BaseDocument`` as well as the ``utils`` and ``documents``
+submodules. Values of constants only match CINEMA 4D where it matters
+for py4dlib.
+
+Call :py:func:`Install` to make ``import c4d`` pick up the stub.
+'''
+
+import sys
+import math
+import itertools
+
+__version__ = (0, 1)
+__date__ = '2026-10-19'
+__updated__ = '2026-10-19'
+
+
+# Version reported by GetC4DVersion(). Change it to test version dependent code.
+C4D_VERSION = 13061
+
+# Object types
+Opolygon = 5100
+Ospline = 5101
+Olight = 5102
+Ocamera = 5103
+Onull = 5140
+Ocube = 5159
+Osphere = 5160
+Oplane = 5168
+Osplinetext = 5178
+Oconplane = 5181
+Opoint = 5186
+
+# Bits, messages and flags
+BIT_ACTIVE = 1 << 1
+MSG_UPDATE = 1
+SELECTION_NEW = 0
+SELECTION_ADD = 1
+SELECTION_SUB = 2
+UNDOTYPE_CHANGE = 40
+UNDOTYPE_NEW = 44
+UNDOTYPE_DELETE = 46
+DIRTYFLAGS_NONE = 0
+DIRTYFLAGS_MATRIX = 1 << 1
+DIRTYFLAGS_DATA = 1 << 2
+DIRTYFLAGS_SELECT = 1 << 3
+DIRTYFLAGS_CACHE = 1 << 4
+DIRTYFLAGS_CHILDREN = 1 << 5
+GETACTIVEOBJECTFLAGS_0 = 0
+GETACTIVEOBJECTFLAGS_CHILDREN = 1
+GETACTIVEOBJECTFLAGS_SELECTIONORDER = 2
+MODELINGCOMMANDMODE_ALL = 0
+MODELINGCOMMANDFLAGS_0 = 0
+MODELINGCOMMANDFLAGS_CREATEUNDO = 1
+MCOMMAND_CURRENTSTATETOOBJECT = 12233
+MCOMMAND_MAKEEDITABLE = 12236
+
+# Description IDs
+ID_BASELIST_NAME = 900
+PRIM_AXIS = 1000
+PRIM_PLANE_WIDTH = 1100
+PRIM_PLANE_HEIGHT = 1101
+PRIM_PLANE = 1102
+PRIM_TEXT_TEXT = 2111
+PRIM_TEXT_HEIGHT = 2112
+CONSTRUCTIONPLANE_TYPE = 1000
+CONSTRUCTIONPLANE_SPACING = 1001
+
+
+class Vector(object):
+    """ Stand-in for ``c4d.Vector``.
+
+        Supports the operators of the real type: ``v * v`` is the dot
+        product, ``v % v`` the cross product, ``v * m`` transforms a
+        point and ``v ^ m`` a direction.
+    """
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x=0.0, y=None, z=None):
+        if isinstance(x, Vector):
+            x, y, z = x.x, x.y, x.z
+        elif y is None and z is None:
+            y = z = x
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    def __repr__(self):
+        return "Vector(%s, %s, %s)" % (self.x, self.y, self.z)
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __eq__(self, other):
+        return (isinstance(other, Vector) and self.x == other.x and
+                self.y == other.y and self.z == other.z)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+
+    def __getitem__(self, i):
+        return (self.x, self.y, self.z)[i]
+
+    def __setitem__(self, i, value):
+        setattr(self, ('x', 'y', 'z')[i], float(value))
+
+    def __neg__(self):
+        return Vector(-self.x, -self.y, -self.z)
+
+    def __abs__(self):
+        return Vector(abs(self.x), abs(self.y), abs(self.z))
+
+    def __add__(self, other):
+        if isinstance(other, Vector):
+            return Vector(self.x + other.x, self.y + other.y, self.z + other.z)
+        return Vector(self.x + other, self.y + other, self.z + other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Vector):
+            return Vector(self.x - other.x, self.y - other.y, self.z - other.z)
+        return Vector(self.x - other, self.y - other, self.z - other)
+
+    def __rsub__(self, other):
+        return Vector(other - self.x, other - self.y, other - self.z)
+
+    def __mul__(self, other):
+        if isinstance(other, Vector):
+            return self.x * other.x + self.y * other.y + self.z * other.z
+        if isinstance(other, Matrix):
+            return other.Mul(self)
+        return Vector(self.x * other, self.y * other, self.z * other)
+
+    def __rmul__(self, other):
+        return Vector(self.x * other, self.y * other, self.z * other)
+
+    def __div__(self, other):
+        if isinstance(other, Vector):
+            return Vector(self.x / other.x, self.y / other.y, self.z / other.z)
+        return Vector(self.x / other, self.y / other, self.z / other)
+
+    __truediv__ = __div__
+
+    def __mod__(self, other):
+        return self.Cross(other)
+
+    def __xor__(self, other):
+        if isinstance(other, Matrix):
+            return other.MulV(self)
+        return Vector(self.x * other.x, self.y * other.y, self.z * other.z)
+
+    def Dot(self, other):
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def Cross(self, other):
+        return Vector(self.y * other.z - self.z * other.y,
+                      self.z * other.x - self.x * other.z,
+                      self.x * other.y - self.y * other.x)
+
+    def GetLength(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def GetLengthSquared(self):
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
+    def GetNormalized(self):
+        l = self.GetLength()
+        if l == 0.0:
+            return Vector(0.0)
+        return Vector(self.x / l, self.y / l, self.z / l)
+
+    def Normalize(self):
+        l = self.GetLength()
+        if l != 0.0:
+            self.x /= l
+            self.y /= l
+            self.z /= l
+
+
+class Matrix(object):
+    """ Stand-in for ``c4d.Matrix``.
+
+        ``m1 * m2`` transforms by ``m2`` first, ``~m`` is the inverse.
+    """
+
+    __slots__ = ('off', 'v1', 'v2', 'v3')
+
+    def __init__(self, off=None, v1=None, v2=None, v3=None):
+        self.off = Vector(off) if off is not None else Vector(0.0)
+        self.v1 = Vector(v1) if v1 is not None else Vector(1.0, 0.0, 0.0)
+        self.v2 = Vector(v2) if v2 is not None else Vector(0.0, 1.0, 0.0)
+        self.v3 = Vector(v3) if v3 is not None else Vector(0.0, 0.0, 1.0)
+
+    def __setattr__(self, name, value):
+        # copy on assignment, like the real type
+        object.__setattr__(self, name, Vector(value))
+
+    def __repr__(self):
+        return "Matrix(v1: %r; v2: %r; v3: %r; off: %r)" % (self.v1, self.v2, self.v3, self.off)
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __eq__(self, other):
+        return (isinstance(other, Matrix) and self.off == other.off and
+                self.v1 == other.v1 and self.v2 == other.v2 and self.v3 == other.v3)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __mul__(self, other):
+        if isinstance(other, Matrix):
+            return Matrix(self.Mul(other.off), self.MulV(other.v1),
+                          self.MulV(other.v2), self.MulV(other.v3))
+        if isinstance(other, Vector):
+            return self.Mul(other)
+        return Matrix(self.off * other, self.v1 * other, self.v2 * other, self.v3 * other)
+
+    def __invert__(self):
+        v1, v2, v3 = self.v1, self.v2, self.v3
+        det = v1.Dot(v2.Cross(v3))
+        if det == 0.0:
+            return Matrix(Vector(0.0), Vector(0.0), Vector(0.0), Vector(0.0))
+        # rows of the inverse are the cross products of the columns
+        r1 = v2.Cross(v3) * (1.0 / det)
+        r2 = v3.Cross(v1) * (1.0 / det)
+        r3 = v1.Cross(v2) * (1.0 / det)
+        inv = Matrix(Vector(0.0),
+                     Vector(r1.x, r2.x, r3.x),
+                     Vector(r1.y, r2.y, r3.y),
+                     Vector(r1.z, r2.z, r3.z))
+        inv.off = -inv.MulV(self.off)
+        return inv
+
+    def Mul(self, v):
+        """ Transform a point. """
+        return Vector(self.off.x + v.x * self.v1.x + v.y * self.v2.x + v.z * self.v3.x,
+                      self.off.y + v.x * self.v1.y + v.y * self.v2.y + v.z * self.v3.y,
+                      self.off.z + v.x * self.v1.z + v.y * self.v2.z + v.z * self.v3.z)
+
+    def MulV(self, v):
+        """ Transform a direction. """
+        return Vector(v.x * self.v1.x + v.y * self.v2.x + v.z * self.v3.x,
+                      v.x * self.v1.y + v.y * self.v2.y + v.z * self.v3.y,
+                      v.x * self.v1.z + v.y * self.v2.z + v.z * self.v3.z)
+
+    def Normalize(self):
+        self.v1 = self.v1.GetNormalized()
+        self.v2 = self.v2.GetNormalized()
+        self.v3 = self.v3.GetNormalized()
+
+    def GetNormalized(self):
+        return Matrix(self.off, self.v1.GetNormalized(),
+                      self.v2.GetNormalized(), self.v3.GetNormalized())
+
+
+class CPolygon(object):
+    """ Stand-in for ``c4d.CPolygon``. Triangles have ``c == d``. """
+
+    __slots__ = ('a', 'b', 'c', 'd')
+
+    def __init__(self, a, b, c, d=None):
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = c if d is None else d
+
+    def __repr__(self):
+        return "CPolygon(%d, %d, %d, %d)" % (self.a, self.b, self.c, self.d)
+
+    def __eq__(self, other):
+        return (isinstance(other, CPolygon) and self.a == other.a and
+                self.b == other.b and self.c == other.c and self.d == other.d)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.a, self.b, self.c, self.d))
+
+    def __getitem__(self, i):
+        return (self.a, self.b, self.c, self.d)[i]
+
+    def IsTriangle(self):
+        return self.c == self.d
+
+
+class BaseSelect(object):
+    """ Stand-in for ``c4d.BaseSelect``. """
+
+    def __init__(self):
+        super(BaseSelect, self).__init__()
+        self._sel = set()
+
+    def HostAlive(self):
+        return 1
+
+    def Select(self, num):
+        self._sel.add(num)
+        return True
+
+    def Deselect(self, num):
+        self._sel.discard(num)
+        return True
+
+    def Toggle(self, num):
+        if num in self._sel:
+            self._sel.discard(num)
+        else:
+            self._sel.add(num)
+        return True
+
+    def IsSelected(self, num):
+        return num in self._sel
+
+    def SelectAll(self, min, max=None):  # IGNORE:W0622
+        # R12/R13 take (min, max), later versions only max
+        if max is None:
+            min, max = 0, min
+        self._sel.update(range(min, max + 1))
+        return True
+
+    def DeselectAll(self):
+        self._sel.clear()
+        return True
+
+    def GetCount(self):
+        return len(self._sel)
+
+    def GetAll(self, max):  # IGNORE:W0622
+        sel = self._sel
+        return [1 if i in sel else 0 for i in range(max)]
+
+    def SetAll(self, states):
+        self._sel = set(i for i, s in enumerate(states) if s)
+        return True
+
+    def CopyTo(self, dest):
+        dest._sel = set(self._sel)
+        return True
+
+    def GetClone(self):
+        clone = BaseSelect()
+        self.CopyTo(clone)
+        return clone
+
+
+class BaseContainer(object):
+    """ Stand-in for ``c4d.BaseContainer``. """
+
+    def __init__(self, id=0):  # IGNORE:W0622
+        super(BaseContainer, self).__init__()
+        self._id = id
+        self._data = {}
+
+    def __getitem__(self, key):
+        return self._data.get(key)
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __iter__(self):
+        return iter(sorted(self._data.items()))
+
+    def GetId(self):
+        return self._id
+
+    def GetData(self, key):
+        return self._data.get(key)
+
+    def SetData(self, key, value):
+        self._data[key] = value
+
+    def GetString(self, key, preset=""):
+        return self._data.get(key, preset)
+
+    SetString = SetData
+
+    def GetLong(self, key, preset=0):
+        return self._data.get(key, preset)
+
+    SetLong = SetData
+
+    def GetReal(self, key, preset=0.0):
+        return self._data.get(key, preset)
+
+    SetReal = SetData
+
+    def GetBool(self, key, preset=False):
+        return self._data.get(key, preset)
+
+    SetBool = SetData
+
+
+# global dirty counter. CINEMA 4D's dirty counts only ever grow.
+_dirty = itertools.count(1)
+_guids = itertools.count(1)
+
+
+class BaseList2D(object):
+    """ Common base of objects with a name, a container, bits and dirty counts. """
+
+    def __init__(self, type):  # IGNORE:W0622
+        super(BaseList2D, self).__init__()
+        self._type = type
+        self._data = BaseContainer(type)
+        self._data[ID_BASELIST_NAME] = ""
+        self._bits = 0
+        self._dirty = {}
+        self._uip = 0
+        self._guid = next(_guids)
+
+    def _SetDirty(self, flags):
+        stamp = next(_dirty)
+        for flag in (DIRTYFLAGS_MATRIX, DIRTYFLAGS_DATA, DIRTYFLAGS_SELECT,
+                     DIRTYFLAGS_CACHE, DIRTYFLAGS_CHILDREN):
+            if flags & flag:
+                self._dirty[flag] = stamp
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._SetDirty(DIRTYFLAGS_DATA)
+
+    def GetName(self):
+        return self._data[ID_BASELIST_NAME]
+
+    def SetName(self, name):
+        self[ID_BASELIST_NAME] = name
+
+    def GetType(self):
+        return self._type
+
+    def GetTypeName(self):
+        return _TYPENAMES.get(self._type, "Object")
+
+    def GetDataInstance(self):
+        return self._data
+
+    def GetData(self):
+        clone = BaseContainer(self._type)
+        clone._data = dict(self._data._data)
+        return clone
+
+    def GetBit(self, mask):
+        return bool(self._bits & mask)
+
+    def SetBit(self, mask):
+        self._bits |= mask
+
+    def DelBit(self, mask):
+        self._bits &= ~mask
+
+    def ToggleBit(self, mask):
+        self._bits ^= mask
+
+    def GetDirty(self, flags):
+        stamps = [self._dirty.get(flag, 0) for flag in self._dirty if flag & flags]
+        return max(stamps) if stamps else 0
+
+    def SetDirty(self, flags):
+        self._SetDirty(flags)
+
+    def GetUniqueIP(self):
+        return self._uip
+
+    def SetUniqueIP(self, ip):
+        self._uip = ip
+
+    def GetGUID(self):
+        return self._guid
+
+    def Message(self, type, data=None):  # IGNORE:W0622
+        if type == MSG_UPDATE:
+            self._SetDirty(DIRTYFLAGS_DATA)
+        return True
+
+
+class BaseObject(BaseList2D):
+    """ Stand-in for ``c4d.BaseObject`` with hierarchy navigation and matrices. """
+
+    def __init__(self, type):  # IGNORE:W0622
+        super(BaseObject, self).__init__(type)
+        self._up = None
+        self._down = None
+        self._next = None
+        self._pred = None
+        self._doc = None
+        self._ml = Matrix()
+
+    def __repr__(self):
+        return "<c4dstub.%s object called '%s' with ID %d at 0x%x>" % (
+            self.__class__.__name__, self.GetName(), self._type, id(self))
+
+    # hierarchy
+
+    def GetUp(self):
+        return self._up
+
+    def GetDown(self):
+        return self._down
+
+    def GetDownLast(self):
+        op = self._down
+        while op and op._next:
+            op = op._next
+        return op
+
+    def GetNext(self):
+        return self._next
+
+    def GetPred(self):
+        return self._pred
+
+    def GetChildren(self):
+        result = []
+        op = self._down
+        while op:
+            result.append(op)
+            op = op._next
+        return result
+
+    def GetDocument(self):
+        return self._doc
+
+    def _SetDoc(self, doc):
+        self._doc = doc
+        op = self._down
+        while op:
+            op._SetDoc(doc)
+            op = op._next
+
+    def _Link(self, parent, pred, succ, doc):
+        self._up = parent
+        self._pred = pred
+        self._next = succ
+        if pred is not None:
+            pred._next = self
+        elif parent is not None:
+            parent._down = self
+        elif doc is not None:
+            doc._first = self
+        if succ is not None:
+            succ._pred = self
+        self._SetDoc(doc)
+        if parent is not None:
+            parent._SetDirty(DIRTYFLAGS_CHILDREN)
+        elif doc is not None:
+            doc._SetDirty()
+
+    def InsertUnder(self, parent):
+        self.Remove()
+        self._Link(parent, None, parent._down, parent._doc)
+
+    def InsertUnderLast(self, parent):
+        self.Remove()
+        self._Link(parent, parent.GetDownLast(), None, parent._doc)
+
+    def InsertBefore(self, op):
+        self.Remove()
+        self._Link(op._up, op._pred, op, op._doc)
+
+    def InsertAfter(self, op):
+        self.Remove()
+        self._Link(op._up, op, op._next, op._doc)
+
+    def Remove(self):
+        if self._pred is not None:
+            self._pred._next = self._next
+        elif self._up is not None:
+            self._up._down = self._next
+        elif self._doc is not None and self._doc._first is self:
+            self._doc._first = self._next
+        if self._next is not None:
+            self._next._pred = self._pred
+        if self._up is not None:
+            self._up._SetDirty(DIRTYFLAGS_CHILDREN)
+        elif self._doc is not None:
+            self._doc._SetDirty()
+        self._up = self._pred = self._next = None
+        self._SetDoc(None)
+
+    def GetClone(self, flags=0):
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._data = self.GetData()
+        clone._dirty = {}
+        clone._guid = next(_guids)
+        clone._ml = Matrix(self._ml.off, self._ml.v1, self._ml.v2, self._ml.v3)
+        clone._up = clone._down = clone._next = clone._pred = None
+        clone._doc = None
+        self._CloneData(clone)
+        pred = None
+        for child in self.GetChildren():
+            c = child.GetClone(flags)
+            c._up = clone
+            c._pred = pred
+            if pred is None:
+                clone._down = c
+            else:
+                pred._next = c
+            pred = c
+        return clone
+
+    def _CloneData(self, clone):
+        pass
+
+    # matrices
+
+    def GetMl(self):
+        return Matrix(self._ml.off, self._ml.v1, self._ml.v2, self._ml.v3)
+
+    def SetMl(self, m):
+        self._ml = Matrix(m.off, m.v1, m.v2, m.v3)
+        self._SetDirty(DIRTYFLAGS_MATRIX)
+
+    def GetUpMg(self):
+        if self._up is None:
+            return Matrix()
+        return self._up.GetMg()
+
+    def GetMg(self):
+        return self.GetUpMg() * self._ml
+
+    def SetMg(self, m):
+        self.SetMl(~self.GetUpMg() * m)
+
+    def GetRelPos(self):
+        return Vector(self._ml.off)
+
+    def SetRelPos(self, v):
+        self._ml.off = v
+        self._SetDirty(DIRTYFLAGS_MATRIX)
+
+    def GetAbsPos(self):
+        return self.GetRelPos()
+
+    SetAbsPos = SetRelPos
+
+    def GetRelScale(self):
+        return Vector(self._ml.v1.GetLength(), self._ml.v2.GetLength(), self._ml.v3.GetLength())
+
+    def SetRelScale(self, v):
+        m = self._ml
+        m.v1 = m.v1.GetNormalized() * v.x
+        m.v2 = m.v2.GetNormalized() * v.y
+        m.v3 = m.v3.GetNormalized() * v.z
+        self._SetDirty(DIRTYFLAGS_MATRIX)
+
+    def GetRelRot(self):
+        return utils.MatrixToHPB(self._ml)
+
+    def SetRelRot(self, v):
+        scale = self.GetRelScale()
+        m = utils.HPBToMatrix(v)
+        m.off = self._ml.off
+        self._ml = m
+        self.SetRelScale(scale)
+
+    GetAbsRot = GetRelRot
+    SetAbsRot = SetRelRot
+
+    # bounding box
+
+    def GetMp(self):
+        return Vector(0.0)
+
+    def GetRad(self):
+        return Vector(0.0)
+
+
+class PointObject(BaseObject):
+    """ Stand-in for ``c4d.PointObject``. """
+
+    def __init__(self, type, pcnt=0):  # IGNORE:W0622
+        super(PointObject, self).__init__(type)
+        self._points = [Vector(0.0) for _ in range(pcnt)]
+        self._psel = BaseSelect()
+        self._phide = BaseSelect()
+
+    def _CloneData(self, clone):
+        clone._points = [Vector(p) for p in self._points]
+        clone._psel = self._psel.GetClone()
+        clone._phide = self._phide.GetClone()
+
+    def GetPointCount(self):
+        return len(self._points)
+
+    def GetAllPoints(self):
+        return [Vector(p) for p in self._points]
+
+    def SetAllPoints(self, points):
+        if len(points) != len(self._points):
+            raise IndexError("points list has wrong size")
+        self._points = [Vector(p) for p in points]
+        self._SetDirty(DIRTYFLAGS_DATA)
+        return True
+
+    def GetPoint(self, i):
+        return Vector(self._points[i])
+
+    def SetPoint(self, i, v):
+        self._points[i] = Vector(v)
+        self._SetDirty(DIRTYFLAGS_DATA)
+
+    def GetPointS(self):
+        return self._psel
+
+    def GetPointH(self):
+        return self._phide
+
+    def ResizeObject(self, pcnt):
+        cur = len(self._points)
+        if pcnt < cur:
+            del self._points[pcnt:]
+        else:
+            self._points.extend(Vector(0.0) for _ in range(pcnt - cur))
+        self._SetDirty(DIRTYFLAGS_DATA)
+        return True
+
+    def _Bounds(self):
+        if len(self._points) == 0:
+            return (Vector(0.0), Vector(0.0))
+        xs = [p.x for p in self._points]
+        ys = [p.y for p in self._points]
+        zs = [p.z for p in self._points]
+        return (Vector(min(xs), min(ys), min(zs)), Vector(max(xs), max(ys), max(zs)))
+
+    def GetMp(self):
+        lo, hi = self._Bounds()
+        return (lo + hi) * 0.5
+
+    def GetRad(self):
+        lo, hi = self._Bounds()
+        return (hi - lo) * 0.5
+
+
+class PolygonObject(PointObject):
+    """ Stand-in for ``c4d.PolygonObject``. """
+
+    def __init__(self, pcnt=0, vcnt=0):
+        super(PolygonObject, self).__init__(Opolygon, pcnt)
+        self._polys = [CPolygon(0, 0, 0) for _ in range(vcnt)]
+        self._vsel = BaseSelect()
+        self._vhide = BaseSelect()
+        self._esel = BaseSelect()
+
+    def _CloneData(self, clone):
+        super(PolygonObject, self)._CloneData(clone)
+        clone._polys = [CPolygon(p.a, p.b, p.c, p.d) for p in self._polys]
+        clone._vsel = self._vsel.GetClone()
+        clone._vhide = self._vhide.GetClone()
+        clone._esel = self._esel.GetClone()
+
+    def GetPolygonCount(self):
+        return len(self._polys)
+
+    def GetAllPolygons(self):
+        return [CPolygon(p.a, p.b, p.c, p.d) for p in self._polys]
+
+    def GetPolygon(self, i):
+        p = self._polys[i]
+        return CPolygon(p.a, p.b, p.c, p.d)
+
+    def SetPolygon(self, i, p):
+        self._polys[i] = CPolygon(p.a, p.b, p.c, p.d)
+        self._SetDirty(DIRTYFLAGS_DATA)
+
+    def GetPolygonS(self):
+        return self._vsel
+
+    def GetPolygonH(self):
+        return self._vhide
+
+    def GetEdgeS(self):
+        return self._esel
+
+    def ResizeObject(self, pcnt, vcnt=None, ncnt=None):
+        super(PolygonObject, self).ResizeObject(pcnt)
+        if vcnt is not None:
+            cur = len(self._polys)
+            if vcnt < cur:
+                del self._polys[vcnt:]
+            else:
+                self._polys.extend(CPolygon(0, 0, 0) for _ in range(vcnt - cur))
+        return True
+
+
+class SplineObject(PointObject):
+    """ Stand-in for ``c4d.SplineObject``. Segments are stored as
+        ``(cnt, closed)`` pairs. Without segments the spline is one
+        segment and ``IsClosed`` tells whether it is closed.
+    """
+
+    def __init__(self, pcnt=0, type=0):  # IGNORE:W0622
+        super(SplineObject, self).__init__(Ospline, pcnt)
+        self._segments = []
+        self._closed = False
+        self._splinetype = type
+
+    def _CloneData(self, clone):
+        super(SplineObject, self)._CloneData(clone)
+        clone._segments = list(self._segments)
+
+    def GetSegmentCount(self):
+        return len(self._segments)
+
+    def GetSegment(self, id):  # IGNORE:W0622
+        cnt, closed = self._segments[id]
+        return {'cnt': cnt, 'closed': closed}
+
+    def SetSegment(self, id, cnt, closed):  # IGNORE:W0622
+        self._segments[id] = (cnt, closed)
+        self._SetDirty(DIRTYFLAGS_DATA)
+        return True
+
+    def IsClosed(self):
+        return self._closed
+
+    def SetClosed(self, closed):
+        self._closed = closed
+
+    def ResizeObject(self, pcnt, scnt=None):
+        super(SplineObject, self).ResizeObject(pcnt)
+        if scnt is not None:
+            cur = len(self._segments)
+            if scnt < cur:
+                del self._segments[scnt:]
+            else:
+                self._segments.extend((0, False) for _ in range(scnt - cur))
+        return True
+
+
+_TYPENAMES = {
+    Opolygon: "Polygon", Ospline: "Spline", Olight: "Light", Ocamera: "Camera",
+    Onull: "Null", Ocube: "Cube", Osphere: "Sphere", Oplane: "Plane",
+    Osplinetext: "Text", Oconplane: "Construction Plane",
+}
+
+
+def GetC4DVersion():
+    return C4D_VERSION
+
+
+# Calls of the global functions that have side effects in CINEMA 4D
+# are counted, so tests and benchmarks can check how often they happen.
+calls = {'EventAdd': 0, 'StopAllThreads': 0, 'CallCommand': 0, 'DrawViews': 0}
+
+
+def EventAdd(flags=0):
+    calls['EventAdd'] += 1
+
+
+def StopAllThreads():
+    calls['StopAllThreads'] += 1
+
+
+def CallCommand(id, subid=0):  # IGNORE:W0622
+    calls['CallCommand'] += 1
+
+
+def DrawViews(flags=0):
+    calls['DrawViews'] += 1
+    return True
+
+
+def GePrint(s):
+    print(s)
+
+
+def ResetCalls():
+    """ Reset the counters in :py:data:`calls`. """
+    for key in calls:
+        calls[key] = 0
+
+
+from py4dlib.testing.c4dstub import utils  # IGNORE:W0611
+from py4dlib.testing.c4dstub import documents  # IGNORE:W0611
+
+
+_installed = {}
+
+
+def Install(force=False):
+    """ Register the stub as ``c4d``, ``c4d.utils`` and ``c4d.documents``
+        in ``sys.modules``, so that ``import c4d`` picks it up.
+
+        py4dlib modules that were imported before without ``c4d`` get
+        their module level names patched in as well.
+
+        :param bool force: install even if the real ``c4d`` module is
+            importable, i.e. when running inside CINEMA 4D.
+        :return: the module that ``import c4d`` now gives.
+    """
+    current = sys.modules.get('c4d')
+    if current is not None and current is not sys.modules[__name__] and not force:
+        return current
+    if current is None and not force:
+        try:
+            import c4d as real  #@UnresolvedImport @UnusedImport
+            return real
+        except ImportError:
+            pass
+    this = sys.modules[__name__]
+    for name, mod in (('c4d', this), ('c4d.utils', utils), ('c4d.documents', documents)):
+        if name not in _installed:
+            _installed[name] = sys.modules.get(name)
+        sys.modules[name] = mod
+    names = (('c4d', this), ('documents', documents), ('Rad', utils.Rad), ('Deg', utils.Deg), 
+             ('C4D_VERSION', C4D_VERSION))
+    for mod in _LibraryModules():
+        for attr, value in names:
+            if not hasattr(mod, attr):
+                setattr(mod, attr, value)
+    return this
+
+
+def _LibraryModules():
+    """ py4dlib modules that are loaded, except the testing package. """
+    result = []
+    for modname, mod in list(sys.modules.items()):
+        if mod is None or not modname.startswith('py4dlib.') or modname.startswith('py4dlib.testing'):
+            continue
+        result.append(mod)
+    return result
+
+
+def IsInstalled():
+    """ True if ``import c4d`` gives the stub. """
+    return sys.modules.get('c4d') is sys.modules[__name__]
+
+
+def Uninstall():
+    """ Undo :py:func:`Install`. Modules that imported ``c4d`` while the
+        stub was installed lose their reference to it again.
+    """
+    if not _installed:
+        return
+    for name in ('c4d', 'c4d.utils', 'c4d.documents'):
+        if name in _installed:
+            prev = _installed.pop(name)
+            if prev is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = prev
+    this = sys.modules[__name__]
+    stubs = set(id(x) for x in (this, documents, utils.Rad, utils.Deg, C4D_VERSION))
+    for mod in _LibraryModules():
+        for attr in ('c4d', 'documents', 'Rad', 'Deg', 'C4D_VERSION'):
+            if id(getattr(mod, attr, None)) in stubs:
+                delattr(mod, attr)
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+# 
+#       http://www.apache.org/licenses/LICENSE-2.0
+# 
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# 
+#  documents.py
+#  py4dlib.testing.c4dstub
+#  
+#  Created by André Berg on 2026-10-19.
+#  Copyright 2026 Berg Media. All rights reserved.
+#
+#  andre.bergmedia@googlemail.com
+# 
+# pylint: disable-msg=F0401
+
+'''py4dlib.testing.c4dstub.documents -- stand-in for ``c4d.documents``.'''
+
+import itertools
+
+from py4dlib.testing.c4dstub import BIT_ACTIVE
+from py4dlib.testing.c4dstub import SELECTION_NEW, SELECTION_ADD, SELECTION_SUB
+from py4dlib.testing.c4dstub import GETACTIVEOBJECTFLAGS_CHILDREN
+
+__version__ = (0, 1)
+__date__ = '2026-10-19'
+__updated__ = '2026-10-19'
+
+
+_dirty = itertools.count(1)
+
+
+class BaseDocument(object):
+    """ Stand-in for ``c4d.documents.BaseDocument``.
+
+        Undo steps are recorded in ``undos`` as ``(type, object)``
+        tuples so tests can inspect them.
+    """
+
+    def __init__(self):
+        super(BaseDocument, self).__init__()
+        self._first = None
+        self._name = "Untitled"
+        self._undodepth = 0
+        self._stamp = 0
+        self.undos = []
+
+    def _SetDirty(self):
+        self._stamp = next(_dirty)
+
+    def GetDocumentName(self):
+        return self._name
+
+    def SetDocumentName(self, name):
+        self._name = name
+
+    def GetFirstObject(self):
+        return self._first
+
+    def GetObjects(self):
+        result = []
+        op = self._first
+        while op:
+            result.append(op)
+            op = op.GetNext()
+        return result
+
+    def InsertObject(self, op, parent=None, pred=None, checknames=False):
+        if pred is not None:
+            op.InsertAfter(pred)
+        elif parent is not None:
+            op.InsertUnder(parent)
+        else:
+            op.Remove()
+            op._Link(None, None, self._first, self)
+
+    def _Walk(self):
+        stack = self.GetObjects()[::-1]
+        while stack:
+            op = stack.pop()
+            yield op
+            stack.extend(op.GetChildren()[::-1])
+
+    def SearchObject(self, name):
+        for op in self._Walk():
+            if op.GetName() == name:
+                return op
+        return None
+
+    def GetActiveObject(self):
+        active = self.GetActiveObjects(0)
+        if len(active) == 1:
+            return active[0]
+        return None
+
+    def GetActiveObjects(self, flags):
+        result = []
+        for op in self._Walk():
+            if op.GetBit(BIT_ACTIVE):
+                result.append(op)
+        if not flags & GETACTIVEOBJECTFLAGS_CHILDREN:
+            result = [op for op in result if not _HasActiveParent(op)]
+        return result
+
+    def GetSelection(self):
+        return self.GetActiveObjects(GETACTIVEOBJECTFLAGS_CHILDREN)
+
+    def SetActiveObject(self, op, mode=SELECTION_NEW):
+        if mode == SELECTION_NEW:
+            for other in self._Walk():
+                other.DelBit(BIT_ACTIVE)
+        if op is None:
+            return
+        if mode == SELECTION_SUB:
+            op.DelBit(BIT_ACTIVE)
+        elif mode in (SELECTION_NEW, SELECTION_ADD):
+            op.SetBit(BIT_ACTIVE)
+
+    def SetSelection(self, bl, mode=SELECTION_NEW):
+        self.SetActiveObject(bl, mode)
+
+    def StartUndo(self):
+        self._undodepth += 1
+        return True
+
+    def EndUndo(self):
+        self._undodepth = max(0, self._undodepth - 1)
+        return True
+
+    def AddUndo(self, type, data):  # IGNORE:W0622
+        self.undos.append((type, data))
+        return True
+
+
+def _HasActiveParent(op):
+    up = op.GetUp()
+    while up:
+        if up.GetBit(BIT_ACTIVE):
+            return True
+        up = up.GetUp()
+    return False
+
+
+_documents = [BaseDocument()]
+_active = [_documents[0]]
+
+
+def GetActiveDocument():
+    return _active[0]
+
+
+def SetActiveDocument(doc):
+    if doc not in _documents:
+        _documents.append(doc)
+    _active[0] = doc
+
+
+def InsertBaseDocument(doc):
+    if doc not in _documents:
+        _documents.append(doc)
+
+
+def GetFirstDocument():
+    return _documents[0] if _documents else None
+
+
+def ResetDocuments():
+    """ Replace all documents by one new, empty active document. """
+    del _documents[:]
+    _documents.append(BaseDocument())
+    _active[0] = _documents[0]
+    return _active[0]
+
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+# 
+#       http://www.apache.org/licenses/LICENSE-2.0
+# 
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# 
+#  utils.py
+#  py4dlib.testing.c4dstub
+#  
+#  Created by André Berg on 2026-10-19.
+#  Copyright 2026 Berg Media. All rights reserved.
+#
+#  andre.bergmedia@googlemail.com
+# 
+# pylint: disable-msg=F0401
+
+'''py4dlib.testing.c4dstub.utils -- stand-in for ``c4d.utils``.'''
+
+import math
+
+from py4dlib.testing.c4dstub import Vector, Matrix, PointObject, PolygonObject
+from py4dlib.testing.c4dstub import MCOMMAND_MAKEEDITABLE, MCOMMAND_CURRENTSTATETOOBJECT
+
+__version__ = (0, 1)
+__date__ = '2026-10-19'
+__updated__ = '2026-10-19'
+
+
+def Rad(v):
+    return v * math.pi / 180.0
+
+
+def Deg(v):
+    return v * 180.0 / math.pi
+
+
+def VectorEqual(v1, v2, epsilon=0.01):
+    return (abs(v1.x - v2.x) < epsilon and abs(v1.y - v2.y) < epsilon and
+            abs(v1.z - v2.z) < epsilon)
+
+
+def FloatTolerantCompare(a, b):
+    return abs(a - b) < 1e-10
+
+
+def VectorMin(v):
+    return min(v.x, v.y, v.z)
+
+
+def VectorMax(v):
+    return max(v.x, v.y, v.z)
+
+
+def VectorAngle(v1, v2):
+    cos = v1.GetNormalized().Dot(v2.GetNormalized())
+    return math.acos(max(-1.0, min(1.0, cos)))
+
+
+def MatrixMove(v):
+    return Matrix(v)
+
+
+def MatrixScale(v):
+    return Matrix(Vector(0.0), Vector(v.x, 0, 0), Vector(0, v.y, 0), Vector(0, 0, v.z))
+
+
+def MatrixRotX(w):
+    c, s = math.cos(w), math.sin(w)
+    return Matrix(Vector(0.0), Vector(1, 0, 0), Vector(0, c, s), Vector(0, -s, c))
+
+
+def MatrixRotY(w):
+    c, s = math.cos(w), math.sin(w)
+    return Matrix(Vector(0.0), Vector(c, 0, -s), Vector(0, 1, 0), Vector(s, 0, c))
+
+
+def MatrixRotZ(w):
+    c, s = math.cos(w), math.sin(w)
+    return Matrix(Vector(0.0), Vector(c, s, 0), Vector(-s, c, 0), Vector(0, 0, 1))
+
+
+def HPBToMatrix(w, rot_order=None):
+    ss, sn, sk = math.sin(w.x), math.sin(w.y), math.sin(w.z)
+    cs, cn, ck = math.cos(w.x), math.cos(w.y), math.cos(w.z)
+    return Matrix(Vector(0.0),
+                  Vector(ck * cs - sk * sn * ss, -sk * cn, ck * ss + sk * sn * cs),
+                  Vector(sk * cs + ck * sn * ss, ck * cn, sk * ss - ck * sn * cs),
+                  Vector(-cn * ss, sn, cn * cs))
+
+
+def MatrixToHPB(m, rot_order=None):
+    v1 = m.v1.GetNormalized()
+    v2 = m.v2.GetNormalized()
+    v3 = m.v3.GetNormalized()
+    p = math.asin(max(-1.0, min(1.0, v3.y)))
+    if abs(v3.y) > 1.0 - 1e-9:
+        return Vector(math.atan2(v1.z, v1.x), p, 0.0)
+    return Vector(math.atan2(-v3.x, v3.z), p, math.atan2(-v1.y, v2.y))
+
+
+def VectorToHPB(v):
+    return Vector(math.atan2(-v.x, v.z), math.atan2(v.y, math.sqrt(v.x * v.x + v.z * v.z)), 0.0)
+
+
+def SendModelingCommand(command, list, mode=0, bc=None, doc=None, flags=0):  # IGNORE:W0622
+    """ Only ``MCOMMAND_MAKEEDITABLE`` and ``MCOMMAND_CURRENTSTATETOOBJECT``
+        are supported. Point objects are returned as clones, other objects
+        can't be made editable in the stub and give False.
+    """
+    if command not in (MCOMMAND_MAKEEDITABLE, MCOMMAND_CURRENTSTATETOOBJECT):
+        return False
+    result = []
+    for op in list:
+        if not isinstance(op, PointObject):
+            return False
+        result.append(op.GetClone())
+    return result
+
+
+class Neighbor(object):
+    """ Stand-in for ``c4d.utils.Neighbor``. """
+
+    def __init__(self):
+        super(Neighbor, self).__init__()
+        self._pointpolys = []
+        self._edges = {}
+        self._polys = []
+
+    def Init(self, op, bs=None):
+        if not isinstance(op, PolygonObject):
+            raise TypeError("expected PolygonObject")
+        polys = op.GetAllPolygons()
+        pointpolys = [[] for _ in range(op.GetPointCount())]
+        edges = {}
+        for i, p in enumerate(polys):
+            if bs is not None and not bs.IsSelected(i):
+                continue
+            corners = [p.a, p.b, p.c] if p.c == p.d else [p.a, p.b, p.c, p.d]
+            for k, a in enumerate(corners):
+                pointpolys[a].append(i)
+                b = corners[(k + 1) % len(corners)]
+                edges.setdefault((min(a, b), max(a, b)), []).append(i)
+        self._pointpolys = pointpolys
+        self._edges = edges
+        self._polys = polys
+        return True
+
+    def GetPointPolys(self, pnt):
+        return list(self._pointpolys[pnt])
+
+    def GetNeighbor(self, a, b, poly):
+        for other in self._edges.get((min(a, b), max(a, b)), ()):
+            if other != poly:
+                return other
+        return -1
+
+    def GetEdgePolys(self, a, b):
+        polys = self._edges.get((min(a, b), max(a, b)), [])
+        first = polys[0] if len(polys) > 0 else -1
+        second = polys[1] if len(polys) > 1 else -1
+        return (first, second)
+
+    def GetEdgeCount(self):
+        return len(self._edges)
+
+    def GetPointOneRingPoints(self, pnt):
+        result = set()
+        for a, b in self._edges:
+            if a == pnt:
+                result.add(b)
+            elif b == pnt:
+                result.add(a)
+        return sorted(result)
+
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+# 
+#       http://www.apache.org/licenses/LICENSE-2.0
+# 
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
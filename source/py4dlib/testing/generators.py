@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+# 
+#  generators.py
+#  py4dlib.testing
+#  
+#  Created by André Berg on 2026-10-19.
+#  Copyright 2026 Berg Media. All rights reserved.
+#
+#  andre.bergmedia@googlemail.com
+# 
+# pylint: disable-msg=F0401
+
+'''py4dlib.testing.generators -- reproducible meshes and scenes for load testing.
+
+Mesh generators return a ``tuple`` of ``(points, polys)`` arrays with shapes
+``(N, 3)`` and ``(M, 4)``, i.e. the same form :py:func:`py4dlib.mesh.MeshToArrays`
+gives, so they can be passed straight to the mesh kernels or turned into
+a ``c4d.PolygonObject`` with :py:func:`py4dlib.mesh.ArraysToMesh`.
+
+Object generators work with whatever ``import c4d`` gives at call time,
+the real module or the stub from :py:mod:`py4dlib.testing.c4dstub`.
+'''
+
+import os
+import math
+
+__version__ = (0, 1)
+__date__ = '2026-10-19'
+__updated__ = '2026-10-19'
+
+
+DEBUG = 0 or ('DebugLevel' in os.environ and os.environ['DebugLevel'] > 0)
+TESTRUN = 0 or ('TestRunLevel' in os.environ and os.environ['TestRunLevel'] > 0)
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from py4dlib.maths import _RequireNumpy
+from py4dlib.mesh import ArraysToMesh
+
+
+MESH_KINDS = ('grid', 'sphere', 'scan', 'mixed')
+
+# names used by the "repeated" and "unicode" name distributions
+NAME_POOL = [u'Cube', u'Sphere', u'Null', u'Group', u'Polygon', u'Spline']
+UNICODE_POOL = [u'Würfel', u'Kugel', u'Géométrie', u'Куб',
+                u'Null', u'Straße']
+
+
+def _C4D():
+    # resolved at call time so that an installed stub is picked up
+    import c4d  #@UnresolvedImport
+    return c4d
+
+
+def _GridPolys(nx, ny):
+    idx = np.arange((nx + 1) * (ny + 1), dtype=np.int32).reshape(ny + 1, nx + 1)
+    polys = np.empty((ny, nx, 4), dtype=np.int32)
+    polys[..., 0] = idx[:-1, :-1]
+    polys[..., 1] = idx[:-1, 1:]
+    polys[..., 2] = idx[1:, 1:]
+    polys[..., 3] = idx[1:, :-1]
+    return polys.reshape(-1, 4)
+
+
+def GridMesh(nx, ny, size=1.0):
+    """ Flat grid of ``nx * ny`` quads in the XZ plane,
+        starting at the origin.
+
+        :param float size: edge length of one quad.
+        :return: ``tuple`` of ``(points, polys)``.
+    """
+    _RequireNumpy()
+    if nx < 1 or ny < 1:
+        raise ValueError("E: grid needs at least 1 x 1 polygons, got %d x %d" % (nx, ny))
+    xs, zs = np.meshgrid(np.arange(nx + 1, dtype=np.float64) * size,
+                         np.arange(ny + 1, dtype=np.float64) * size)
+    points = np.column_stack((xs.ravel(), np.zeros(xs.size), zs.ravel()))
+    return (points, _GridPolys(nx, ny))
+
+
+def SphereMesh(n, radius=100.0):
+    """ Sphere made from a cube whose faces were subdivided into ``n * n``
+        quads each and projected onto the sphere.
+
+        Points on the cube's edges are shared between faces, so the result
+        is closed and has ``6 * n * n`` polygons.
+
+        :return: ``tuple`` of ``(points, polys)``.
+    """
+    _RequireNumpy()
+    if n < 1:
+        raise ValueError("E: n must be at least 1, got %d" % n)
+    # integer coordinates on the cube [-n, n]^3 with a step of 2
+    t = np.arange(-n, n + 1, 2, dtype=np.int64)
+    u, v = np.meshgrid(t, t)
+    u = u.ravel()
+    v = v.ravel()
+    w = np.full(u.shape, n, dtype=np.int64)
+    faces = [(u, v, -w), (v, u, w), (v, -w, u), (u, w, v), (-w, u, v), (w, v, u)]
+    cube = np.vstack([np.column_stack(f) for f in faces])
+    polys = _GridPolys(n, n)
+    cnt = (n + 1) * (n + 1)
+    polys = np.vstack([polys + i * cnt for i in range(6)])
+    # weld the shared edge points through a unique integer key per position
+    span = 2 * n + 1
+    keys = ((cube[:, 0] + n) * span + (cube[:, 1] + n)) * span + (cube[:, 2] + n)
+    keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    points = cube[first].astype(np.float64)
+    points *= radius / np.sqrt((points * points).sum(axis=1))[:, np.newaxis]
+    # reverse the corner order so that the normals point outwards
+    return (points, inverse[polys[:, ::-1]].astype(np.int32))
+
+
+def ScanMesh(nx, ny, size=1.0, noise=0.05, duplicates=0.1, seed=0):
+    """ Height field grid resembling scanned data: point positions are
+        jittered and some polygons reference duplicated instead of shared
+        points, like meshes from scanners or importers often do.
+
+        :param float noise: amount of jitter relative to ``size``.
+        :param float duplicates: fraction of polygons whose corners
+            get their own copies of the points.
+        :param int seed: seed for the random generator.
+        :return: ``tuple`` of ``(points, polys)``.
+    """
+    _RequireNumpy()
+    if not 0.0 <= duplicates <= 1.0:
+        raise ValueError("E: duplicates must be in the range [0, 1], got %r" % duplicates)
+    rng = np.random.RandomState(seed)
+    points, polys = GridMesh(nx, ny, size)
+    xs = points[:, 0] / (nx * size) * 2.0 * math.pi
+    zs = points[:, 2] / (ny * size) * 2.0 * math.pi
+    points[:, 1] = (np.sin(xs * 2.0) * np.cos(zs * 3.0)) * size * 2.0
+    points += rng.normal(0.0, noise * size, points.shape)
+    dup = np.flatnonzero(rng.random_sample(len(polys)) < duplicates)
+    if len(dup) > 0:
+        corners = polys[dup].ravel()
+        polys[dup] = np.arange(len(points), len(points) + len(corners),
+                               dtype=np.int32).reshape(-1, 4)
+        points = np.vstack((points, points[corners]))
+    return (points, polys)
+
+
+def MixedMesh(nx, ny, size=1.0, tris=0.5, seed=0):
+    """ Grid where a fraction of the quads is split into two triangles.
+
+        Triangles follow CINEMA 4D's convention of ``c == d``.
+
+        :param float tris: fraction of quads to split.
+        :param int seed: seed for the random generator.
+        :return: ``tuple`` of ``(points, polys)``.
+    """
+    _RequireNumpy()
+    if not 0.0 <= tris <= 1.0:
+        raise ValueError("E: tris must be in the range [0, 1], got %r" % tris)
+    rng = np.random.RandomState(seed)
+    points, polys = GridMesh(nx, ny, size)
+    split = rng.random_sample(len(polys)) < tris
+    quads = polys[~split]
+    halves = polys[split]
+    first = halves[:, [0, 1, 2, 2]]
+    second = halves[:, [0, 2, 3, 3]]
+    result = np.vstack((quads, first, second))
+    order = rng.permutation(len(result))
+    return (points, result[order])
+
+
+def GenerateMesh(kind, polycount, seed=0, **kwargs):
+    """ Generate a mesh of ``kind`` with roughly ``polycount`` polygons.
+
+        :param str kind: one of ``grid``, ``sphere``, ``scan`` or ``mixed``.
+        :param kwargs: passed on to the generator function.
+        :return: ``tuple`` of ``(points, polys)``.
+    """
+    if kind not in MESH_KINDS:
+        raise ValueError("E: kind must be one of %s, got %r" % (list(MESH_KINDS), kind))
+    if polycount < 1:
+        raise ValueError("E: polycount must be at least 1, got %r" % polycount)
+    if kind == 'sphere':
+        return SphereMesh(max(1, int(round(math.sqrt(polycount / 6.0)))), **kwargs)
+    if kind == 'mixed':
+        # every split quad adds one polygon
+        tris = kwargs.get('tris', 0.5)
+        polycount = polycount / (1.0 + tris)
+    nx = max(1, int(round(math.sqrt(polycount))))
+    ny = max(1, int(round(polycount / float(nx))))
+    if kind == 'grid':
+        return GridMesh(nx, ny, **kwargs)
+    if kind == 'scan':
+        return ScanMesh(nx, ny, seed=seed, **kwargs)
+    return MixedMesh(nx, ny, seed=seed, **kwargs)
+
+
+def CreateMeshObject(mesh, name="Mesh", parent=None, doc=None):
+    """ Turn a ``(points, polys)`` tuple into a ``c4d.PolygonObject``
+        and insert it into ``doc``.
+
+        :param parent: object to insert under. If None the object
+            is inserted at the top of the document.
+        :param doc: if None uses the active document.
+    """
+    c4d = _C4D()
+    if doc is None:
+        doc = c4d.documents.GetActiveDocument()
+    obj = ArraysToMesh(mesh[0], mesh[1])
+    obj.SetName(name)
+    doc.InsertObject(obj, parent)
+    return obj
+
+
+def _NameFunc(names, rng):
+    if callable(names):
+        return names
+    if isinstance(names, (list, tuple)):
+        pool = list(names)
+        return lambda lvl, num: pool[rng.randint(len(pool))]
+    if names == 'unique':
+        return lambda lvl, num: u'Object.%d' % num
+    if names == 'repeated':
+        return lambda lvl, num: NAME_POOL[rng.randint(len(NAME_POOL))]
+    if names == 'unicode':
+        return lambda lvl, num: u'%s %d' % (UNICODE_POOL[rng.randint(len(UNICODE_POOL))], lvl)
+    raise ValueError("E: names must be one of ['unique', 'repeated', 'unicode'], "
+                     "a list of names or a function, got %r" % (names,))
+
+
+def _FanoutFunc(fanout, rng):
+    if isinstance(fanout, (list, tuple)):
+        if len(fanout) != 2 or fanout[0] > fanout[1]:
+            raise ValueError("E: fanout range must be (min, max), got %r" % (fanout,))
+        lo, hi = fanout
+        return lambda: rng.randint(lo, hi + 1)
+    if fanout < 0:
+        raise ValueError("E: fanout must not be negative, got %r" % fanout)
+    return lambda: fanout
+
+
+def BuildHierarchy(depth, fanout, names='unique', roots=1, typ=None,
+                   parent=None, doc=None, seed=0):
+    """ Build a tree of objects for testing hierarchy traversal and lookups.
+
+        :param int depth: number of levels below the root objects.
+        :param fanout: number of children per object, either an ``int``
+            or a ``tuple`` of ``(min, max)`` to pick from at random.
+        :param names: name distribution, one of
+
+            - ``unique``: every object gets its own name.
+            - ``repeated``: names are picked from a small pool,
+              so many objects share the same name.
+            - ``unicode``: names with high-order chars from a small pool.
+            - a ``list`` of names to pick from at random.
+            - a function taking ``(lvl, num)`` and returning the name.
+
+        :param int roots: number of objects on the top level.
+        :param int typ: object type. Defaults to ``c4d.Onull``.
+        :param parent: object to insert the roots under.
+        :param doc: if None uses the active document.
+        :param int seed: seed for the random generator.
+        :return: ``list`` of all created objects in depth first order.
+    """
+    _RequireNumpy()
+    c4d = _C4D()
+    if depth < 0:
+        raise ValueError("E: depth must not be negative, got %r" % depth)
+    if typ is None:
+        typ = c4d.Onull
+    if doc is None:
+        doc = c4d.documents.GetActiveDocument()
+    rng = np.random.RandomState(seed)
+    namefunc = _NameFunc(names, rng)
+    fanoutfunc = _FanoutFunc(fanout, rng)
+    num = [0]
+
+    def Make(lvl):
+        op = c4d.BaseObject(typ)
+        op.SetName(namefunc(lvl, num[0]))
+        num[0] += 1
+        return op
+
+    tops = [Make(0) for _ in range(roots)]
+    # inserting in reverse order with InsertUnder is O(1) per object
+    for op in reversed(tops):
+        if parent is None:
+            doc.InsertObject(op)
+        else:
+            op.InsertUnder(parent)
+    stack = [(op, 0) for op in reversed(tops)]
+    result = []
+    while stack:
+        op, lvl = stack.pop()
+        result.append(op)
+        if lvl >= depth:
+            continue
+        children = [Make(lvl + 1) for _ in range(fanoutfunc())]
+        for child in reversed(children):
+            child.InsertUnder(op)
+        stack.extend((child, lvl + 1) for child in reversed(children))
+    return result
+
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+# 
+#       http://www.apache.org/licenses/LICENSE-2.0
+# 
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
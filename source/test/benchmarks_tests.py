@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# 
+#  test.benchmarks_tests
+#  py4dlib
+#  
+#  Created by André Berg on 2026-10-19.
+#  Copyright 2026 Berg Media. All rights reserved.
+#
+#  andre.bergmedia@googlemail.com
+# 
+# pylint: disable-msg=F0401
+
+import os
+import shutil
+import tempfile
+import unittest
+
+__version__ = (0, 1)
+__date__ = '2026-10-19'
+__updated__ = '2026-10-19'
+
+
+DEBUG = 0 or ('DebugLevel' in os.environ and os.environ['DebugLevel'] > 0)
+TESTRUN = 0 or ('TestRunLevel' in os.environ and os.environ['TestRunLevel'] > 0)
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from py4dlib.testing.benchmarks import Benchmark, Percentile, Measure, Select, Run
+from py4dlib.testing.benchmarks import Compare, Save, Load, Main, TIERS
+from py4dlib.testing import c4dstub
+
+
+class Test(unittest.TestCase):
+
+    def testPercentile(self):
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(Percentile(values, 50), 3)
+        self.assertEqual(Percentile(values, 95), 5)
+        self.assertEqual(Percentile(values, 0), 1)
+        self.assertEqual(Percentile(range(1, 101), 95), 95)
+        self.assertRaises(ValueError, Percentile, [], 50)
+
+    def testMeasure(self):
+        calls = []
+        stats = Measure(calls.append, 1, repeat=4)
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(stats['repeat'], 4)
+        self.assertTrue(stats['min'] <= stats['median'] <= stats['p95'])
+        self.assertRaises(ValueError, Measure, calls.append, 1, 0)
+
+    def testBenchmark(self):
+        bench = Benchmark('mesh', 'Foo', None, None, scale=0.1)
+        self.assertEqual(bench.key, 'mesh.Foo')
+        self.assertEqual(bench.Size('medium'), TIERS['medium'] // 10)
+        self.assertEqual(bench.Size('tiny'), 10)
+        self.assertTrue(all(b.group == 'objects' for b in Select(['objects'])))
+        self.assertEqual([b.key for b in Select(pattern='FindObjects')], ['objects.FindObjects'])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def testRun(self):
+        benchmarks = Select(pattern='Calc') + Select(['objects'])
+        installed = c4dstub.IsInstalled()
+        run = Run(benchmarks, tiers=['tiny'], repeat=2)
+        # the stub is only installed for the run
+        self.assertEqual(c4dstub.IsInstalled(), installed)
+        self.assertTrue(run['meta']['stub'])
+        self.assertEqual(sorted(run['results']), sorted('%s/tiny' % b.key for b in benchmarks))
+        stats = run['results']['objects.FindObject/tiny']
+        self.assertEqual((stats['tier'], stats['size'], stats['repeat']), ('tiny', 10, 2))
+        self.assertRaises(ValueError, Run, benchmarks, ['gigantic'])
+
+    def testCompare(self):
+        def Result(**kwargs):
+            return {'results': dict((k, {'median': v, 'min': v}) for k, v in kwargs.items())}
+        baseline = Result(a=1.0, b=1.0, c=1.0, d=1e-6)
+        run = Result(a=1.05, b=1.5, c=0.5, d=2e-6, e=9.0)
+        self.assertEqual(Compare(run, baseline), [('b', 1.0, 1.5, 1.5)])
+        self.assertEqual([r[0] for r in Compare(run, baseline, threshold=0.01)], ['b', 'a'])
+        self.assertEqual(len(Compare(run, baseline, floor=0.0)), 2)
+        self.assertRaises(ValueError, Compare, run, baseline, stat='max')
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def testMain(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = tmpdir + '/run.json'
+            args = ['-k', 'CalcPolyAreas', '-t', 'tiny', '-r', '1']
+            self.assertEqual(Main(args + ['-o', path]), 0)
+            run = Load(path)
+            self.assertEqual(list(run['results']), ['mesh.CalcPolyAreas/tiny'])
+            run['results']['mesh.CalcPolyAreas/tiny']['median'] = 0.0
+            Save(run, path)
+            self.assertEqual(Main(args + ['-b', path, '--threshold', '0']), 1)
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
+
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+# 
+#       http://www.apache.org/licenses/LICENSE-2.0
+# 
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# 
+#  test.c4dstub_tests
+#  py4dlib
+#  
+#  Created by André Berg on 2026-10-19.
+#  Copyright 2026 Berg Media. All rights reserved.
+#
+#  andre.bergmedia@googlemail.com
+# 
+# pylint: disable-msg=F0401
+
+import os
+import math
+import unittest
+
+__version__ = (0, 1)
+__date__ = '2026-10-19'
+__updated__ = '2026-10-19'
+
+
+DEBUG = 0 or ('DebugLevel' in os.environ and os.environ['DebugLevel'] > 0)
+TESTRUN = 0 or ('TestRunLevel' in os.environ and os.environ['TestRunLevel'] > 0)
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from py4dlib.testing import c4dstub
+from py4dlib.testing.c4dstub import documents, utils
+from py4dlib.maths import TransformPoints, VectorsToArray, QuatsFromHPB, QuatsToMatrices
+from py4dlib.maths import MatrixToArray
+from py4dlib.objects import ObjectIterator, FindObject, CreateObject, CenterObjectAxis
+from py4dlib.mesh import SelectPolys, GetSelectedPolys, MeshToArrays, ArraysToMesh, CalcPolyArea
+from py4dlib.mesh import CalcConvexHull
+
+from test.mesh_tests import GridArrays
+
+
+def Tree(doc):
+    """ Build  A(A1(A11), A2), B  in ``doc`` and return the objects by name. """
+    objs = {}
+    for name in ['A', 'A1', 'A11', 'A2', 'B']:
+        objs[name] = c4dstub.BaseObject(c4dstub.Onull)
+        objs[name].SetName(name)
+    doc.InsertObject(objs['B'])
+    doc.InsertObject(objs['A'])
+    objs['A1'].InsertUnder(objs['A'])
+    objs['A2'].InsertUnderLast(objs['A'])
+    objs['A11'].InsertUnder(objs['A1'])
+    return objs
+
+
+class Test(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        c4dstub.Install(force=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        c4dstub.Uninstall()
+
+    def setUp(self):
+        self.doc = documents.ResetDocuments()
+        c4dstub.ResetCalls()
+
+    def testInstall(self):
+        import c4d  #@UnresolvedImport
+        from c4d import documents as docs  #@UnresolvedImport
+        self.assertTrue(c4d is c4dstub)
+        self.assertTrue(docs is documents)
+        self.assertTrue(c4d.utils is utils)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def testVectorMatrix(self):
+        V = c4dstub.Vector
+        v = V(1, 2, 3)
+        self.assertEqual(v * V(1, 1, 1), 6)
+        self.assertEqual(v % V(0, 0, 1), V(2, -1, 0))
+        m = utils.MatrixRotY(0.3) * utils.MatrixScale(V(1, 2, 3))
+        m.off = V(5, 0, -1)
+        expected = TransformPoints(VectorsToArray([v]), MatrixToArray(m))[0]
+        self.assertTrue(np.allclose([(v * m).x, (v * m).y, (v * m).z], expected))
+        direction = TransformPoints(VectorsToArray([v]), MatrixToArray(m), direction=True)[0]
+        self.assertTrue(np.allclose([(v ^ m).x, (v ^ m).y, (v ^ m).z], direction))
+        back = (v * m) * ~m
+        self.assertTrue(utils.VectorEqual(back, v, 1e-9))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def testHPBConversions(self):
+        hpb = c4dstub.Vector(0.4, -0.7, 1.1)
+        m = utils.HPBToMatrix(hpb)
+        expected = QuatsToMatrices(QuatsFromHPB(np.array([[0.4, -0.7, 1.1]])))[0]
+        self.assertTrue(np.allclose(MatrixToArray(m), expected))
+        self.assertTrue(utils.VectorEqual(utils.MatrixToHPB(m), hpb, 1e-9))
+
+    def testHierarchy(self):
+        objs = Tree(self.doc)
+        names = [op.GetName() for op in self.doc.GetObjects()]
+        self.assertEqual(names, ['A', 'B'])
+        self.assertEqual([op.GetName() for op in objs['A'].GetChildren()], ['A1', 'A2'])
+        self.assertTrue(objs['A11'].GetUp() is objs['A1'])
+        self.assertTrue(objs['A2'].GetPred() is objs['A1'])
+        self.assertTrue(self.doc.SearchObject('A11') is objs['A11'])
+        dirty = objs['A'].GetDirty(c4dstub.DIRTYFLAGS_CHILDREN)
+        objs['A1'].Remove()
+        self.assertTrue(objs['A'].GetDirty(c4dstub.DIRTYFLAGS_CHILDREN) > dirty)
+        self.assertEqual([op.GetName() for op in objs['A'].GetChildren()], ['A2'])
+        self.assertTrue(objs['A1'].GetUp() is None)
+        self.assertTrue(self.doc.SearchObject('A11') is None)
+        clone = objs['A'].GetClone()
+        self.assertEqual([op.GetName() for op in clone.GetChildren()], ['A2'])
+        self.assertFalse(clone.GetDown() is objs['A2'])
+
+    def testGlobalMatrix(self):
+        objs = Tree(self.doc)
+        V = c4dstub.Vector
+        objs['A'].SetMl(utils.MatrixMove(V(10, 0, 0)) * utils.MatrixRotZ(math.pi / 2))
+        objs['A1'].SetRelPos(V(1, 0, 0))
+        self.assertTrue(utils.VectorEqual(objs['A1'].GetMg().off, V(10, 1, 0), 1e-9))
+        objs['A1'].SetMg(c4dstub.Matrix(V(0, 0, 5)))
+        self.assertTrue(utils.VectorEqual(objs['A1'].GetMg().off, V(0, 0, 5), 1e-9))
+        self.assertTrue(utils.VectorEqual(objs['A11'].GetMg().off, V(0, 0, 5), 1e-9))
+
+    def testBaseSelect(self):
+        bs = c4dstub.BaseSelect()
+        bs.Select(2)
+        bs.SelectAll(4, 5)
+        bs.Toggle(2)
+        self.assertEqual(bs.GetCount(), 2)
+        self.assertEqual(bs.GetAll(6), [0, 0, 0, 0, 1, 1])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def testNeighbor(self):
+        op = ArraysToMesh(*GridArrays(2, 2))
+        nb = utils.Neighbor()
+        nb.Init(op)
+        self.assertEqual(nb.GetEdgeCount(), 12)
+        self.assertEqual(sorted(nb.GetPointPolys(4)), [0, 1, 2, 3])
+        self.assertEqual(nb.GetNeighbor(1, 4, 0), 1)
+        self.assertEqual(nb.GetNeighbor(0, 1, 0), -1)
+
+    def testLibrary(self):
+        objs = Tree(self.doc)
+        visited = [(op.GetName(), lvl) for op, lvl in ObjectIterator(objs['A'])]
+        self.assertEqual(visited, [('A1', 1), ('A11', 2), ('A2', 1)])
+        self.assertTrue(FindObject('A2') is objs['A2'])
+        null = CreateObject(c4dstub.Onull, 'Created')
+        self.assertTrue(self.doc.GetFirstObject() is null)
+        self.assertEqual(c4dstub.calls['EventAdd'], 1)
+        self.assertEqual(self.doc.undos, [(c4dstub.UNDOTYPE_NEW, null)])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def testMesh(self):
+        points, polys = GridArrays(2, 2)
+        op = ArraysToMesh(points + [1, 0, 1], polys)
+        self.doc.InsertObject(op)
+        SelectPolys([1, 3], op)
+        self.assertEqual(GetSelectedPolys(op), [1, 3])
+        poly = op.GetPolygon(1)
+        pnts = [op.GetPoint(i) for i in (poly.a, poly.b, poly.c, poly.d)]
+        self.assertAlmostEqual(CalcPolyArea(poly, op), 1.0)
+        self.assertAlmostEqual(CalcPolyArea(pnts, op), 1.0)
+        CenterObjectAxis(op)
+        self.assertTrue(utils.VectorEqual(op.GetMg().off, c4dstub.Vector(2, 0, 2), 1e-9))
+        pnts, plys = MeshToArrays(op)
+        self.assertTrue(np.allclose(pnts, points - [1, 0, 1]))
+        self.assertEqual(plys.tolist(), polys.tolist())
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def testCalcConvexHull(self):
+        points = np.vstack((GridArrays(2, 2)[0], [[1, 1, 1]]))
+        op = ArraysToMesh(points, np.zeros((0, 4), dtype=np.int32))
+        for ids in ([0, 2, 6, 8, 9], list(np.array([0, 2, 6, 8, 9])), [0L, 2L, 6L, 8L, 9L]):
+            hull = CalcConvexHull(ids, obj=op)
+            self.assertTrue(isinstance(hull, c4dstub.PolygonObject))
+            self.assertEqual(hull.GetPointCount(), 5)
+            self.assertEqual(hull.GetPolygonCount(), 6)
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
+
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+# 
+#       http://www.apache.org/licenses/LICENSE-2.0
+# 
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
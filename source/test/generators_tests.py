@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# 
+#  test.generators_tests
+#  py4dlib
+#  
+#  Created by André Berg on 2026-10-19.
+#  Copyright 2026 Berg Media. All rights reserved.
+#
+#  andre.bergmedia@googlemail.com
+# 
+# pylint: disable-msg=F0401
+
+import os
+import unittest
+
+__version__ = (0, 1)
+__date__ = '2026-10-19'
+__updated__ = '2026-10-19'
+
+
+DEBUG = 0 or ('DebugLevel' in os.environ and os.environ['DebugLevel'] > 0)
+TESTRUN = 0 or ('TestRunLevel' in os.environ and os.environ['TestRunLevel'] > 0)
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from py4dlib.testing import c4dstub
+from py4dlib.testing.c4dstub import documents
+from py4dlib.testing.generators import GridMesh, SphereMesh, ScanMesh, MixedMesh
+from py4dlib.testing.generators import GenerateMesh, BuildHierarchy, MESH_KINDS
+from py4dlib.mesh import CalcPolyNormals, GetEdgeArray
+from py4dlib.objects import ObjectIterator
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class Test(unittest.TestCase):
+
+    def testGridMesh(self):
+        points, polys = GridMesh(3, 2, size=2.0)
+        self.assertEqual(points.shape, (12, 3))
+        self.assertEqual(polys[0].tolist(), [0, 1, 5, 4])
+        self.assertEqual(points.max(axis=0).tolist(), [6, 0, 4])
+        self.assertRaises(ValueError, GridMesh, 0, 2)
+
+    def testSphereMesh(self):
+        points, polys = SphereMesh(4, radius=10.0)
+        self.assertEqual(len(polys), 96)
+        # closed: every edge is shared by two quads
+        self.assertEqual(len(GetEdgeArray((points, polys))), 96 * 2)
+        self.assertEqual(len(points), 96 + 2)
+        self.assertTrue(np.allclose(np.sqrt((points * points).sum(axis=1)), 10.0))
+        normals, valid = CalcPolyNormals((points, polys))
+        centers = points[polys].mean(axis=1)
+        self.assertTrue(valid.all())
+        self.assertTrue(((normals * centers).sum(axis=1) > 0).all())
+
+    def testScanMesh(self):
+        points, polys = ScanMesh(10, 10, duplicates=0.2, seed=1)
+        again = ScanMesh(10, 10, duplicates=0.2, seed=1)
+        self.assertTrue(np.array_equal(points, again[0]))
+        self.assertTrue(len(points) > 121)
+        dup = (polys >= 121).all(axis=1)
+        self.assertEqual(len(points), 121 + 4 * dup.sum())
+        self.assertEqual(len(ScanMesh(10, 10, duplicates=0.0)[0]), 121)
+
+    def testMixedMesh(self):
+        points, polys = MixedMesh(10, 10, tris=0.3)
+        tris = (polys[:, 2] == polys[:, 3]).sum()
+        self.assertEqual(len(polys), 100 + tris // 2)
+        self.assertEqual(len(points), 121)
+        self.assertEqual(MixedMesh(4, 4, tris=0.0)[1].shape, (16, 4))
+
+    def testGenerateMesh(self):
+        for kind in MESH_KINDS:
+            polys = GenerateMesh(kind, 1000)[1]
+            self.assertTrue(800 < len(polys) < 1200, "%s: %d" % (kind, len(polys)))
+        self.assertRaises(ValueError, GenerateMesh, 'cube', 1000)
+
+    def testBuildHierarchy(self):
+        c4dstub.Install(force=True)
+        try:
+            doc = documents.ResetDocuments()
+            objs = BuildHierarchy(3, 2, roots=2)
+            self.assertEqual(len(objs), 2 * 15)
+            self.assertTrue(doc.GetFirstObject() is objs[0])
+            self.assertEqual([op.GetName() for op in objs[0].GetChildren()],
+                             [u'Object.2', u'Object.3'])
+            visited = [op for op, _ in ObjectIterator(objs[0], children_only=False)]
+            self.assertEqual(visited, objs)
+            objs = BuildHierarchy(1, 50, names=['A', 'B'], parent=objs[-1])
+            self.assertEqual(set(op.GetName() for op in objs[1:]), set(['A', 'B']))
+            self.assertEqual(objs[0].GetUp().GetName(), u'Object.29')
+        finally:
+            c4dstub.Uninstall()
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
+
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+# 
+#       http://www.apache.org/licenses/LICENSE-2.0
+# 
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
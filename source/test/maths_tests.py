@@ -29,7 +29,26 @@ except ImportError:
     if TESTRUN == 1:
         pass
 
+from py4dlib import maths
 from py4dlib.maths import Det, UnitNormal, Transpose, VLerp, VNLerp, VSLerp
+from py4dlib.maths import Plane, RayPlaneIntersections, RayTriangleIntersections
+from py4dlib.maths import PointsInTriangles, PointsInPolygon
+from py4dlib.maths import SegmentsClosestPoints, CloseSegmentPairs
+from py4dlib.maths import OrientedBBoxFromPoints, BoundingSphereFromPoints, ConvexHull
+from py4dlib.maths import _MinBallOfSmallSet as MinBallOfSmallSet
+from py4dlib.maths import MatrixToArray, TransformPoints, ListListToMatrix
+from py4dlib.maths import MatricesToArray, TransposeArray, MulMatrixArray
+from py4dlib.maths import DetArray, UnitNormals
+from py4dlib.maths import BuildMatrixArray, BuildMatrix2Array, BuildMatrix3Array
+from py4dlib.maths import VLerpArray, VNLerpArray, VSLerpArray
+from py4dlib.maths import VDegArray, VRadArray, WrapPiArray, SafeAcosArray, WrapPi, SafeAcos
+from py4dlib.maths import Quaternion, QuatsToList, QuatsFromHPB, QuatsToHPB, QuatsToMatrices
+from py4dlib.maths import QuatsFromMatrices, QuatMulArray, QuatRotateArray, QuatNLerpArray, QuatSLerpArray
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 eps = 0.000001
 
@@ -104,6 +123,15 @@ class CPolygonMock(object):
         self.d = d
 
 
+class MatrixMock(object):
+    """ Mock object for c4d.Matrix """
+    def __init__(self, off=None, v1=None, v2=None, v3=None):
+        self.off = off or VectorMock(0, 0, 0)
+        self.v1 = v1 or VectorMock(1, 0, 0)
+        self.v2 = v2 or VectorMock(0, 1, 0)
+        self.v3 = v3 or VectorMock(0, 0, 1)
+
+
 class Test(unittest.TestCase):
 
 
@@ -175,7 +203,434 @@ class Test(unittest.TestCase):
         
         self.assertEquals(vsl, expected)
         print(vsl)
+
+    def testQuaternion(self):
+        # quarter turn around Y
+        q = Quaternion.FromAxisAngle(VectorMock(0, 1, 0), math.pi / 2)
+        v = q.Rotate(VectorMock(0, 0, 1))
+        self.assertEquals(v, VectorMock(1, 0, 0))
+        self.assertEquals(q * q.GetConjugate(), Quaternion())
+        self.assertFalse(q == None)
+        self.assertTrue(q != 1.0)
+        self.assertNotEqual(Quaternion(), (1, 0, 0, 0))
+        self.assertEquals((q * q).Rotate(VectorMock(0, 0, 1)), VectorMock(0, 0, -1))
+        half = Quaternion().SLerp(q)
+        self.assertEquals(half, Quaternion.FromAxisAngle(VectorMock(0, 1, 0), math.pi / 4))
+        self.assertEquals(Quaternion().NLerp(-q, 1.0), q)
+        # heading turns the Z axis towards -X
+        hpb = Quaternion.FromHPB(VectorMock(math.pi / 2, 0, 0))
+        self.assertEquals(hpb.Rotate(VectorMock(0, 0, 1)), VectorMock(-1, 0, 0))
+
+    def testRequireNumpy(self):
+        # the array functions need numpy, the rest of the module doesn't
+        saved = maths.np
+        maths.np = None
+        try:
+            self.assertRaises(ImportError, TransformPoints, [VectorMock(1)], MatrixMock())
+            self.assertRaises(ImportError, VLerpArray, [VectorMock(1)], [VectorMock(2)])
+            self.assertEquals(VLerp(VectorMock(0), VectorMock(2), 0.5), VectorMock(1))
+        finally:
+            maths.np = saved
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class ArrayTest(unittest.TestCase):
+
+    def testLerpArrays(self):
+        vs = VectorMock(2, 2, 2)
+        ve = VectorMock(4, 4, 4)
+        self.assertEquals(VLerp(vs, ve, 0.0), vs)
+        self.assertRaises(ValueError, VLerp, vs, ve, -0.1)
+        a = np.array([[2, 2, 2], [0, 0, 0]], dtype=np.float64)
+        b = np.array([[4, 4, 4], [0, 0, 0]], dtype=np.float64)
+        self.assertEqual(VLerpArray(a, b).tolist(), [[3, 3, 3], [0, 0, 0]])
+        self.assertEqual(VLerpArray(a, b, [0.0, 1.0]).tolist(), [[2, 2, 2], [0, 0, 0]])
+        self.assertEqual(VLerpArray(a, b, np.array([0.0, 0.5, 1.0])[:, np.newaxis]).shape, (3, 2, 3))
+        self.assertEqual(VLerpArray(vs, ve, [0.0, 1.0]).tolist(), [[2, 2, 2], [4, 4, 4]])
+        vl = [VectorMock(2, 2, 2), VectorMock(0)]
+        self.assertEqual(VLerpArray(vl, b).tolist(), [[3, 3, 3], [0, 0, 0]])
+        self.assertEqual(VLerpArray(vl, [ve, ve], [0.0, 0.5]).tolist(), [[2, 2, 2], [2, 2, 2]])
+        self.assertRaises(ValueError, VLerpArray, a, b, [0.5, 1.5])
+        nl = VNLerpArray(a, b)
+        self.assertTrue(np.allclose(nl[0], 1.0 / np.sqrt(3)))
+        self.assertEqual(nl[1].tolist(), [0, 0, 0])
+        # matches the scalar version
+        sl = VSLerpArray([0, 1, 0], [1, 0, 0], [0.0, 0.5, 1.0])
+        self.assertTrue(np.allclose(sl, [[0, 1, 0], [np.sqrt(0.5), np.sqrt(0.5), 0], [1, 0, 0]]))
+        # nearly parallel vectors stay unit length and in between
+        b = np.array([1.0, 1e-9, 0.0])
+        b /= np.sqrt(b.dot(b))
+        sl = VSLerpArray([1, 0, 0], b, 0.5)
+        self.assertAlmostEqual(np.sqrt(sl.dot(sl)), 1.0)
+        self.assertTrue(0 <= sl[1] <= 1e-9)
+
+    def testAngleArrays(self):
+        deg = np.array([[[0, 90, 180], [270, 359, -45]]], dtype=np.float64)
+        rad = VRadArray(deg)
+        self.assertTrue(np.allclose(rad, np.radians(deg)))
+        self.assertTrue(np.allclose(VDegArray(rad), deg))
+        hpb = VRadArray(deg, isHPB=True)
+        self.assertEqual(deg[0, 0, 2], 180)
+        self.assertTrue(np.allclose(VDegArray(hpb), [[[0, 90, -180], [-90, -1, -45]]]))
+        self.assertTrue(np.allclose(VDegArray(rad, isHPB=True), [[[0, 90, -180], [-90, -1, -45]]]))
+        theta = np.linspace(-20, 20, 101)
+        self.assertTrue(np.allclose(WrapPiArray(theta), [WrapPi(x) for x in theta]))
+        x = np.array([-2.0, -1.0, 0.3, 1.0, 1.5])
+        self.assertTrue(np.allclose(SafeAcosArray(x), [SafeAcos(v) for v in x]))
+
+    def testQuaternionArrays(self):
+        rs = np.random.RandomState(6)
+        hpb = rs.uniform(-3, 3, (200, 3))
+        hpb[:, 1] /= 2.5
+        q = QuatsFromHPB(hpb)
+        self.assertTrue(np.allclose((q * q).sum(axis=1), 1.0))
+        # explicit axes of the H, P, B rotation
+        ss, sn, sk = np.sin(hpb).T
+        cs, cn, ck = np.cos(hpb).T
+        v1 = np.column_stack((ck * cs - sk * sn * ss, -sk * cn, ck * ss + sk * sn * cs))
+        v3 = np.column_stack((-cn * ss, sn, cn * cs))
+        m = QuatsToMatrices(q, off=[1, 2, 3])
+        self.assertTrue(np.allclose(m[:, 0], [1, 2, 3]))
+        self.assertTrue(np.allclose(m[:, 1], v1))
+        self.assertTrue(np.allclose(m[:, 3], v3))
+        self.assertTrue(np.allclose(QuatsToHPB(q), hpb))
+        # matrices, with scaling, back to quaternions up to sign
+        m[:, 1:] *= rs.uniform(0.5, 2, (200, 3, 1))
+        back = QuatsFromMatrices(m)
+        self.assertTrue(np.allclose(np.abs((back * q).sum(axis=1)), 1.0))
+        # scalar and array versions agree
+        scalar = QuatsToList(q[:5])
+        self.assertEquals(Quaternion.FromHPB(VectorMock(*hpb[0])), scalar[0])
+        composed = QuatMulArray(q[:5], q[5:10])
+        for i in range(5):
+            c = scalar[i] * QuatsToList(q[5 + i])[0]
+            self.assertTrue(np.allclose(composed[i], [c.w, c.x, c.y, c.z]))
+        p = rs.normal(size=(5, 3))
+        rotated = QuatRotateArray(composed, p)
+        expected = TransformPoints(TransformPoints(p[:1], QuatsToMatrices(q[5])[0]), QuatsToMatrices(q[0])[0])
+        self.assertTrue(np.allclose(rotated[0], expected))
+        # interpolation
+        a = QuatsFromHPB(np.zeros((1, 3)))
+        b = QuatsFromHPB([[1.0, 0, 0]])
+        self.assertTrue(np.allclose(QuatsToHPB(QuatSLerpArray(a, -b, [0.25, 0.5]))[:, 0], [0.25, 0.5]))
+        n = QuatNLerpArray(q, q[::-1], 0.3)
+        self.assertTrue(np.allclose((n * n).sum(axis=1), 1.0))
+        self.assertTrue(np.allclose(QuatSLerpArray(q, q, 0.7), q))
+    
+    def testPlaneLineIntersections(self):
+        plane = Plane(VectorMock(0, 1, 0), VectorMock(0, 2, 0))
+        p = np.array([[0, 5, 0], [1, -3, 2], [4, 4, 4]], dtype=np.float64)
+        d = np.array([[0, -2, 0], [0, 1, 0], [1, 0, 0]], dtype=np.float64)
+        dcopy = d.copy()
+        hits, t, valid = plane.LineIntersections(p, d)
+        self.assertEqual(valid.tolist(), [True, True, False])
+        self.assertTrue(np.allclose(hits[:2], [[0, 1, 0], [1, 1, 2]]))
+        self.assertTrue(np.allclose(t[:2], [4, 4]))
+        self.assertTrue(np.isnan(t[2]))
+        self.assertTrue((d == dcopy).all())
+        # no direction projects along the plane normal
+        hits, t, valid = plane.LineIntersections(p)
+        self.assertTrue(valid.all())
+        self.assertTrue(np.allclose(hits[:, 1], 1))
         
+    def testRayPlaneIntersectionsManyPlanes(self):
+        p = np.zeros((2, 3))
+        d = np.array([[1, 0, 0], [1, 1, 0]], dtype=np.float64)
+        pos = np.array([[1, 0, 0], [3, 0, 0]], dtype=np.float64)
+        n = np.array([[1, 0, 0], [-1, 0, 0]], dtype=np.float64)
+        hits, t, valid = RayPlaneIntersections(p, d, pos, n)
+        self.assertEqual(hits.shape, (2, 2, 3))
+        self.assertTrue(valid.all())
+        self.assertTrue(np.allclose(hits[0, :, 0], [1, 3]))
+        self.assertTrue(np.allclose(hits[1, 1], [3, 3, 0]))
+        # lists of vectors work like arrays
+        vd = [VectorMock(*v) for v in d]
+        vpos = [VectorMock(*v) for v in pos]
+        vn = [VectorMock(*v) for v in n]
+        vhits, vt, vvalid = RayPlaneIntersections([VectorMock(0)] * 2, vd, vpos, vn)
+        self.assertEqual(vhits.shape, (2, 2, 3))
+        self.assertTrue(np.allclose(vhits, hits))
+        self.assertEqual(vvalid.tolist(), valid.tolist())
+        plane = Plane(VectorMock(1, 0, 0), VectorMock(1, 0, 0))
+        hits, t, valid = plane.LineIntersections([VectorMock(0), VectorMock(0, 2, 0)], vd)
+        self.assertEqual(hits.shape, (2, 3))
+        self.assertTrue(np.allclose(hits, [[1, 0, 0], [1, 3, 0]]))
+
+    def testRayTriangleIntersections(self):
+        a = np.array([[0, 0, 0], [0, 0, 5]], dtype=np.float64)
+        b = np.array([[1, 0, 0], [1, 0, 5]], dtype=np.float64)
+        c = np.array([[0, 1, 0], [0, 1, 5]], dtype=np.float64)
+        p = np.array([[0.25, 0.25, -1], [2, 2, -1], [0.5, 0.25, 10]], dtype=np.float64)
+        d = np.array([[0, 0, 1], [0, 0, 1], [0, 0, -2]], dtype=np.float64)
+        t, u, v, hit = RayTriangleIntersections(p, d, a, b, c)
+        self.assertEqual(t.shape, (3, 2))
+        self.assertEqual(hit.tolist(), [[True, True], [False, False], [True, True]])
+        self.assertTrue(np.allclose(t[0], [1, 6]))
+        self.assertTrue(np.allclose(t[2], [5, 2.5]))
+        self.assertTrue(np.allclose((u[0, 0], v[0, 0]), (0.25, 0.25)))
+        self.assertTrue(np.isinf(t[1]).all())
+        # back face culling drops rays travelling along the triangle normal
+        t, u, v, hit = RayTriangleIntersections(p, d, a, b, c, cull=True)
+        self.assertEqual(hit.tolist(), [[False, False], [False, False], [True, True]])
+        # candidate pairs from a broad phase
+        t, u, v, hit = RayTriangleIntersections(p, d, a, b, c, pairs=([0, 2, 1], [1, 0, 0]))
+        self.assertEqual(hit.tolist(), [True, True, False])
+        self.assertTrue(np.allclose(t[:2], [6, 5]))
+        
+    def testPointsInTriangles(self):
+        a = np.array([0, 0, 0], dtype=np.float64)
+        b = np.array([2, 0, 0], dtype=np.float64)
+        c = np.array([0, 2, 0], dtype=np.float64)
+        p = np.array([[0.5, 0.5, 7], [2, 2, 0], [1, 1, 0], [0.5, 0.5, 0.01]], dtype=np.float64)
+        self.assertEqual(PointsInTriangles(p, a, b, c).tolist(), [True, False, True, True])
+        mask, w = PointsInTriangles(p, a, b, c, plane=None, tolerance=0.1, weights=True)
+        self.assertEqual(mask.tolist(), [False, False, True, True])
+        self.assertTrue(np.allclose(w[2], [0, 0.5, 0.5]))
+        self.assertTrue(np.allclose(w.sum(axis=1), 1))
+        # many triangles at once
+        ta = np.array([a, a + 10])
+        tb = np.array([b, b + 10])
+        tc = np.array([c, c + 10])
+        mask = PointsInTriangles(p, ta, tb, tc, plane="xy")
+        self.assertEqual(mask.shape, (4, 2))
+        self.assertFalse(mask[:, 1].any())
+        # lists of vectors work like arrays
+        vmask = PointsInTriangles(p, [VectorMock(*v) for v in ta], 
+                                  [VectorMock(*v) for v in tb], 
+                                  [VectorMock(*v) for v in tc], plane="xy")
+        self.assertEqual(vmask.tolist(), mask.tolist())
+        vmask = PointsInTriangles(p, VectorMock(*a), VectorMock(*b), VectorMock(*c))
+        self.assertEqual(vmask.tolist(), [True, False, True, True])
+        self.assertRaises(ValueError, PointsInTriangles, p, a, b, c, plane="xw")
+
+    def testPointsInPolygon(self):
+        # U-shaped lasso in the XZ plane
+        lasso = [VectorMock(0, 0, 0), VectorMock(3, 0, 0), VectorMock(3, 0, 3), 
+                 VectorMock(2, 0, 3), VectorMock(2, 0, 1), VectorMock(1, 0, 1), 
+                 VectorMock(1, 0, 3), VectorMock(0, 0, 3)]
+        p = np.array([[0.5, 5, 2], [1.5, 0, 2], [1.5, 0, 0.5], [2.5, 0, 2.5], [4, 0, 1]], dtype=np.float64)
+        mask = PointsInPolygon(p, lasso, plane="xz")
+        self.assertEqual(mask.tolist(), [True, False, True, True, False])
+
+    def testSegmentsClosestPoints(self):
+        p1a = np.array([[0, 0, 0], [0, 0, 0], [0, 0, 0], [1, 1, 1]], dtype=np.float64)
+        p1b = np.array([[2, 0, 0], [2, 0, 0], [2, 0, 0], [1, 1, 1]], dtype=np.float64)
+        p2a = np.array([[1, 1, -1], [3, 1, 0], [0, 1, 0], [1, 1, 1]], dtype=np.float64)
+        p2b = np.array([[1, 1, 1], [5, 1, 0], [2, 1, 0], [1, 1, 1]], dtype=np.float64)
+        c1, c2, s, t, dist = SegmentsClosestPoints(p1a, p1b, p2a, p2b)
+        # crossing, clamped at the segment ends, parallel and degenerate
+        self.assertTrue(np.allclose(c1[0], [1, 0, 0]))
+        self.assertTrue(np.allclose(c2[0], [1, 1, 0]))
+        self.assertTrue(np.allclose(c1[1], [2, 0, 0]))
+        self.assertTrue(np.allclose(c2[1], [3, 1, 0]))
+        self.assertTrue(np.allclose(dist, [1, np.sqrt(2), 1, 0]))
+        self.assertTrue(((s >= 0) & (s <= 1) & (t >= 0) & (t <= 1)).all())
+        # the same cases at other scales, shifted away from the origin
+        for scale in (0.005, 1e-5, 1000.0):
+            off = np.array([1.5, 0, 0])
+            k1, k2, ks, kt, kdist = SegmentsClosestPoints((p1a + off) * scale, (p1b + off) * scale, 
+                                                          (p2a + off) * scale, (p2b + off) * scale)
+            self.assertTrue(np.allclose(k1, (c1 + off) * scale, rtol=1e-6, atol=0))
+            self.assertTrue(np.allclose(k2, (c2 + off) * scale, rtol=1e-6, atol=0))
+            self.assertTrue(np.allclose(kdist, dist * scale, rtol=1e-6, atol=0))
+            self.assertTrue(np.allclose(ks[:2], s[:2]))
+        
+    def testCloseSegmentPairs(self):
+        rs = np.random.RandomState(7)
+        segs = rs.uniform(0, 20, (300, 2, 3))
+        segs[:, 1] = segs[:, 0] + rs.uniform(-1, 1, (300, 3))
+        ia, ib, dist = CloseSegmentPairs(segs, threshold=0.75)
+        # compare with brute force
+        i, j = np.triu_indices(300, 1)
+        bdist = SegmentsClosestPoints(segs[i, 0], segs[i, 1], segs[j, 0], segs[j, 1])[4]
+        close = bdist <= 0.75
+        self.assertTrue(close.sum() > 0)
+        self.assertEqual(sorted(zip(ia.tolist(), ib.tolist())), 
+                         sorted(zip(i[close].tolist(), j[close].tolist())))
+        ia, ib, dist = CloseSegmentPairs(segs[:100], segs[100:], threshold=0.75)
+        self.assertTrue((dist <= 0.75).all())
+        self.assertTrue((ib < 200).all())
+        # long diagonals would overlap thousands of grid cells each
+        segs[:3, 0] = [[0, 0, 0], [20, 0, 0], [0, 20, 20]]
+        segs[:3, 1] = [[20, 20, 20], [0, 20, 20], [20, 0, 0]]
+        bdist = SegmentsClosestPoints(segs[i, 0], segs[i, 1], segs[j, 0], segs[j, 1])[4]
+        close = bdist <= 0.75
+        for other in (None, segs):
+            ia, ib, dist = CloseSegmentPairs(segs, other, threshold=0.75)
+            pairs = set(zip(ia.tolist(), ib.tolist()))
+            if other is not None:
+                pairs = set((a, b) for a, b in pairs if a < b)
+            self.assertEqual(sorted(pairs), sorted(zip(i[close].tolist(), j[close].tolist())))
+            self.assertTrue(len(set(ia[ia < 3])) == 3)
+
+    def testOrientedBBoxFromPoints(self):
+        rs = np.random.RandomState(3)
+        pnts = rs.uniform(-1, 1, (2000, 3)) * [10, 4, 1]
+        # random rotation
+        q, r = np.linalg.qr(rs.normal(size=(3, 3)))
+        if np.linalg.det(q) < 0:
+            q[:, 2] = -q[:, 2]
+        pnts = pnts.dot(q.T) + [100, 50, -20]
+        for refine in (False, True):
+            frame, ext = OrientedBBoxFromPoints(pnts, refine=refine)
+            self.assertEqual(frame.shape, (4, 3))
+            self.assertTrue(np.allclose(frame[1:].dot(frame[1:].T), np.eye(3)))
+            self.assertTrue(np.linalg.det(frame[1:]) > 0)
+            self.assertTrue(np.allclose(ext, [10, 4, 1], rtol=0.05))
+            self.assertTrue(np.allclose(frame[0], [100, 50, -20], atol=0.5))
+            # all points are inside
+            local = (pnts - frame[0]).dot(frame[1:].T)
+            self.assertTrue((np.abs(local) <= ext + 1e-9).all())
+        # a flat square rotated by 45 degrees, with isotropic spread in its plane
+        diamond = np.array([[0, 0, 0], [1, 1, 0], [0, 2, 0], [-1, 1, 0], [0, 1, 0.01]], dtype=np.float64)
+        frame, ext = OrientedBBoxFromPoints(diamond)
+        self.assertTrue(np.allclose(sorted(ext[:2]), [np.sqrt(0.5)] * 2))
+
+    def testBoundingSphereFromPoints(self):
+        rs = np.random.RandomState(11)
+        pnts = rs.normal(size=(5000, 3))
+        pnts /= np.sqrt((pnts ** 2).sum(axis=1))[:, np.newaxis]
+        pnts = pnts * rs.uniform(0, 3, (5000, 1)) + [1, 2, 3]
+        exact_c, exact_r = BoundingSphereFromPoints(pnts, method="welzl")
+        fast_c, fast_r = BoundingSphereFromPoints(pnts)
+        for c, r in ((exact_c, exact_r), (fast_c, fast_r)):
+            d = np.sqrt(((pnts - c) ** 2).sum(axis=1))
+            self.assertTrue((d <= r + 1e-9).all())
+        self.assertTrue(exact_r <= fast_r + 1e-9)
+        self.assertTrue(fast_r < exact_r * 1.1)
+        self.assertTrue(exact_r < 3.0)
+        # the minimal sphere of a right triangle is centered on the hypotenuse
+        tri = np.array([[0, 0, 0], [4, 0, 0], [0, 3, 0]], dtype=np.float64)
+        c, r = BoundingSphereFromPoints(tri, method="welzl")
+        self.assertTrue(np.allclose(c, [2, 1.5, 0]))
+        self.assertAlmostEqual(r, 2.5)
+        # regular tetrahedron
+        tet = np.array([[1, 1, 1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]], dtype=np.float64)
+        c, r = BoundingSphereFromPoints(tet, method="welzl")
+        self.assertTrue(np.allclose(c, 0))
+        self.assertAlmostEqual(r, np.sqrt(3))
+        self.assertRaises(ValueError, BoundingSphereFromPoints, tet, method="box")
+        # when rounding stops the radius from growing, the sphere still encloses all points
+        first = []
+        def Stuck(support):
+            c, r, idx = MinBallOfSmallSet(support)
+            first.append(r)
+            return (c, min(r, first[0]), idx)
+        maths._MinBallOfSmallSet = Stuck
+        try:
+            c, r = BoundingSphereFromPoints(pnts, method="welzl")
+        finally:
+            maths._MinBallOfSmallSet = MinBallOfSmallSet
+        self.assertTrue(len(first) > 1)
+        d = np.sqrt(((pnts - c) ** 2).sum(axis=1))
+        self.assertTrue((d <= r + 1e-9).all())
+
+    def testConvexHull(self):
+        rs = np.random.RandomState(5)
+        pnts = rs.normal(size=(20000, 3))
+        verts, tris = ConvexHull(pnts)
+        # closed triangle mesh: every directed edge has its opposite
+        edges = set()
+        for a, b, c in tris.tolist():
+            edges.update([(a, b), (b, c), (c, a)])
+        self.assertEqual(len(edges), 3 * len(tris))
+        for a, b in edges:
+            self.assertTrue((b, a) in edges)
+        self.assertEqual(len(tris), 2 * len(verts) - 4)
+        # all points lie behind every outward facing triangle
+        a, b, c = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+        n = np.cross(b - a, c - a)
+        d = pnts.dot(n.T) - (n * a).sum(axis=1)
+        self.assertTrue((d <= 1e-9).all())
+        # cube corners with interior and face points
+        cube = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=np.float64)
+        grid = np.mgrid[0:5, 0:5, 0:5].reshape(3, -1).T / 4.0
+        verts, tris = ConvexHull(np.vstack((grid, cube)))
+        self.assertEqual(len(verts), 8)
+        self.assertEqual(len(tris), 12)
+        self.assertRaises(ValueError, ConvexHull, cube[:3])
+        self.assertRaises(ValueError, ConvexHull, grid * [1, 1, 0])
+
+    def testTransformPoints(self):
+        # rotated 90 degrees around Y and moved
+        m = MatrixMock(VectorMock(10, 20, 30), VectorMock(0, 0, -1), 
+                       VectorMock(0, 1, 0), VectorMock(1, 0, 0))
+        self.assertEqual(MatrixToArray(m).tolist(), 
+                         [[10, 20, 30], [0, 0, -1], [0, 1, 0], [1, 0, 0]])
+        pnts = [VectorMock(1, 2, 3), VectorMock(-1, 0, 0)]
+        result = TransformPoints(pnts, m)
+        self.assertEqual(result.tolist(), [[13, 22, 29], [10, 20, 31]])
+        result = TransformPoints(pnts, MatrixToArray(m), direction=True)
+        self.assertEqual(result.tolist(), [[3, 2, -1], [0, 0, 1]])
+        self.assertRaises(ValueError, MatrixToArray, np.eye(3))
+
+    def testMatrixArrays(self):
+        rs = np.random.RandomState(3)
+        a = rs.normal(size=(50, 4, 3))
+        b = rs.normal(size=(50, 4, 3))
+        p = rs.normal(size=(10, 3))
+        ab = MulMatrixArray(a, b)
+        for i in range(50):
+            expected = TransformPoints(TransformPoints(p, b[i]), a[i])
+            self.assertTrue(np.allclose(TransformPoints(p, ab[i]), expected))
+        # a single matrix is applied to the whole stack
+        self.assertTrue(np.allclose(MulMatrixArray(a[0], b)[7], MulMatrixArray(a[0], b[7])))
+        # homogeneous layout
+        ha = MatricesToArray(a, homogeneous=True)
+        hb = MatricesToArray(b, homogeneous=True)
+        self.assertEqual(ha.shape, (50, 4, 4))
+        hab = MulMatrixArray(ha, hb)
+        self.assertTrue(np.allclose(MatricesToArray(hab), ab))
+        hp = np.column_stack((np.ones(len(p)), p))
+        self.assertTrue(np.allclose(hp.dot(hab[3])[:, 1:], TransformPoints(p, ab[3])))
+        m = MatrixMock(VectorMock(1, 2, 3), VectorMock(4, 5, 6), VectorMock(7, 8, 9), VectorMock(10, 11, 12))
+        arr = MatricesToArray([m, m])
+        self.assertEqual(arr.shape, (2, 4, 3))
+        self.assertEqual(arr[1].tolist(), MatrixToArray(m).tolist())
+        self.assertEqual(TransposeArray(arr)[0, :, 1].tolist(), [4, 5, 6])
+        self.assertRaises(TypeError, ListListToMatrix, [["a", "b", "c"]] * 4)
+
+    def testDetArray(self):
+        rs = np.random.RandomState(8)
+        for n in (3, 4):
+            m = rs.normal(size=(20, n, n))
+            expected = [Det(x.tolist()) for x in m]
+            self.assertTrue(np.allclose(DetArray(m), expected))
+            self.assertTrue(np.allclose(DetArray(m), np.linalg.det(m)))
+        self.assertRaises(ValueError, DetArray, np.zeros((2, 3, 4)))
+
+    def testUnitNormals(self):
+        a = np.array([[-100, 100, 100], [0, 0, 0]], dtype=np.float64)
+        b = np.array([[-100, 100, -100], [1, 1, 1]], dtype=np.float64)
+        c = np.array([[-100, -100, 100], [2, 2, 2]], dtype=np.float64)
+        normals, valid = UnitNormals(a, b, c)
+        self.assertEqual(valid.tolist(), [True, False])
+        expected = UnitNormal(*[VectorMock(*x) for x in (a[0], b[0], c[0])])
+        self.assertTrue(np.allclose(normals[0], [expected.x, expected.y, expected.z]))
+        self.assertEqual(normals[1].tolist(), [0, 0, 0])
+
+    def testBuildMatrixArray(self):
+        rs = np.random.RandomState(4)
+        v = np.vstack((rs.normal(size=(100, 3)), [[-1, 0, 0], [0, 0, 2]]))
+        off = rs.normal(size=(102, 3))
+        r = v / np.sqrt((v ** 2).sum(axis=1))[:, np.newaxis]
+        frames = [BuildMatrixArray(v, off=off, order="xyz"), 
+                  BuildMatrixArray(v, order="zyx"),
+                  BuildMatrix2Array(v, base="x"), 
+                  BuildMatrix3Array(v, rs.normal(size=(102, 3)), base="-x")]
+        for m, axis in zip(frames, (1, 3, 1, 1)):
+            self.assertEqual(m.shape, (102, 4, 3))
+            basis = m[:, 1:]
+            gram = np.matmul(basis, TransposeArray(basis))
+            self.assertTrue(np.allclose(gram, np.eye(3)))
+            self.assertTrue(np.allclose(np.abs(DetArray(basis)), 1.0))
+            self.assertTrue(np.allclose(m[:, axis], r))
+        self.assertTrue(np.allclose(frames[0][:, 0], off))
+        self.assertTrue(np.allclose(frames[1][:, 0], 0))
+        m = BuildMatrix2Array(np.array([[0, 0, 5]]), off=VectorMock(1, 2, 3))
+        self.assertEqual(m[0].tolist(), [[1, 2, 3], [0, 1, 0], [1, 0, 0], [0, 0, 1]])
+        self.assertRaises(ValueError, BuildMatrix2Array, v, base="w")
+
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
     unittest.main()
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# 
+#  test.mesh_tests
+#  py4dlib
+#  
+#  Created by André Berg on 2026-10-19.
+#  Copyright 2026 Berg Media. All rights reserved.
+#
+#  andre.bergmedia@googlemail.com
+# 
+# pylint: disable-msg=F0401
+
+import os
+import unittest
+
+__version__ = (0, 1)
+__date__ = '2026-10-19'
+__updated__ = '2026-10-19'
+
+
+DEBUG = 0 or ('DebugLevel' in os.environ and os.environ['DebugLevel'] > 0)
+TESTRUN = 0 or ('TestRunLevel' in os.environ and os.environ['TestRunLevel'] > 0)
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from py4dlib.maths import Plane
+from py4dlib.mesh import SliceMesh, PolysToTriangles, RayCastMesh
+from py4dlib.mesh import GetEdgeArray, FindCloseEdgePairs, CalcConvexHull
+from py4dlib.mesh import CalcPolyNormals, CalcPolyAreas
+
+from test.maths_tests import VectorMock
+
+
+def GridArrays(nx, ny):
+    """ Flat grid of nx * ny quads in the XZ plane, one unit per quad. """
+    xs, zs = np.meshgrid(np.arange(nx + 1, dtype=np.float64), 
+                         np.arange(ny + 1, dtype=np.float64))
+    points = np.column_stack((xs.ravel(), np.zeros(xs.size), zs.ravel()))
+    polys = []
+    for j in range(ny):
+        for i in range(nx):
+            a = j * (nx + 1) + i
+            polys.append((a, a + 1, a + nx + 2, a + nx + 1))
+    return (points, np.array(polys, dtype=np.int32))
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class Test(unittest.TestCase):
+
+    def testSliceMeshClassify(self):
+        mesh = GridArrays(4, 1)
+        plane = Plane(VectorMock(1.5, 0, 0), VectorMock(1, 0, 0))
+        front, back, span = SliceMesh(mesh, plane, split=False)
+        self.assertEqual(front.tolist(), [2, 3])
+        self.assertEqual(back.tolist(), [0])
+        self.assertEqual(span.tolist(), [1])
+        
+    def testSliceMeshSplit(self):
+        mesh = GridArrays(4, 2)
+        plane = Plane(VectorMock(1.5, 0, 0), VectorMock(1, 0, 0))
+        front, back = SliceMesh(mesh, plane)
+        fpoints, fpolys = front
+        bpoints, bpolys = back
+        self.assertEqual(len(fpolys), 6)
+        self.assertEqual(len(bpolys), 4)
+        self.assertTrue((fpoints[:, 0] >= 1.5 - 1e-9).all())
+        self.assertTrue((bpoints[:, 0] <= 1.5 + 1e-9).all())
+        # 3 new points on the plane, shared by neighboring polygons
+        self.assertEqual(int(np.isclose(fpoints[:, 0], 1.5).sum()), 3)
+        self.assertEqual(int(np.isclose(bpoints[:, 0], 1.5).sum()), 3)
+        # halves add up to the original area
+        area = 0.0
+        for pnts, plys in (front, back):
+            for a, b, c, d in plys.tolist():
+                p = pnts[[a, b, c, d]]
+                area += 0.5 * np.linalg.norm(np.cross(p[2] - p[0], p[3] - p[1]))
+        self.assertAlmostEqual(area, 8.0)
+
+    def testSliceMeshSplitTriangle(self):
+        points = np.array([[0, 0, 0], [2, 0, 0], [0, 0, 2]], dtype=np.float64)
+        polys = np.array([[0, 1, 2, 2]], dtype=np.int32)
+        plane = Plane(VectorMock(1, 0, 0), VectorMock(1, 0, 0))
+        front, back = SliceMesh((points, polys), plane)
+        # the front piece is a triangle with the original winding
+        self.assertEqual(front[1].tolist(), [[1, 0, 2, 2]])
+        self.assertEqual(front[0][0].tolist(), [2, 0, 0])
+        self.assertEqual(len(front[0]), 3)
+        self.assertEqual(len(back[1]), 1)
+        self.assertEqual(len(back[0]), 4)
+
+    def testPolysToTriangles(self):
+        polys = np.array([[0, 1, 2, 3], [4, 5, 6, 6]], dtype=np.int32)
+        tris, owner = PolysToTriangles(polys)
+        self.assertEqual(tris.tolist(), [[0, 1, 2], [0, 2, 3], [4, 5, 6]])
+        self.assertEqual(owner.tolist(), [0, 0, 1])
+
+    def testRayCastMesh(self):
+        mesh = GridArrays(3, 3)
+        p = np.array([[0.5, 1, 0.5], [2.5, 1, 1.5], [5, 1, 5]], dtype=np.float64)
+        d = np.array([[0, -1, 0], [0, -1, 0], [0, -1, 0]], dtype=np.float64)
+        polys, t, hits = RayCastMesh(mesh, p, d, chunksize=10)
+        self.assertEqual(polys.tolist(), [0, 5, -1])
+        self.assertTrue(np.allclose(t[:2], 1))
+        self.assertTrue(np.allclose(hits[1], [2.5, 0, 1.5]))
+
+    def testGetEdgeArray(self):
+        edges = GetEdgeArray(GridArrays(2, 1))
+        self.assertEqual(edges.tolist(), [[0, 1], [0, 3], [1, 2], [1, 4], [2, 5], [3, 4], [4, 5]])
+
+    def testFindCloseEdgePairs(self):
+        grid = GridArrays(2, 2)
+        # a single edge as degenerate polygon
+        cable = (np.array([[-1, 0.2, 0.5], [3, 0.2, 0.5]]), np.array([[0, 1, 1, 1]]))
+        # a cable hovering over the grid is close to the edges it passes
+        e1, e2, dist = FindCloseEdgePairs(grid, cable, threshold=0.25)
+        self.assertEqual(sorted(e1.tolist()), [[0, 3], [1, 4], [2, 5]])
+        self.assertEqual(e2.tolist(), [[0, 1]] * 3)
+        self.assertTrue(np.allclose(dist, 0.2))
+        e2, e1, dist = FindCloseEdgePairs(cable, grid, threshold=0.25)
+        self.assertEqual(sorted(e1.tolist()), [[0, 3], [1, 4], [2, 5]])
+        # edges of the grid sharing no point are at least 1 unit apart
+        e1, e2, dist = FindCloseEdgePairs(grid, threshold=0.5)
+        self.assertEqual(len(dist), 0)
+        e1, e2, dist = FindCloseEdgePairs(grid, threshold=1.0)
+        self.assertTrue(len(dist) > 0)
+
+    def testCalcConvexHull(self):
+        points = GridArrays(3, 3)[0]
+        # lift the inner grid points to a pyramid apex
+        points = np.vstack((points, [[1.5, 2.0, 1.5]]))
+        verts, polys = CalcConvexHull(points)
+        self.assertEqual(polys.shape, (6, 4))
+        self.assertTrue((polys[:, 2] == polys[:, 3]).all())
+        self.assertEqual(sorted(map(tuple, verts.tolist())), 
+                         [(0, 0, 0), (0, 0, 3), (1.5, 2, 1.5), (3, 0, 0), (3, 0, 3)])
+
+    def testCalcPolyNormalsAreas(self):
+        points, polys = GridArrays(2, 1)
+        points = points * [2, 1, 1]
+        polys = np.vstack((polys, [[0, 1, 4, 4], [0, 1, 2, 2]]))
+        normals, valid = CalcPolyNormals((points, polys))
+        self.assertEqual(valid.tolist(), [True, True, True, False])
+        self.assertEqual(normals.tolist(), [[0, -1, 0]] * 3 + [[0, 0, 0]])
+        self.assertEqual(CalcPolyAreas((points, polys)).tolist(), [2, 2, 1, 0])
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
+
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+# 
+#       http://www.apache.org/licenses/LICENSE-2.0
+# 
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
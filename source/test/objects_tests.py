@@ -16,10 +16,15 @@ import pprint
 
 __version__ = (0, 1)
 __date__ = '2012-09-28'
-__updated__ = '2013-08-08'
+__updated__ = '2026-10-19'
 
 
-from py4dlib.objects import ObjectHierarchy
+from py4dlib.objects import ObjectHierarchy, ObjectIterator, WalkObjects, ObjectKey
+from py4dlib.objects import SceneIndex, FindObject, FindObjects
+from py4dlib.objects import NameAllocator, UniqueSequentialName
+from py4dlib.objects import BatchCreate, CreateObject, InsertUnderNull
+from py4dlib.testing import c4dstub
+from py4dlib.testing.c4dstub import documents
 
 
 pp = pprint.PrettyPrinter()
@@ -154,6 +159,457 @@ class ObjectsTest(unittest.TestCase):
         actual = self.mockobj.Get(path)
         self.assertEqual(actual, expected, 'actual should equal %r, but is %r' % (expected, actual))
 
+    def testGetIndexUpdates(self):
+        self.mockobj.entries = dict(DATA)
+        self.assertEqual(self.mockobj.Get('Source/Group1AC'), ['Cube3', 'W\ürfel3'])
+        self.assertEqual(sorted(self.mockobj.Get('Source/Group1AB?')), 
+                         ['Kegel1', 'Kegel2', 'Polygons1', 'Sweep-NURBS'])
+        self.mockobj.entries['Source/Group1ABC'] = ['Cube4']
+        self.assertEqual(self.mockobj.Get('Source/Group1ABC'), ['Cube4'])
+        self.assertEqual(sorted(self.mockobj.Get('Source/Group1AB?')), 
+                         ['Cube4', 'Kegel1', 'Kegel2', 'Polygons1', 'Sweep-NURBS'])
+        self.assertEqual(self.mockobj.Get('Group1ABC', strict=False), ['Cube4'])
+        self.assertEqual(self.mockobj.Get('Group1ABC'), [])
+        del self.mockobj.entries['Source/Group1ABC']
+        self.assertEqual(self.mockobj.Get('Source/Group1ABC'), [])
+
+
+def BuildTree(spec, parent=None, doc=None):
+    """ Build objects from nested ``(name, [children])`` tuples. """
+    result = {}
+    for name, children in reversed(spec):
+        op = c4dstub.BaseObject(c4dstub.Onull)
+        op.SetName(name)
+        if parent is None:
+            doc.InsertObject(op)
+        else:
+            op.InsertUnder(parent)
+        result[name] = op
+        result.update(BuildTree(children, op, doc))
+    return result
+
+
+TREE = [
+    ('A', [
+        ('A1', [('A11', []), ('A12', [])]),
+        ('A2', [('A21', [])]),
+    ]),
+    ('B', [('B1', [])]),
+    ('C', []),
+]
+
+
+def Free(op):
+    """ Delete ``op`` and its children the way CINEMA 4D does: the Python 
+        wrappers stay around but raise ReferenceError when used.
+    """
+    op.Remove()
+    stack = [op]
+    while stack:
+        obj = stack.pop()
+        stack.extend(obj.GetChildren())
+        for name in ('GetName', 'GetDirty', 'GetGUID', 'GetUp', 'GetDown', 'GetNext', 'GetPred'):
+            setattr(obj, name, Dead)
+
+
+def Dead(*args):
+    raise ReferenceError("the object is not alive")
+
+
+class WrapperMock(object):
+    """ Like c4d's Python wrappers before GetGUID(): recreated on each 
+        call, equal but not identical and hashed by id.
+    """
+    
+    def __init__(self, op):
+        self.op = op
+    
+    def __eq__(self, other):
+        return isinstance(other, WrapperMock) and self.op is other.op
+    
+    def __ne__(self, other):
+        return not self == other
+    
+    def _Wrap(self, op):
+        return None if op is None else WrapperMock(op)
+    
+    def GetName(self):
+        return self.op.GetName()
+    
+    def GetUp(self):
+        return self._Wrap(self.op.GetUp())
+    
+    def GetDown(self):
+        return self._Wrap(self.op.GetDown())
+    
+    def GetNext(self):
+        return self._Wrap(self.op.GetNext())
+
+
+class StubTestCase(unittest.TestCase):
+    """ Runs each test on a new stub document holding the objects of ``tree``. """
+
+    tree = TREE
+
+    @classmethod
+    def setUpClass(cls):
+        c4dstub.Install(force=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        c4dstub.Uninstall()
+
+    def setUp(self):
+        self.doc = documents.ResetDocuments()
+        self.objs = BuildTree(self.tree, doc=self.doc)
+        c4dstub.ResetCalls()
+
+
+class WalkObjectsTest(StubTestCase):
+
+    def Names(self, *args, **kwargs):
+        return [(op.GetName(), lvl) for op, lvl, _ in WalkObjects(*args, **kwargs)]
+
+    def testChildrenOnly(self):
+        expected = [('A1', 1), ('A11', 2), ('A12', 2), ('A2', 1), ('A21', 2)]
+        self.assertEqual(self.Names(self.objs['A']), expected)
+        self.assertEqual(self.Names(self.objs['C']), [])
+        self.assertEqual(self.Names(None), [])
+
+    def testFollowing(self):
+        expected = [('A2', 1), ('A21', 2), ('B', 0), ('B1', 1), ('C', 0)]
+        self.assertEqual(self.Names(self.objs['A2'], children_only=False), expected)
+        self.assertEqual(self.Names(self.objs['A1'], children_only=False, startlvl=9)[:2], 
+                         [('A1', 11), ('A11', 12)])
+
+    def testParents(self):
+        walk = list(WalkObjects(self.objs['A'], children_only=False))
+        parents = dict((op.GetName(), [p.GetName() for p in ps]) for op, _, ps in walk)
+        self.assertEqual(parents['A'], [])
+        self.assertEqual(parents['A12'], ['A', 'A1'])
+        self.assertEqual(parents['B1'], ['B'])
+        # siblings share their parents
+        self.assertTrue(walk[2][2] is walk[3][2])
+
+    def testStop(self):
+        self.assertEqual(self.Names(self.objs['A'], self.objs['A2']), 
+                         [('A1', 1), ('A11', 2), ('A12', 2)])
+        names = self.Names(self.objs['A11'], [self.objs['C'], self.objs['B1']], children_only=False)
+        self.assertEqual([n for n, _ in names], ['A11', 'A12', 'A2', 'A21', 'B'])
+        # leaving a stop object's hierarchy ends the traversal
+        names = self.Names(self.objs['A11'], self.objs['A'], children_only=False)
+        self.assertEqual([n for n, _ in names], ['A11', 'A12', 'A2', 'A21'])
+        # wrappers without GetGUID() are compared with ==
+        names = self.Names(WrapperMock(self.objs['A']), WrapperMock(self.objs['A2']))
+        self.assertEqual(names, [('A1', 1), ('A11', 2), ('A12', 2)])
+        names = self.Names(WrapperMock(self.objs['A2']), children_only=False)
+        self.assertEqual([n for n, _ in names], ['A2', 'A21', 'B', 'B1', 'C'])
+        names = self.Names(WrapperMock(self.objs['B']))
+        self.assertEqual(names, [('B1', 1)])
+
+    def testPrune(self):
+        prune = lambda op: op.GetName() in ('A1', 'B')
+        names = self.Names(self.objs['A'], children_only=False, prune=prune)
+        self.assertEqual([n for n, _ in names], ['A', 'A1', 'A2', 'A21', 'B', 'C'])
+
+    def testObjectIterator(self):
+        for start in self.objs.values():
+            for children_only in (True, False):
+                expected = self.Names(start, self.objs['B1'], children_only)
+                actual = [(op.GetName(), lvl) for op, lvl in 
+                          ObjectIterator(start, self.objs['B1'], children_only)]
+                self.assertEqual(actual, expected)
+
+    def testObjectHierarchy(self):
+        oh = ObjectHierarchy()
+        entries = dict((k, [op.GetName() for op in v]) for k, v in oh.entries.items())
+        self.assertEqual(entries, {
+            'A': ['A', 'A1', 'A2'], 'B': ['B', 'B1'], 'C': ['C'],
+            'A/A1': ['A11', 'A12'], 'A/A2': ['A21'],
+        })
+        self.assertEqual(oh.maxlvl, 2)
+        oh = ObjectHierarchy(self.objs['A1'], children_only=True)
+        self.assertEqual(oh.entries.keys(), ['A/A1'])
+        self.assertEqual(oh.Get('A/A1'), [self.objs['A11'], self.objs['A12']])
+
+    def testObjectKey(self):
+        a = self.objs['A']
+        self.assertEqual(ObjectKey(a), a.GetGUID())
+        self.assertNotEqual(ObjectKey(a), ObjectKey(a.GetClone()))
+        self.assertEqual(ObjectKey(OHMock), hash(OHMock))
+
+
+class RefreshTest(StubTestCase):
+
+    def Entries(self, oh):
+        return dict((k, [ObjectKey(op) for op in v]) for k, v in oh.entries.items())
+
+    def assertFresh(self, oh, *args, **kwargs):
+        fresh = ObjectHierarchy(*args, **kwargs)
+        self.assertEqual(self.Entries(oh), self.Entries(fresh))
+        self.assertEqual(oh.maxlvl, fresh.maxlvl)
+
+    def testRefresh(self):
+        objs = self.objs
+        oh = ObjectHierarchy()
+        # the first call only records the state
+        self.assertFalse(oh.Refresh())
+        self.assertFalse(oh.Refresh())
+        self.assertEqual(oh.Get('A/A1'), [objs['A11'], objs['A12']])
+        objs['A1'].SetName('X')
+        objs['A21'].InsertUnder(objs['B1'])
+        objs['C'].Remove()
+        new = BuildTree([('D', [('D1', [])])], doc=documents.GetActiveDocument())
+        new['D1'].InsertUnder(objs['A12'])
+        self.assertTrue(oh.Refresh())
+        self.assertFresh(oh)
+        self.assertEqual(oh.maxlvl, 3)
+        self.assertEqual(oh.Get('A/X'), [objs['A11'], objs['A12']])
+        self.assertEqual(oh.Get('A/A1'), [])
+        self.assertEqual(oh.Get('C'), [])
+        self.assertEqual(oh.Get('A/X/A12'), [new['D1']])
+        self.assertEqual(oh.Get('B/B1'), [objs['A21']])
+        self.assertEqual(oh.Get('D'), [new['D']])
+        objs['A1'].Remove()
+        self.assertTrue(oh.Refresh())
+        self.assertFresh(oh)
+        self.assertEqual(oh.maxlvl, 2)
+
+    def testRefreshOrder(self):
+        objs = self.objs
+        for name in ['A1', 'A2']:
+            objs[name].SetName('')
+        oh = ObjectHierarchy()
+        oh.Refresh()
+        objs['A1'].InsertAfter(objs['A2'])
+        oh.Refresh()
+        self.assertFresh(oh)
+        self.assertEqual(oh.entries['A/'], [objs['A21'], objs['A11'], objs['A12']])
+
+    def testRefreshFilter(self):
+        objs = self.objs
+        oh = ObjectHierarchy(filter_type=c4dstub.Onull)
+        oh.Refresh()
+        cube = c4dstub.BaseObject(c4dstub.Ocube)
+        cube.InsertUnder(objs['B'])
+        objs['B1'].InsertUnder(cube)
+        oh.Refresh()
+        self.assertFresh(oh, filter_type=c4dstub.Onull)
+        self.assertEqual(oh.Get('B/*'), [objs['B1']])
+
+    def testRefreshChildrenOnly(self):
+        objs = self.objs
+        oh = ObjectHierarchy(objs['A'], children_only=True)
+        oh.Refresh()
+        objs['B1'].InsertUnder(objs['A2'])
+        objs['A11'].SetName('Y')
+        self.assertTrue(oh.Refresh())
+        self.assertFresh(oh, objs['A'], children_only=True)
+        self.assertEqual(oh.Get('A/A2'), [objs['B1'], objs['A21']])
+        # moving the root rebuilds
+        objs['A'].InsertUnder(objs['C'])
+        self.assertTrue(oh.Refresh())
+        self.assertFresh(oh, objs['A'], children_only=True)
+        self.assertEqual(oh.Get('C/A/A1'), [objs['A11'], objs['A12']])
+
+    def testRefreshFirstCall(self):
+        objs = self.objs
+        oh = ObjectHierarchy(objs['A'], children_only=True)
+        objs['A21'].SetName('X')
+        self.assertFalse(oh.Refresh())
+        objs['A1'].SetName('Y')
+        oh = ObjectHierarchy()
+        objs['B1'].Remove()
+        self.assertTrue(oh.Refresh())
+        self.assertFresh(oh)
+    
+    def testRefreshDeleted(self):
+        objs = self.objs
+        oh = ObjectHierarchy()
+        oh.Refresh()
+        Free(objs['A1'])
+        Free(objs['C'])
+        self.assertTrue(oh.Refresh())
+        self.assertFresh(oh)
+        self.assertEqual(oh.Get('A'), [objs['A'], objs['A2']])
+        self.assertFalse(oh.Refresh())
+        # deleting the root empties the hierarchy
+        oh = ObjectHierarchy(objs['A'], children_only=True)
+        oh.Refresh()
+        Free(objs['A'])
+        self.assertTrue(oh.Refresh())
+        self.assertEqual(oh.entries, {})
+        self.assertEqual(oh.maxlvl, -1)
+        self.assertFalse(oh.Refresh())
+        oh = ObjectHierarchy(objs['B'])
+        Free(objs['B'])
+        self.assertTrue(oh.Refresh())
+        self.assertEqual(oh.entries, {})
+
+
+class SceneIndexTest(StubTestCase):
+
+    def setUp(self):
+        super(SceneIndexTest, self).setUp()
+        self.objs['A21'].SetName('A1')
+        self.objs['B1'].SetUniqueIP(7)
+
+    def testLookups(self):
+        objs = self.objs
+        index = SceneIndex()
+        self.assertEqual(len(index), 9)
+        self.assertTrue(objs['A12'] in index)
+        self.assertEqual(index.FindAll('A1'), [objs['A1'], objs['A21']])
+        self.assertEqual(index.FindAll(uip=7), [objs['B1']])
+        self.assertEqual(index.FindAll('B1', 7), [objs['B1']])
+        self.assertEqual(index.FindAll('B1', 8), [])
+        self.assertEqual(len(index.GetByType(c4dstub.Onull)), 9)
+        self.assertTrue(index.GetByGUID(ObjectKey(objs['C'])) is objs['C'])
+        self.assertEqual(index.GetDepth(objs['A12']), 2)
+        self.assertTrue(index.GetParent(objs['A12']) is objs['A1'])
+        self.assertTrue(index.GetParent(objs['B']) is None)
+        self.assertEqual(index.GetSubtree(objs['A1']), [objs['A1'], objs['A11'], objs['A12']])
+        self.assertTrue(index.Find('A1', objs['A2']) is objs['A21'])
+        self.assertTrue(index.Find('A1', objs['B']) is None)
+        self.assertRaises(ValueError, index.GetDepth, c4dstub.BaseObject(c4dstub.Onull))
+
+    def testFindObject(self):
+        objs = self.objs
+        index = SceneIndex()
+        for name in ['A1', 'A21', 'B1', 'X']:
+            self.assertTrue(FindObject(name, index=index) is FindObject(name))
+            self.assertEqual(FindObjects(name, index=index), FindObjects(name))
+        self.assertTrue(FindObject('A1', objs['A2'], index=index) is objs['A21'])
+        match = lambda op, name: op.GetName().startswith(name)
+        self.assertTrue(FindObject('X', objs['A'], match, 'A2', index=index) is objs['A2'])
+
+    def testInvalidation(self):
+        objs = self.objs
+        index = SceneIndex()
+        self.assertFalse(index.Refresh())
+        objs['C'].SetName('D')
+        self.assertTrue(index.IsStale())
+        self.assertTrue(index.Refresh())
+        self.assertTrue(index.Find('D') is objs['C'])
+        objs['B'].InsertAfter(objs['C'])
+        self.assertTrue(index.Refresh())
+        self.assertEqual(index.GetSubtree(objs['C'])[-1], objs['C'])
+        op = c4dstub.BaseObject(c4dstub.Onull)
+        op.SetName('E')
+        documents.GetActiveDocument().InsertObject(op)
+        self.assertTrue(index.Refresh())
+        index.Invalidate()
+        op.SetName('F')
+        self.assertTrue(index.Find('F') is op)
+
+
+class NameAllocatorTest(StubTestCase):
+
+    tree = [('Cube', [('Cube.12', [])]), ('Cube.1', []), ('Cubes.40', []), ('Null', [])]
+
+    def Add(self, name):
+        op = c4dstub.BaseObject(c4dstub.Onull)
+        op.SetName(name)
+        self.doc.InsertObject(op)
+        return op
+
+    def testNext(self):
+        names = NameAllocator(self.doc)
+        self.assertEqual(names.Next('Cube'), 'Cube.13')
+        self.assertEqual(names.Next('Cube'), 'Cube.14')
+        self.assertEqual(names.Next('Sphere'), 'Sphere')
+        self.assertEqual(names.Next('Sphere'), 'Sphere.1')
+        self.assertEqual(names.Next('Cubes'), 'Cubes.41')
+
+    def testExternalChanges(self):
+        names = NameAllocator(self.doc)
+        self.assertEqual(names.Next('Cube'), 'Cube.13')
+        self.Add('Cube.14')
+        self.Add('Cone')
+        self.assertEqual(names.Next('Cube'), 'Cube.15')
+        self.assertEqual(names.Next('Cone'), 'Cone.1')
+        names = NameAllocator(self.doc, verify=False)
+        self.Add('Cube.15')
+        # not looked up
+        self.assertEqual(names.Next('Cube'), 'Cube.15')
+
+    def testTemplate(self):
+        names = NameAllocator(self.doc, u'%(name)s_%(num)03d')
+        self.Add('Null_007')
+        names.Scan()
+        self.assertEqual(names.Next('Null'), 'Null_008')
+        self.assertEqual(names.Next('Cube'), 'Cube_001')
+        self.assertRaises(ValueError, NameAllocator, self.doc, u'%(name)s')
+
+    def testUniqueSequentialName(self):
+        self.assertEqual(UniqueSequentialName('Cube'), 'Cube.13')
+        self.Add('Cube.13')
+        self.assertEqual(UniqueSequentialName('Cube'), 'Cube.14')
+        self.assertEqual(UniqueSequentialName('Null', u'%(name)s %(num)s'), 'Null 1')
+        self.doc = documents.ResetDocuments()
+        self.assertEqual(UniqueSequentialName('Cube'), 'Cube')
+
+    def testUniqueSequentialNameUnchanged(self):
+        self.doc = documents.ResetDocuments()
+        self.Add('Cube')
+        self.assertEqual(UniqueSequentialName('Cube'), 'Cube.1')
+        self.assertEqual(UniqueSequentialName('Cube'), 'Cube.1')
+        names = NameAllocator(self.doc)
+        self.assertEqual(UniqueSequentialName('Cube', allocator=names), 'Cube.1')
+        self.assertEqual(UniqueSequentialName('Cube', allocator=names), 'Cube.2')
+
+
+class BatchCreateTest(StubTestCase):
+
+    tree = []
+
+    def Names(self, objs):
+        return [op.GetName() for op in objs]
+
+    def testBatch(self):
+        doc = self.doc
+        with BatchCreate():
+            objs = [CreateObject(c4dstub.Onull, 'Null.%d' % i) for i in range(100)]
+            self.assertTrue(doc.GetFirstObject() is None)
+            grp = InsertUnderNull(objs[:50], name='Group')
+            self.assertEqual(doc.undos, [])
+        self.assertEqual(c4dstub.calls['EventAdd'], 1)
+        self.assertEqual(c4dstub.calls['StopAllThreads'], 1)
+        self.assertEqual(doc._undodepth, 0)
+        self.assertEqual(len(doc.undos), 51)
+        self.assertTrue(doc.undos[-1][1] is grp)
+        self.assertEqual(grp.GetChildren(), objs[49::-1])
+        # same order as creating them one by one
+        self.assertEqual(self.Names(doc.GetObjects()), ['Group'] + self.Names(objs[:49:-1]))
+
+    def testNested(self):
+        doc = self.doc
+        target = CreateObject(c4dstub.Onull, 'Target')
+        c4dstub.ResetCalls()
+        with BatchCreate(undo=False):
+            first = CreateObject(c4dstub.Onull, 'First')
+            with BatchCreate():
+                objs = [CreateObject(c4dstub.Ocube, 'Cube') for _ in range(3)]
+                InsertUnderNull(objs, grp=target)
+            self.assertEqual(c4dstub.calls['EventAdd'], 0)
+            self.assertTrue(first.GetDocument() is None)
+        self.assertEqual(c4dstub.calls['EventAdd'], 1)
+        self.assertEqual(self.Names(doc.GetObjects()), ['First', 'Target'])
+        self.assertEqual(len(target.GetChildren()), 3)
+        # the outermost batch decides, so only Target's undo step
+        self.assertEqual(len(doc.undos), 1)
+
+    def testException(self):
+        def Create():
+            with BatchCreate():
+                CreateObject(c4dstub.Onull, 'Null')
+                raise ValueError
+        self.assertRaises(ValueError, Create)
+        self.assertEqual(self.Names(self.doc.GetObjects()), ['Null'])
+        self.assertEqual(c4dstub.calls['EventAdd'], 1)
+        CreateObject(c4dstub.Onull, 'After')
+        self.assertEqual(c4dstub.calls['EventAdd'], 2)
+
 
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']